@@ -1,7 +1,9 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
+from django.db.models import Count, Q, Sum
 from .models import CustomUserModel, UserProfiles
 from app_videos.models import VideoProgress
+from core.utils.paginator import EstimatedCountPaginator
 
 
 class VideoProgressInline(admin.TabularInline):
@@ -30,7 +32,10 @@ class CustomUserAdmin(UserAdmin):
 
     model = CustomUserModel
     list_display = ("username", "email", "role", "created_at", "last_login", "display_profiles", "profile_count")
-    list_filter = ("role", "is_staff", "is_active", "created_at")
+    list_filter = ("role", "is_staff", "is_active")
+    date_hierarchy = "created_at"
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     search_fields = ("username", "email", "first_name", "last_name")
     ordering = ("-created_at",)
     inlines = [UserProfileInline]
@@ -41,9 +46,13 @@ class CustomUserAdmin(UserAdmin):
         ("Permissions", {"fields": ("is_active", "is_staff", "is_superuser", "role", "groups", "user_permissions")}),
         ("Important dates", {"fields": ("last_login", "date_joined", "created_at", "updated_at")}),
         ("Additional Info", {"fields": ("user_infos",)}),
-        ("Email Verification", {"fields": ("is_email_verified", "email_verification_token")}),
+        ("Email Verification", {"fields": ("is_email_verified",)}),
     )
-    readonly_fields = ("created_at", "updated_at", "date_joined", "email_verification_token")
+    readonly_fields = ("created_at", "updated_at", "date_joined")
+
+    def get_queryset(self, request):
+        """Prefetch profiles and annotate their count for the list columns."""
+        return super().get_queryset(request).prefetch_related("profiles").annotate(num_profiles=Count("profiles"))
 
     def display_profiles(self, obj):
         """Shows up to 4 profiles as a string."""
@@ -58,7 +67,7 @@ class CustomUserAdmin(UserAdmin):
 
     def profile_count(self, obj):
         """Returns the number of profiles."""
-        count = obj.profiles.count()
+        count = obj.num_profiles if hasattr(obj, "num_profiles") else obj.profiles.count()
         return f"{count}/4"
 
     display_profiles.short_description = "Profiles"
@@ -84,15 +93,34 @@ class UserProfileAdmin(admin.ModelAdmin):
 
     fieldsets = (("Profile Info", {"fields": ("user", "profile_name", "is_kid", "preferred_language")}),)
 
+    def get_queryset(self, request):
+        """Annotate progress counts and watch time so list columns need no per-row queries."""
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("user")
+            .annotate(
+                started_count=Count("video_progress", filter=Q(video_progress__is_started=True)),
+                completed_count=Count("video_progress", filter=Q(video_progress__is_completed=True)),
+                watch_seconds=Sum("video_progress__current_time"),
+            )
+        )
+
     def video_progress_count(self, obj):
         """Number of videos with progress."""
-        started = obj.video_progress.filter(is_started=True).count()
-        completed = obj.video_progress.filter(is_completed=True).count()
+        if hasattr(obj, "started_count"):
+            started, completed = obj.started_count, obj.completed_count
+        else:
+            started = obj.video_progress.filter(is_started=True).count()
+            completed = obj.video_progress.filter(is_completed=True).count()
         return f"{started} started / {completed} completed"
 
     def watch_time_display(self, obj):
         """Total watch time in hours and minutes."""
-        total_seconds = sum(p.current_time for p in obj.video_progress.all())
+        if hasattr(obj, "watch_seconds"):
+            total_seconds = obj.watch_seconds or 0
+        else:
+            total_seconds = sum(p.current_time for p in obj.video_progress.all())
         hours = int(total_seconds // 3600)
         minutes = int((total_seconds % 3600) // 60)
 
@@ -0,0 +1,64 @@
+import base64
+from datetime import datetime
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class WatchHistoryPagination(BasePagination):
+    """Keyset pagination over (last_watched, id), newest first."""
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Returns one page of entries after the cursor position."""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            last_watched, pk = self.decode_cursor(cursor)
+            queryset = queryset.filter(Q(last_watched__lt=last_watched) | Q(last_watched=last_watched, id__lt=pk))
+
+        page = list(queryset.order_by("-last_watched", "-id")[: self.page_size + 1])
+        self.has_next = len(page) > self.page_size
+        page = page[: self.page_size]
+        self.last_item = page[-1] if page else None
+        return page
+
+    def get_page_size(self, request):
+        """Returns the requested page size, clamped to max_page_size."""
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def get_next_link(self):
+        """Returns the URL of the next page or None."""
+        if not self.has_next:
+            return None
+        cursor = self.encode_cursor(self.last_item)
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        """Paginated response."""
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def encode_cursor(self, item):
+        """Encodes the keyset position of an entry."""
+        value = f"{item.last_watched.isoformat()}|{item.id}"
+        return base64.urlsafe_b64encode(value.encode()).decode()
+
+    def decode_cursor(self, cursor):
+        """Decodes a cursor into (last_watched, id)."""
+        try:
+            last_watched, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+            return datetime.fromisoformat(last_watched), int(pk)
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
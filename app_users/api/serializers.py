@@ -1,19 +1,44 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
-from django.db.models import Sum
+from django.db.models import Count, Q, Sum
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from app_users.models import UserProfiles
-import uuid
+from app_users.tokens import is_well_formed
+from core.utils.serializers import DynamicFieldsMixin
 
 CustomUserModel = get_user_model()
 
+EMBEDDED_PROGRESS_LIMIT = 20
+
+
+def serialize_video_progress(progress, request=None):
+    """Returns the API representation of a progress entry with its video file."""
+    video_file = progress.video_file
+    thumbnail_url = None
+    if video_file.thumbnail:
+        thumbnail_url = request.build_absolute_uri(video_file.thumbnail.url) if request else video_file.thumbnail.url
+    return {
+        "video_file_id": str(video_file.id),
+        "title": video_file.display_title,
+        "thumbnail_url": thumbnail_url,
+        "current_time": progress.current_time,
+        "progress_percentage": round(progress.progress_percentage, 1),
+        "duration": video_file.duration,
+        "status": progress.status,
+        "is_completed": progress.is_completed,
+        "is_started": progress.is_started,
+        "completion_count": progress.completion_count,
+        "total_watch_time": progress.total_watch_time,
+        "first_watched": progress.first_watched,
+        "last_watched": progress.last_watched,
+        "last_completed": progress.last_completed,
+    }
+
+
+class UserProfileSummarySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    """Serializes lightweight profile data without progress or statistics."""
 
-class UserProfileSerializer(serializers.ModelSerializer):
-    """Serializes user profile data including video progress and statistics."""
-
-    video_progress = serializers.SerializerMethodField()
-    watch_statistics = serializers.SerializerMethodField()
     profile_picture_url = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
@@ -22,11 +47,8 @@ class UserProfileSerializer(serializers.ModelSerializer):
             "id",
             "profile_name",
             "preferred_language",
-            "profile_picture",
             "profile_picture_url",
             "is_kid",
-            "video_progress",
-            "watch_statistics",
         ]
 
     def get_profile_picture_url(self, obj):
@@ -39,64 +61,60 @@ class UserProfileSerializer(serializers.ModelSerializer):
                 return obj.profile_picture.url
         return None
 
+
+class UserProfileSerializer(UserProfileSummarySerializer):
+    """Serializes user profile data including video progress and statistics; ?fields= skips both."""
+
+    video_progress = serializers.SerializerMethodField()
+    watch_statistics = serializers.SerializerMethodField()
+
+    class Meta(UserProfileSummarySerializer.Meta):
+        fields = [
+            "id",
+            "profile_name",
+            "preferred_language",
+            "profile_picture",
+            "profile_picture_url",
+            "is_kid",
+            "video_progress",
+            "watch_statistics",
+        ]
+
     def get_video_progress(self, obj):
-        """Returns all video progress entries for the profile."""
+        """Returns the most recent video progress entries; the history endpoint pages through the rest."""
         if not isinstance(obj, UserProfiles):
             return []
-        progress_qs = obj.video_progress.select_related("video_file__video").order_by("-last_watched")
-
-        return [
-            {
-                "video_file_id": str(p.video_file.id),
-                "title": p.video_file.display_title,
-                "thumbnail_url": (
-                    self.context["request"].build_absolute_uri(p.video_file.thumbnail.url)
-                    if p.video_file.thumbnail and self.context.get("request")
-                    else (p.video_file.thumbnail.url if p.video_file.thumbnail else None)
-                ),
-                "current_time": p.current_time,
-                "progress_percentage": round(p.progress_percentage, 1),
-                "duration": p.video_file.duration,
-                "status": p.status,
-                "is_completed": p.is_completed,
-                "is_started": p.is_started,
-                "completion_count": p.completion_count,
-                "total_watch_time": p.total_watch_time,
-                "first_watched": p.first_watched,
-                "last_watched": p.last_watched,
-                "last_completed": p.last_completed,
-            }
-            for p in progress_qs
+        progress_qs = obj.video_progress.select_related("video_file__video").order_by("-last_watched", "-id")[
+            :EMBEDDED_PROGRESS_LIMIT
         ]
 
+        return [serialize_video_progress(p, self.context.get("request")) for p in progress_qs]
+
     def get_watch_statistics(self, obj):
         """Aggregates watch statistics from video progress."""
         if not isinstance(obj, UserProfiles):
             return []
-        progress_qs = obj.video_progress.all()
-        started_time = progress_qs.filter(is_started=True).aggregate(total=Sum("current_time"))["total"] or 0
-        completed_time = progress_qs.aggregate(total=Sum("total_watch_time"))["total"] or 0
-        total_watch_time = started_time + completed_time
+        stats = obj.video_progress.aggregate(
+            started=Count("id", filter=Q(is_started=True)),
+            completed=Count("id", filter=Q(completion_count__gt=0)),
+            completions=Sum("completion_count"),
+            started_time=Sum("current_time", filter=Q(is_started=True)),
+            completed_time=Sum("total_watch_time"),
+        )
+        total_watch_time = (stats["started_time"] or 0) + (stats["completed_time"] or 0)
 
         return {
-            "total_videos_started": progress_qs.filter(is_started=True).count(),
-            "total_videos_completed": progress_qs.filter(completion_count__gt=0).count(),
-            "total_completions": sum(p.completion_count for p in progress_qs),
+            "total_videos_started": stats["started"],
+            "total_videos_completed": stats["completed"],
+            "total_completions": stats["completions"] or 0,
             "total_watch_time": round(total_watch_time, 1),
-            "unique_videos_watched": progress_qs.filter(is_started=True).count(),
-            "completion_rate": round(
-                (
-                    progress_qs.filter(completion_count__gt=0).count()
-                    / max(progress_qs.filter(is_started=True).count(), 1)
-                )
-                * 100,
-                1,
-            ),
+            "unique_videos_watched": stats["started"],
+            "completion_rate": round((stats["completed"] / max(stats["started"], 1)) * 100, 1),
         }
 
 
-class CustomUserSerializer(serializers.ModelSerializer):
-    """Serializes custom user data and related profiles."""
+class CustomUserSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    """Serializes custom user data and related profiles; ?fields=profiles.id selects profile fields."""
 
     profiles = UserProfileSerializer(many=True, read_only=True)
 
@@ -183,17 +201,22 @@ class MyTokenObtainPairSerializer(TokenObtainPairSerializer):
         return token
 
     def validate(self, attrs):
-        """Adds user data to token response."""
+        """Adds user data to token response; ?profiles=summary returns slim profiles."""
         data = super().validate(attrs)
 
         context = self.context if hasattr(self, "context") else {}
+        request = context.get("request")
+        if request is not None and request.query_params.get("profiles") == "summary":
+            profile_serializer_class = UserProfileSummarySerializer
+        else:
+            profile_serializer_class = UserProfileSerializer
 
         data["user"] = {
             "id": self.user.id,
             "username": self.user.username,
             "email": self.user.email,
             "role": self.user.role,
-            "profiles": UserProfileSerializer(self.user.profiles.all(), many=True, context=context).data,
+            "profiles": profile_serializer_class(self.user.profiles.all(), many=True, context=context).data,
             "first_name": self.user.first_name,
             "last_name": self.user.last_name,
         }
@@ -223,8 +246,6 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
         if attrs["new_password"] != attrs["new_password2"]:
             raise serializers.ValidationError({"non_field_errors": ["Password fields didn't match."]})
 
-        try:
-            uuid.UUID(attrs["token"])
-        except ValueError:
+        if not is_well_formed(attrs["token"]):
             raise serializers.ValidationError({"token": ["Invalid token format."]})
         return attrs
@@ -10,6 +10,8 @@ from app_users.api.views import (
     PasswordResetRequestView,
     PasswordResetConfirmView,
     VideoProgressUpdateView,
+    ContinueWatchingView,
+    WatchHistoryView,
 )
 
 urlpatterns = [
@@ -27,4 +29,10 @@ urlpatterns = [
         VideoProgressUpdateView.as_view(),
         name="update_video_progress",
     ),
+    path(
+        "me/profiles/<uuid:profile_id>/continue-watching/",
+        ContinueWatchingView.as_view(),
+        name="continue_watching",
+    ),
+    path("me/profiles/<uuid:profile_id>/history/", WatchHistoryView.as_view(), name="watch_history"),
 ]
@@ -1,8 +1,5 @@
-import uuid
-from datetime import timedelta
-from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.utils import timezone
+from django.core import signing
 from django.utils.translation import get_language_from_request
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
@@ -20,10 +17,14 @@ from app_users.api.serializers import (
     UserProfileSerializer,
     PasswordResetRequestSerializer,
     PasswordResetConfirmSerializer,
+    serialize_video_progress,
 )
+from app_users.api.pagination import WatchHistoryPagination
 from app_users.models import UserProfiles
 from app_users.utils import send_verification_email, send_password_reset_email
-from app_videos.models import VideoFile, VideoProgress
+from app_users.tokens import email_verification_token, password_reset_token
+from app_videos.continue_watching import CONTINUE_WATCHING_MAX_ENTRIES, get_continue_watching
+from app_videos.models import VideoFile, VideoProgress, VideoProgressQuerySet
 
 CustomUserModel = get_user_model()
 
@@ -55,9 +56,8 @@ class EmailVerifyView(APIView):
 
     def get(self, request, token):
         try:
-            token_uuid = uuid.UUID(token)
-            user = CustomUserModel.objects.get(email_verification_token=token_uuid, is_active=False)
-        except (ValueError, CustomUserModel.DoesNotExist, TypeError):
+            user = email_verification_token.get_user(token)
+        except (signing.BadSignature, CustomUserModel.DoesNotExist):
             return Response(
                 {"detail": "Invalid or expired verification token."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -65,7 +65,6 @@ class EmailVerifyView(APIView):
 
         user.is_active = True
         user.is_email_verified = True
-        user.email_verification_token = None
         user.save()
 
         if not UserProfiles.objects.filter(user=user).exists():
@@ -94,8 +93,13 @@ class UserDetailView(generics.RetrieveUpdateAPIView):
     permission_classes = (permissions.IsAuthenticated,)
 
     def get_object(self):
-        """Returns current user object."""
-        return self.request.user
+        """
+        Returns current user object. Writes load it from the database, as the authenticated
+        user may be a cached copy that would overwrite newer changes on save().
+        """
+        if self.request.method in permissions.SAFE_METHODS:
+            return self.request.user
+        return get_object_or_404(CustomUserModel, pk=self.request.user.pk)
 
 
 class UserProfileListCreateView(generics.ListCreateAPIView):
@@ -171,9 +175,6 @@ class PasswordResetRequestView(generics.GenericAPIView):
 
         try:
             user = CustomUserModel.objects.get(email=email, is_active=True)
-            user.password_reset_token = uuid.uuid4()
-            user.password_reset_token_created_at = timezone.now()
-            user.save(update_fields=["password_reset_token", "password_reset_token_created_at"])
             send_password_reset_email(user, request)
         except CustomUserModel.DoesNotExist:
             pass
@@ -195,25 +196,17 @@ class PasswordResetConfirmView(generics.GenericAPIView):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        token_uuid_str = serializer.validated_data["token"]
+        token = serializer.validated_data["token"]
         new_password = serializer.validated_data["new_password"]
 
         try:
-            token_uuid = uuid.UUID(token_uuid_str)
-            user = CustomUserModel.objects.get(password_reset_token=token_uuid)
-        except (ValueError, CustomUserModel.DoesNotExist, TypeError):
-            return Response({"detail": "Invalid or expired password reset token."}, status=status.HTTP_400_BAD_REQUEST)
-
-        timeout_hours = getattr(settings, "PASSWORD_RESET_TIMEOUT_HOURS", 1)
-        if user.password_reset_token_created_at < timezone.now() - timedelta(hours=timeout_hours):
-            user.password_reset_token = None
-            user.password_reset_token_created_at = None
-            user.save(update_fields=["password_reset_token", "password_reset_token_created_at"])
+            user = password_reset_token.get_user(token)
+        except signing.SignatureExpired:
             return Response({"detail": "Password reset token has expired."}, status=status.HTTP_400_BAD_REQUEST)
+        except (signing.BadSignature, CustomUserModel.DoesNotExist):
+            return Response({"detail": "Invalid or expired password reset token."}, status=status.HTTP_400_BAD_REQUEST)
 
         user.set_password(new_password)
-        user.password_reset_token = None
-        user.password_reset_token_created_at = None
         user.save()
 
         return Response({"message": "Password has been reset successfully."}, status=status.HTTP_200_OK)
@@ -264,3 +257,48 @@ class VideoProgressUpdateView(APIView):
 
         except VideoProgress.DoesNotExist:
             raise ValidationError({"detail": "No progress found for this video."})
+
+
+class ContinueWatchingView(APIView):
+    """List the most recently watched, unfinished videos for a profile."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, profile_id):
+        """Returns up to `limit` in-progress entries, most recent first."""
+        profile = get_object_or_404(UserProfiles, id=profile_id, user=request.user)
+
+        try:
+            limit = int(request.query_params.get("limit", 10))
+        except (ValueError, TypeError):
+            raise ValidationError({"limit": "Must be a valid number."})
+
+        if limit < 1:
+            raise ValidationError({"limit": "Must be at least 1."})
+
+        entries = get_continue_watching(profile.id, min(limit, CONTINUE_WATCHING_MAX_ENTRIES))
+        return Response([serialize_video_progress(p, request) for p in entries], status=status.HTTP_200_OK)
+
+
+class WatchHistoryView(generics.GenericAPIView):
+    """Paginated watch history for a profile, filterable by status."""
+
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = WatchHistoryPagination
+
+    def get_queryset(self):
+        """Progress entries of the profile, optionally narrowed to one status."""
+        profile = get_object_or_404(UserProfiles, id=self.kwargs["profile_id"], user=self.request.user)
+        queryset = VideoProgress.objects.filter(profile=profile).select_related("video_file__video")
+
+        status_filter = self.request.query_params.get("status")
+        if status_filter:
+            if status_filter not in VideoProgressQuerySet.STATUS_FILTERS:
+                raise ValidationError({"status": f"Must be one of: {', '.join(VideoProgressQuerySet.STATUS_FILTERS)}."})
+            queryset = queryset.with_status(status_filter)
+        return queryset
+
+    def get(self, request, profile_id):
+        """Returns one page of history entries, most recently watched first."""
+        page = self.paginate_queryset(self.get_queryset())
+        return self.get_paginated_response([serialize_video_progress(p, request) for p in page])
@@ -5,3 +5,6 @@ class AppUsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "app_users"
     verbose_name = "User Management"
+
+    def ready(self):
+        import app_users.signals
@@ -0,0 +1,84 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from redis.exceptions import RedisError
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+USER_CACHE_KEY = "auth:user:v2:{}"  # v2: field values instead of pickled users
+# Only what authentication, permissions and the own-user endpoint read; never the password hash.
+# Other fields are deferred and loaded from the database if accessed.
+CACHED_USER_FIELDS = (
+    "id",
+    "username",
+    "email",
+    "first_name",
+    "last_name",
+    "role",
+    "user_infos",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+    "is_email_verified",
+)
+
+
+def get_cached_user(user_id):
+    """Return the cached user for an id from the in-process or shared cache."""
+    key = USER_CACHE_KEY.format(user_id)
+    values = caches["local"].get(key)
+    if values is None:
+        try:
+            values = caches["default"].get(key)
+        except RedisError:
+            return None
+        if values is None:
+            return None
+        caches["local"].set(key, values, settings.AUTH_USER_LOCAL_CACHE_TIMEOUT)
+    return get_user_model().from_db("default", _cached_field_names(), values)
+
+
+def cache_user(user):
+    """Store the user's CACHED_USER_FIELDS in both cache tiers."""
+    key = USER_CACHE_KEY.format(user.pk)
+    values = [getattr(user, name) for name in _cached_field_names()]
+    caches["local"].set(key, values, settings.AUTH_USER_LOCAL_CACHE_TIMEOUT)
+    try:
+        caches["default"].set(key, values, settings.AUTH_USER_CACHE_TIMEOUT)
+    except RedisError:
+        pass
+
+
+def _cached_field_names():
+    """CACHED_USER_FIELDS in model field order, as Model.from_db expects."""
+    return [f.attname for f in get_user_model()._meta.concrete_fields if f.attname in CACHED_USER_FIELDS]
+
+
+def invalidate_cached_user(user_id):
+    """Drop a user from both cache tiers."""
+    key = USER_CACHE_KEY.format(user_id)
+    caches["local"].delete(key)
+    try:
+        caches["default"].delete(key)
+    except RedisError:
+        pass
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that resolves the user from a short-lived in-process cache
+    backed by the shared cache, falling back to the database on a miss.
+    """
+
+    def get_user(self, validated_token):
+        user = get_cached_user(validated_token.get(api_settings.USER_ID_CLAIM))
+        if user is None:
+            user = super().get_user(validated_token)
+            cache_user(user)
+            return user
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
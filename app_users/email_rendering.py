@@ -0,0 +1,40 @@
+import re
+from functools import lru_cache
+from django.template.loader import render_to_string
+from django.utils.html import conditional_escape
+
+EMAIL_TEMPLATES = {
+    "verify_email": {"subject": "Confirm your email", "variables": ("username", "verification_link")},
+    "password_reset": {"subject": "Reset your Password", "variables": ("url",)},
+}
+
+PLACEHOLDER_PATTERN = re.compile(r"\x00(\w+)\x00")
+
+
+class PrecompiledEmailTemplate:
+    """Template rendered once with placeholders; only variables are filled per message."""
+
+    def __init__(self, template_name, variables):
+        placeholders = {name: f"\x00{name}\x00" for name in variables}
+        rendered = render_to_string(template_name, placeholders)
+        self.parts = PLACEHOLDER_PATTERN.split(rendered)
+
+    def render(self, context):
+        """Join static parts with escaped values, matching Django's autoescaping."""
+        return "".join(
+            conditional_escape(context.get(part, "")) if i % 2 else part for i, part in enumerate(self.parts)
+        )
+
+
+@lru_cache(maxsize=None)
+def get_email_template(template_name, variables):
+    """Return the cached precompiled template for a template path."""
+    return PrecompiledEmailTemplate(template_name, variables)
+
+
+def render_email(template, context):
+    """Return subject, text and HTML body for a queued email."""
+    config = EMAIL_TEMPLATES[template]
+    text_content = get_email_template(f"emails/{template}.txt", config["variables"]).render(context)
+    html_content = get_email_template(f"emails/{template}.html", config["variables"]).render(context)
+    return config["subject"], text_content, html_content
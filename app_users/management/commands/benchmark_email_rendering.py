@@ -0,0 +1,36 @@
+import time
+from django.core.management.base import BaseCommand
+from django.template.loader import render_to_string
+from app_users.email_rendering import render_email
+
+
+class Command(BaseCommand):
+    help = "Benchmark email rendering throughput (messages per second)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=5000, help="Number of messages to render per run")
+
+    def handle(self, *args, **options):
+        count = options["count"]
+        contexts = [
+            {
+                "username": f"user{i}@example.com",
+                "verification_link": f"http://localhost:4200/verify?token={i:032x}",
+            }
+            for i in range(count)
+        ]
+
+        def render_with_loader(context):
+            render_to_string("emails/verify_email.txt", context)
+            render_to_string("emails/verify_email.html", context)
+
+        def render_precompiled(context):
+            render_email("verify_email", context)
+
+        for label, render in (("template loader", render_with_loader), ("precompiled", render_precompiled)):
+            render(contexts[0])
+            start = time.perf_counter()
+            for context in contexts:
+                render(context)
+            elapsed = time.perf_counter() - start
+            self.stdout.write(f"{label:>16}: {count / elapsed:10.0f} messages/s ({elapsed:.3f}s for {count})")
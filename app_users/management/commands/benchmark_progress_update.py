@@ -0,0 +1,83 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from rest_framework.test import APIRequestFactory, force_authenticate
+from app_users.api.views import VideoProgressUpdateView
+from app_users.models import CustomUserModel, UserProfiles
+from app_videos.models import Video, VideoFile
+
+CONNECTION_MODES = ("none", "persistent", "pool")
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark VideoProgressUpdateView latency per DB_CONNECTION_MODE; "
+        "each mode runs in its own process configured through the environment"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=200, help="Number of progress updates per run")
+        parser.add_argument(
+            "--modes",
+            nargs="+",
+            choices=CONNECTION_MODES,
+            help="Connection modes to compare (default: none and the configured mode)",
+        )
+        parser.add_argument("--in-process", action="store_true", help="Time the current process's mode only")
+
+    def handle(self, *args, **options):
+        if options["in_process"]:
+            self.stdout.write(self._benchmark(options["count"]))
+            return
+
+        modes = options["modes"] or list(dict.fromkeys(["none", settings.DB_CONNECTION_MODE]))
+        for mode in modes:
+            result = subprocess.run(
+                [sys.executable, "-m", "django", "benchmark_progress_update", "--in-process"]
+                + ["--count", str(options["count"])],
+                cwd=settings.BASE_DIR,
+                env={**os.environ, "DB_CONNECTION_MODE": mode},
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode:
+                raise CommandError(f"Benchmark for mode {mode} failed:\n{result.stderr}")
+            self.stdout.write(result.stdout.rstrip())
+
+    def _benchmark(self, count):
+        """Time `count` progress updates through the request lifecycle's connection handling."""
+        suffix = uuid.uuid4().hex[:8]
+        user = CustomUserModel.objects.create_user(
+            username=f"bench-{suffix}", email=f"bench-{suffix}@example.com", password=uuid.uuid4().hex
+        )
+        profile = UserProfiles.objects.create(user=user, profile_name="Benchmark")
+        video = Video.objects.create(title=f"Benchmark {suffix}", slug=f"benchmark-{suffix}")
+        video_file = VideoFile.objects.create(video=video, duration=3600, language="en")
+        try:
+            view = VideoProgressUpdateView.as_view()
+            factory = APIRequestFactory()
+
+            def update(i):
+                request = factory.post("/", {"current_time": i}, format="json")
+                force_authenticate(request, user=user)
+                close_old_connections()
+                start = time.perf_counter()
+                view(request, profile_id=profile.id, video_file_id=video_file.id)
+                close_old_connections()
+                return time.perf_counter() - start
+
+            update(0)
+            timings = [update(i) for i in range(1, count + 1)]
+            return (
+                f"{settings.DB_CONNECTION_MODE:>10}: mean {statistics.mean(timings) * 1000:7.2f} ms, "
+                f"p95 {statistics.quantiles(timings, n=20)[-1] * 1000:7.2f} ms ({count} requests)"
+            )
+        finally:
+            user.delete()
+            video.delete()
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.1 on 2026-10-19 06:04
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_users", "0005_alter_userprofiles_preferred_language"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="customusermodel",
+            name="email_verification_token",
+        ),
+        migrations.RemoveField(
+            model_name="customusermodel",
+            name="password_reset_token",
+        ),
+        migrations.RemoveField(
+            model_name="customusermodel",
+            name="password_reset_token_created_at",
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-19 06:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_users", "0006_remove_customusermodel_email_verification_token_and_more"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="customusermodel",
+            index=models.Index(fields=["-created_at"], name="user_created_at_idx"),
+        ),
+    ]
@@ -21,14 +21,12 @@ class CustomUserModel(AbstractUser):
     role = models.CharField(choices=ROLE_CHOICES, max_length=50, default="user", verbose_name="Role")
     user_infos = models.TextField(blank=True, null=True, verbose_name="User info notes")
     is_email_verified = models.BooleanField(default=False, verbose_name="Email verified")
-    email_verification_token = models.UUIDField(null=True, blank=True, editable=False, default=None)
-    password_reset_token = models.UUIDField(null=True, blank=True, editable=False, default=None)
-    password_reset_token_created_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         verbose_name = "User"
         verbose_name_plural = "Users"
         ordering = ["-created_at"]
+        indexes = [models.Index(fields=["-created_at"], name="user_created_at_idx")]
 
     def __str__(self):
         return self.username
@@ -0,0 +1,18 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from app_users.authentication import invalidate_cached_user
+
+CustomUserModel = get_user_model()
+
+
+@receiver([post_save, post_delete], sender=CustomUserModel)
+def user_changed(sender, instance, **kwargs):
+    """
+    Signal: drop cached auth user on save, deactivation, password change or delete.
+    Dropped again after commit, as a concurrent request may re-cache the old row before the change commits.
+    """
+    user_id = instance.pk
+    invalidate_cached_user(user_id)
+    transaction.on_commit(lambda: invalidate_cached_user(user_id), robust=True)
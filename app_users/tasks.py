@@ -0,0 +1,86 @@
+import json
+import smtplib
+from datetime import timedelta
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from core.utils.queues import get_registered_queue, get_stage_queue_name
+from app_users.email_rendering import render_email
+
+EMAIL_MAX_RETRIES = 5
+EMAIL_OUTBOX_KEY = "emails:outbox"
+EMAIL_DRAIN_KEY = "emails:outbox:drain-pending"
+EMAIL_DRAIN_PENDING_TIMEOUT = 600
+EMAIL_BATCH_SIZE = 100
+
+
+def build_email_message(payload, connection=None):
+    """Render a queued email payload into a multipart message."""
+    subject, text_content, html_content = render_email(payload["template"], payload["context"])
+
+    msg = EmailMultiAlternatives(
+        subject=subject,
+        body=text_content,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[payload["to"]],
+        connection=connection,
+    )
+    msg.attach_alternative(html_content, "text/html")
+    return msg
+
+
+def buffer_email(payload):
+    """
+    Appends an email payload to the Redis outbox. A drain job is enqueued only when none is pending,
+    so emails arriving while it waits are sent by the same job.
+    """
+    queue = get_registered_queue(get_stage_queue_name("email"))
+    with queue.connection.pipeline() as pipe:
+        pipe.rpush(EMAIL_OUTBOX_KEY, json.dumps(payload))
+        pipe.set(EMAIL_DRAIN_KEY, 1, nx=True, ex=EMAIL_DRAIN_PENDING_TIMEOUT)
+        _, drain_needed = pipe.execute()
+    if drain_needed:
+        queue.enqueue(drain_email_outbox)
+
+
+def drain_email_outbox():
+    """Send all buffered emails in batches of EMAIL_BATCH_SIZE, each over one SMTP connection."""
+    connection = get_registered_queue(get_stage_queue_name("email")).connection
+    # Cleared before reading, so an email buffered from now on enqueues a new drain job
+    connection.delete(EMAIL_DRAIN_KEY)
+    while True:
+        with connection.pipeline() as pipe:
+            pipe.lrange(EMAIL_OUTBOX_KEY, 0, EMAIL_BATCH_SIZE - 1)
+            pipe.ltrim(EMAIL_OUTBOX_KEY, EMAIL_BATCH_SIZE, -1)
+            batch, _ = pipe.execute()
+        if not batch:
+            return
+        send_queued_emails([json.loads(item) for item in batch])
+
+
+def send_queued_emails(payloads, retry_count=0):
+    """Send a batch of queued emails over one SMTP connection, retrying failures."""
+    failed = []
+    try:
+        with get_connection() as connection:
+            for payload in payloads:
+                try:
+                    connection.send_messages([build_email_message(payload, connection)])
+                except (smtplib.SMTPException, OSError) as e:
+                    print(f"Error sending {payload['template']} email to {payload['to']}: {e}")
+                    failed.append(payload)
+    except (smtplib.SMTPException, OSError) as e:
+        print(f"Error opening SMTP connection: {e}")
+        failed = list(payloads)
+
+    if failed:
+        _retry_failed_emails(failed, retry_count)
+
+
+def _retry_failed_emails(payloads, retry_count):
+    """Enqueue a delayed retry with exponential backoff."""
+    if retry_count >= EMAIL_MAX_RETRIES:
+        print(f"Giving up on {len(payloads)} email(s) after {EMAIL_MAX_RETRIES} retries.")
+        return
+    queue = get_registered_queue(get_stage_queue_name("email"))
+    delay = min(30 * (2**retry_count), 900)
+    queue.enqueue_in(timedelta(seconds=delay), send_queued_emails, payloads, retry_count + 1)
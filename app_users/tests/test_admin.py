@@ -1,5 +1,8 @@
 from django.test import TestCase
 from django.contrib.admin.sites import AdminSite
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 from app_users.admin import CustomUserAdmin, UserProfileAdmin
 from app_users.models import CustomUserModel, UserProfiles
 from app_videos.models import Video, VideoFile, VideoProgress
@@ -119,3 +122,41 @@ class TestVideoProgressAdmin(TestCase):
         user = CustomUserModel(username="testuser")
         profile = UserProfiles(user=user, profile_name="TestProfile")
         self.assertEqual(str(profile), "testuser - TestProfile")
+
+
+class TestChangelistQueryCount(TestCase):
+    def setUp(self):
+        self.superuser = CustomUserModel.objects.create_superuser(
+            username="admin", email="admin@example.com", password="pw"
+        )
+        self.client.force_login(self.superuser)
+        self.video = Video.objects.create(title="Testvideo", description="desc")
+        self.video_file = VideoFile.objects.create(
+            video=self.video, duration=100, original_file="test.mp4", language="en", is_ready=True
+        )
+        self.users = 0
+
+    def _add_users(self, count):
+        for _ in range(count):
+            self.users += 1
+            user = CustomUserModel.objects.create(username=f"user{self.users}", email=f"user{self.users}@example.com")
+            for name in ("Max", "Anna"):
+                profile = UserProfiles.objects.create(user=user, profile_name=name)
+                VideoProgress.objects.create(profile=profile, video_file=self.video_file, current_time=20)
+
+    def _count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context)
+
+    def test_changelists_use_constant_queries(self):
+        urls = [
+            reverse("admin:app_users_customusermodel_changelist"),
+            reverse("admin:app_users_userprofiles_changelist"),
+        ]
+        self._add_users(3)
+        baseline = {url: self._count_queries(url) for url in urls}
+        self._add_users(6)
+        for url in urls:
+            self.assertEqual(self._count_queries(url), baseline[url], url)
@@ -0,0 +1,84 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+from app_users.authentication import cache_user, get_cached_user, USER_CACHE_KEY
+
+CustomUserModel = get_user_model()
+
+
+class CachedJWTAuthenticationTests(APITestCase):
+    def setUp(self):
+        caches["default"].clear()
+        caches["local"].clear()
+        self.user = CustomUserModel.objects.create_user(
+            username="authuser", email="auth@example.com", password="pw", is_active=True
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+        self.url = reverse("user_detail")
+
+    def user_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        table = CustomUserModel._meta.db_table
+        return [q for q in ctx.captured_queries if f'FROM "{table}"' in q["sql"]]
+
+    def test_second_request_skips_user_query(self):
+        self.assertEqual(len(self.user_queries(self.url)), 1)
+        self.assertEqual(len(self.user_queries(self.url)), 0)
+
+    def test_shared_cache_refills_local_cache(self):
+        self.client.get(self.url)
+        caches["local"].clear()
+        self.assertEqual(len(self.user_queries(self.url)), 0)
+        self.assertIsNotNone(caches["local"].get(USER_CACHE_KEY.format(self.user.pk)))
+
+    def test_save_invalidates_cache(self):
+        self.client.get(self.url)
+        self.user.first_name = "Changed"
+        self.user.save()
+        self.assertIsNone(get_cached_user(self.user.pk))
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["first_name"], "Changed")
+
+    def test_deactivated_user_is_rejected(self):
+        self.client.get(self.url)
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_password_change_invalidates_cache(self):
+        self.client.get(self.url)
+        self.user.set_password("new-password")
+        self.user.save()
+        self.assertIsNone(get_cached_user(self.user.pk))
+
+    def test_read_only_endpoint_trusts_token_claims(self):
+        url = reverse("genre_video_count")
+        self.assertEqual(len(self.user_queries(url)), 0)
+
+    def test_stale_copy_cached_before_commit_is_dropped_after_commit(self):
+        stale = CustomUserModel.objects.get(pk=self.user.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+            cache_user(stale)
+            self.assertTrue(get_cached_user(self.user.pk).is_active)
+        self.assertIsNone(get_cached_user(self.user.pk))
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_cache_holds_no_password_hash(self):
+        self.client.get(self.url)
+        for alias in ("local", "default"):
+            cached = caches[alias].get(USER_CACHE_KEY.format(self.user.pk))
+            self.assertNotIn(self.user.password, cached)
+        user = get_cached_user(self.user.pk)
+        self.assertEqual((user.pk, user.username, user.email), (self.user.pk, "authuser", "auth@example.com"))
+        self.assertIn("password", user.get_deferred_fields())
@@ -0,0 +1,34 @@
+from django.core.management import call_command
+from django.template.loader import render_to_string
+from django.test import TestCase
+from io import StringIO
+from unittest.mock import patch
+from app_users.email_rendering import render_email, get_email_template
+
+
+class EmailRenderingTestCase(TestCase):
+    def test_verify_email_matches_template_loader(self):
+        context = {"username": "<b>Tom & Jerry</b>", "verification_link": "http://localhost/verify?token=a&b=1"}
+        subject, text_content, html_content = render_email("verify_email", context)
+        self.assertEqual(subject, "Confirm your email")
+        self.assertEqual(text_content, render_to_string("emails/verify_email.txt", context))
+        self.assertEqual(html_content, render_to_string("emails/verify_email.html", context))
+
+    def test_password_reset_matches_template_loader(self):
+        context = {"url": "http://localhost/password/reset?reset=true&token=abc"}
+        subject, text_content, html_content = render_email("password_reset", context)
+        self.assertEqual(subject, "Reset your Password")
+        self.assertEqual(text_content, render_to_string("emails/password_reset.txt", context))
+        self.assertEqual(html_content, render_to_string("emails/password_reset.html", context))
+
+    def test_templates_are_compiled_once(self):
+        get_email_template.cache_clear()
+        with patch("app_users.email_rendering.render_to_string", wraps=render_to_string) as render_mock:
+            render_email("password_reset", {"url": "a"})
+            render_email("password_reset", {"url": "b"})
+        self.assertEqual(render_mock.call_count, 2)
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command("benchmark_email_rendering", "--count", "10", stdout=out)
+        self.assertIn("messages/s", out.getvalue())
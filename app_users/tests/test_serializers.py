@@ -6,7 +6,7 @@ from app_users.api.serializers import (
     PasswordResetConfirmSerializer,
 )
 from app_users.models import UserProfiles, CustomUserModel
-import uuid
+from app_users.tokens import password_reset_token
 
 
 class TestUserProfileSerializer(TestCase):
@@ -55,7 +55,8 @@ class TestRegisterSerializer(TestCase):
 class TestPasswordResetConfirmSerializer(TestCase):
     def test_validate_token_format(self):
         serializer = PasswordResetConfirmSerializer()
-        valid_token = str(uuid.uuid4())
+        user = CustomUserModel.objects.create(username="tokenuser", email="token@example.com")
+        valid_token = password_reset_token.make_token(user)
         data = {"token": valid_token, "new_password": "Test1234!", "new_password2": "Test1234!"}
         result = serializer.validate(data)
         self.assertEqual(result["token"], valid_token)
@@ -73,7 +74,7 @@ class TestPasswordResetConfirmSerializer(TestCase):
 
     def test_password_reset_confirm_serializer_invalid_new_password(self):
         data = {
-            "token": "123e4567-e89b-12d3-a456-426614174000",  # gültiger UUID
+            "token": "eyJ1aWQiOiIxIn0:1tXyZa:c2lnbmF0dXJl",
             "new_password": "123",  # absichtlich ungültig
             "new_password2": "123",
         }
@@ -0,0 +1,119 @@
+import json
+import smtplib
+from django.core import mail
+from django.test import TestCase
+from unittest.mock import patch, MagicMock
+from app_users.tasks import (
+    EMAIL_BATCH_SIZE,
+    EMAIL_DRAIN_KEY,
+    EMAIL_OUTBOX_KEY,
+    buffer_email,
+    drain_email_outbox,
+    send_queued_emails,
+    build_email_message,
+    _retry_failed_emails,
+)
+
+
+def make_payload(to="test@example.com"):
+    return {
+        "template": "verify_email",
+        "to": to,
+        "context": {"username": "tester", "verification_link": "http://localhost/verify?token=abc"},
+    }
+
+
+class EmailTasksTestCase(TestCase):
+    def setUp(self):
+        self.print_patcher = patch("builtins.print")
+        self.mock_print = self.print_patcher.start()
+
+    def tearDown(self):
+        self.print_patcher.stop()
+
+    def test_build_email_message(self):
+        msg = build_email_message(make_payload())
+        self.assertEqual(msg.subject, "Confirm your email")
+        self.assertEqual(msg.to, ["test@example.com"])
+        self.assertIn("tester", msg.body)
+        self.assertEqual(msg.alternatives[0][1], "text/html")
+
+    def test_send_queued_emails_batch(self):
+        send_queued_emails([make_payload("a@example.com"), make_payload("b@example.com")])
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(mail.outbox[1].to, ["b@example.com"])
+
+    def test_send_queued_emails_reuses_one_connection(self):
+        connection = MagicMock()
+        connection.__enter__.return_value = connection
+        with patch("app_users.tasks.get_connection", return_value=connection) as get_connection_mock:
+            send_queued_emails([make_payload("a@example.com"), make_payload("b@example.com")])
+        get_connection_mock.assert_called_once()
+        self.assertEqual(connection.send_messages.call_count, 2)
+
+    def test_send_queued_emails_retries_only_failed(self):
+        connection = MagicMock()
+        connection.__enter__.return_value = connection
+        connection.send_messages.side_effect = [1, smtplib.SMTPException("fail")]
+        with (
+            patch("app_users.tasks.get_connection", return_value=connection),
+            patch("app_users.tasks._retry_failed_emails") as retry_mock,
+        ):
+            send_queued_emails([make_payload("a@example.com"), make_payload("b@example.com")], 1)
+        retry_mock.assert_called_once_with([make_payload("b@example.com")], 1)
+
+    def test_send_queued_emails_connection_error_retries_all(self):
+        with (
+            patch("app_users.tasks.get_connection", side_effect=OSError("refused")),
+            patch("app_users.tasks._retry_failed_emails") as retry_mock,
+        ):
+            payloads = [make_payload()]
+            send_queued_emails(payloads)
+        retry_mock.assert_called_once_with(payloads, 0)
+
+    def test_retry_failed_emails_backoff(self):
+        with patch("app_users.tasks.get_registered_queue") as mock_get_queue:
+            mock_queue = MagicMock()
+            mock_get_queue.return_value = mock_queue
+            _retry_failed_emails([make_payload()], 2)
+            delay = mock_queue.enqueue_in.call_args[0][0]
+            self.assertEqual(delay.total_seconds(), 120)
+            self.assertEqual(mock_queue.enqueue_in.call_args[0][-1], 3)
+
+    def test_retry_failed_emails_gives_up(self):
+        with patch("app_users.tasks.get_registered_queue") as mock_get_queue:
+            _retry_failed_emails([make_payload()], 5)
+            mock_get_queue.assert_not_called()
+
+    def _mock_queue(self, mock_get_queue, results):
+        mock_queue = MagicMock()
+        mock_get_queue.return_value = mock_queue
+        pipe = mock_queue.connection.pipeline.return_value.__enter__.return_value
+        pipe.execute.side_effect = results
+        return mock_queue, pipe
+
+    def test_buffer_email_enqueues_one_drain_job_for_a_burst(self):
+        with patch("app_users.tasks.get_registered_queue") as mock_get_queue:
+            mock_queue, pipe = self._mock_queue(mock_get_queue, [[1, True], [2, None], [3, None]])
+            for to in ("a@example.com", "b@example.com", "c@example.com"):
+                buffer_email(make_payload(to))
+        mock_get_queue.assert_called_with("high")
+        mock_queue.enqueue.assert_called_once_with(drain_email_outbox)
+        self.assertEqual(
+            pipe.rpush.call_args_list[1].args, (EMAIL_OUTBOX_KEY, json.dumps(make_payload("b@example.com")))
+        )
+        pipe.set.assert_called_with(EMAIL_DRAIN_KEY, 1, nx=True, ex=600)
+
+    def test_drain_email_outbox_sends_batches(self):
+        first = [json.dumps(make_payload(f"{i}@example.com")).encode() for i in range(EMAIL_BATCH_SIZE)]
+        second = [json.dumps(make_payload("last@example.com")).encode()]
+        with (
+            patch("app_users.tasks.get_registered_queue") as mock_get_queue,
+            patch("app_users.tasks.send_queued_emails") as send_mock,
+        ):
+            mock_queue, pipe = self._mock_queue(mock_get_queue, [[first, True], [second, True], [[], True]])
+            drain_email_outbox()
+        mock_queue.connection.delete.assert_called_once_with(EMAIL_DRAIN_KEY)
+        self.assertEqual([len(call.args[0]) for call in send_mock.call_args_list], [EMAIL_BATCH_SIZE, 1])
+        self.assertEqual(send_mock.call_args_list[1].args[0], [make_payload("last@example.com")])
+        pipe.ltrim.assert_called_with(EMAIL_OUTBOX_KEY, EMAIL_BATCH_SIZE, -1)
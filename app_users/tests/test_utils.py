@@ -1,31 +1,43 @@
 from django.test import TestCase
 from unittest.mock import patch, MagicMock
 from django.contrib.auth import get_user_model
-from app_users.utils import send_verification_email, send_password_reset_email
+from app_users.utils import send_verification_email, send_password_reset_email, enqueue_email
+from app_users.tokens import SignedUserTokenGenerator, email_verification_token, password_reset_token
 
 CustomUserModel = get_user_model()
 
 
 class TestUtils(TestCase):
-    @patch("app_users.utils.EmailMultiAlternatives")
-    @patch("app_users.utils.render_to_string", return_value="text")
-    def test_send_verification_email(self, mock_render, mock_email):
-        user = CustomUserModel(username="testuser", email="test@example.com")
-        user.email_verification_token = None
-        user.save = MagicMock()
+    @patch("app_users.utils.enqueue_email")
+    def test_send_verification_email(self, mock_enqueue):
+        user = CustomUserModel.objects.create_user(username="testuser", email="test@example.com", is_active=False)
         send_verification_email(user, request=None)
-        self.assertTrue(user.email_verification_token)
-        user.save.assert_called_once()
-        mock_email.return_value.send.assert_called_once()
+        mock_enqueue.assert_called_once()
+        template, recipient, context = mock_enqueue.call_args[0]
+        self.assertEqual(template, "verify_email")
+        self.assertEqual(recipient, "test@example.com")
+        token = context["verification_link"].split("token=")[1]
+        self.assertEqual(email_verification_token.get_user(token), user)
 
-    @patch("app_users.utils.EmailMultiAlternatives")
-    @patch("app_users.utils.render_to_string", return_value="text")
-    def test_send_password_reset_email(self, mock_render, mock_email):
-        user = CustomUserModel(username="testuser", email="test@example.com")
-        user.password_reset_token = None
-        user.save = MagicMock()
+    @patch("app_users.utils.enqueue_email")
+    def test_send_password_reset_email(self, mock_enqueue):
+        user = CustomUserModel.objects.create_user(username="testuser", email="test@example.com", password="pw")
         send_password_reset_email(user, request=None)
-        self.assertTrue(user.password_reset_token)
-        self.assertTrue(user.password_reset_token_created_at)
-        user.save.assert_called_once()
-        mock_email.return_value.send.assert_called_once()
+        mock_enqueue.assert_called_once()
+        self.assertEqual(mock_enqueue.call_args[0][0], "password_reset")
+        token = mock_enqueue.call_args[0][2]["url"].split("token=")[1]
+        self.assertEqual(password_reset_token.get_user(token), user)
+
+    @patch("app_users.utils.buffer_email")
+    def test_enqueue_email_buffers_payload(self, mock_buffer):
+        enqueue_email("verify_email", "test@example.com", {"username": "test"})
+        mock_buffer.assert_called_once_with(
+            {"template": "verify_email", "to": "test@example.com", "context": {"username": "test"}}
+        )
+
+    def test_token_generator_requires_state(self):
+        class StatelessTokenGenerator(SignedUserTokenGenerator):
+            salt = "app_users.tokens.stateless"
+
+        with self.assertRaises(TypeError):
+            StatelessTokenGenerator()
@@ -0,0 +1,81 @@
+from unittest.mock import patch, MagicMock
+from django.urls import reverse
+from redis.exceptions import RedisError
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+from django.contrib.auth import get_user_model
+from app_users.models import UserProfiles
+from app_videos.models import VideoFile, Video, VideoProgress
+
+CustomUserModel = get_user_model()
+
+
+class ContinueWatchingViewTests(APITestCase):
+    def setUp(self):
+        self.user = CustomUserModel.objects.create_user(
+            username="watchuser",
+            email="watch@example.com",
+            password="pw",
+            is_active=True,
+            is_email_verified=True,
+        )
+        self.profile = UserProfiles.objects.create(user=self.user, profile_name="TestProfile", preferred_language="en")
+        self.video = Video.objects.create(title="Testvideo", description="desc")
+        self.files = [
+            VideoFile.objects.create(
+                video=self.video,
+                duration=100,
+                original_file=f"test{i}.mp4",
+                language=language,
+                localized_title=f"Video {i}",
+                is_ready=True,
+            )
+            for i, language in enumerate(["de", "en", "fr"])
+        ]
+        self.started_old = VideoProgress.objects.create(profile=self.profile, video_file=self.files[0], current_time=20)
+        self.started_new = VideoProgress.objects.create(profile=self.profile, video_file=self.files[1], current_time=30)
+        VideoProgress.objects.create(profile=self.profile, video_file=self.files[2], current_time=95)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("continue_watching", args=[self.profile.id])
+
+    @patch("app_videos.continue_watching.get_redis_connection", side_effect=RedisError("down"))
+    def test_falls_back_to_database_when_redis_unavailable(self, mock_conn):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [entry["video_file_id"] for entry in response.data],
+            [str(self.files[1].id), str(self.files[0].id)],
+        )
+        self.assertEqual(response.data[0]["title"], "Video 1")
+
+    @patch("app_videos.continue_watching.get_redis_connection")
+    def test_reads_order_from_sorted_set(self, mock_conn):
+        pipe = MagicMock()
+        pipe.execute.return_value = [1, [str(self.files[0].id).encode(), str(self.files[1].id).encode()]]
+        mock_conn.return_value.pipeline.return_value = pipe
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {"limit": 5})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [entry["video_file_id"] for entry in response.data],
+            [str(self.files[0].id), str(self.files[1].id)],
+        )
+        pipe.zrevrangebyscore.assert_called_once_with(
+            f"continue_watching:{self.profile.id}", "+inf", "(0", start=0, num=5
+        )
+
+    @patch("app_videos.continue_watching.get_redis_connection", side_effect=RedisError("down"))
+    def test_limit(self, mock_conn):
+        response = self.client.get(self.url, {"limit": 1})
+        self.assertEqual(len(response.data), 1)
+        response = self.client.get(self.url, {"limit": "abc"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.url, {"limit": 0})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_other_users_profile_not_found(self):
+        other = CustomUserModel.objects.create_user(username="other", email="other@example.com", password="pw")
+        self.client.force_authenticate(user=other)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
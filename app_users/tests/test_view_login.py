@@ -2,6 +2,10 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from app_users.models import UserProfiles
+from app_videos.models import Video, VideoFile, VideoProgress
 
 CustomUserModel = get_user_model()
 
@@ -70,3 +74,38 @@ class LoginViewTests(APITestCase):
 
         self.assertIn("username", response.data)
         self.assertEqual(response.data["username"][0].code, "required")
+
+    def test_login_full_profiles_by_default(self):
+        UserProfiles.objects.create(user=self.user, profile_name="Main")
+        data = {"username": self.username, "password": self.password}
+        response = self.client.post(self.login_url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        profile = response.data["user"]["profiles"][0]
+        self.assertIn("video_progress", profile)
+        self.assertIn("watch_statistics", profile)
+
+    def test_login_summary_profiles(self):
+        UserProfiles.objects.create(user=self.user, profile_name="Main", is_kid=True)
+        data = {"username": self.username, "password": self.password}
+        response = self.client.post(f"{self.login_url}?profiles=summary", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("access", response.data)
+        profile = response.data["user"]["profiles"][0]
+        self.assertEqual(set(profile), {"id", "profile_name", "preferred_language", "profile_picture_url", "is_kid"})
+        self.assertTrue(profile["is_kid"])
+
+    def test_login_summary_query_count_independent_of_history(self):
+        profile = UserProfiles.objects.create(user=self.user, profile_name="Main")
+        data = {"username": self.username, "password": self.password}
+        url = f"{self.login_url}?profiles=summary"
+        with CaptureQueriesContext(connection) as before:
+            self.client.post(url, data, format="json")
+
+        video = Video.objects.create(title="History")
+        for language in ("en", "de", "fr"):
+            video_file = VideoFile.objects.create(video=video, language=language, duration=100, is_ready=True)
+            VideoProgress.objects.create(profile=profile, video_file=video_file, current_time=50)
+
+        with CaptureQueriesContext(connection) as after:
+            self.client.post(url, data, format="json")
+        self.assertEqual(len(before.captured_queries), len(after.captured_queries))
@@ -3,10 +3,10 @@ from rest_framework import status
 from rest_framework.test import APITestCase
 from django.contrib.auth import get_user_model
 from unittest.mock import patch
-import uuid
-from django.utils import timezone
+import time
 from datetime import timedelta
 from django.conf import settings
+from app_users.tokens import password_reset_token
 
 CustomUserModel = get_user_model()
 
@@ -42,10 +42,6 @@ class PasswordResetRequestViewTests(APITestCase):
             response.data["message"], "If an account with this email exists, a password reset link has been sent."
         )
 
-        self.active_user.refresh_from_db()
-        self.assertIsNotNone(self.active_user.password_reset_token)
-        self.assertIsNotNone(self.active_user.password_reset_token_created_at)
-
         mock_send_email.assert_called_once()
         called_args, _ = mock_send_email.call_args
         self.assertEqual(called_args[0], self.active_user)
@@ -67,7 +63,6 @@ class PasswordResetRequestViewTests(APITestCase):
 
         user_before_request = CustomUserModel.objects.get(email=self.inactive_user_email)
         self.assertFalse(user_before_request.is_active)
-        self.assertIsNone(user_before_request.password_reset_token)
 
         response = self.client.post(self.url, data, format="json")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -77,7 +72,6 @@ class PasswordResetRequestViewTests(APITestCase):
 
         inactive_user_db = CustomUserModel.objects.get(email=self.inactive_user_email)
         self.assertFalse(inactive_user_db.is_active)
-        self.assertIsNone(inactive_user_db.password_reset_token)
         mock_send_email.assert_not_called()
 
     def test_password_reset_request_missing_email_field(self):
@@ -100,25 +94,23 @@ class PasswordResetConfirmViewTests(APITestCase):
     def setUpTestData(cls):
         cls.user_email = "confirmreset@example.com"
         cls.password = "oldPassword123!"
-        cls.reset_token = uuid.uuid4()
         cls.user = CustomUserModel.objects.create_user(
             username="confirmresetuser",
             email=cls.user_email,
             password=cls.password,
             is_active=True,
             is_email_verified=True,
-            password_reset_token=cls.reset_token,
-            password_reset_token_created_at=timezone.now(),
         )
 
     def setUp(self):
+        self.reset_token = password_reset_token.make_token(self.user)
         self.url_name_generic = "password_reset_confirm"
         self.new_password = "newStrongPassword456!"
 
     def test_successful_password_reset_confirm(self):
         url = reverse(self.url_name_generic)
         data = {
-            "token": str(self.reset_token),
+            "token": self.reset_token,
             "new_password": self.new_password,
             "new_password2": self.new_password,
         }
@@ -129,14 +121,16 @@ class PasswordResetConfirmViewTests(APITestCase):
         self.user.refresh_from_db()
         self.assertTrue(self.user.check_password(self.new_password))
         self.assertFalse(self.user.check_password(self.password))
-        self.assertIsNone(self.user.password_reset_token)
-        self.assertIsNone(self.user.password_reset_token_created_at)
+
+        response_again = self.client.post(url, data, format="json")
+        self.assertEqual(response_again.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response_again.data["detail"], "Invalid or expired password reset token.")
 
     def test_password_reset_confirm_invalid_token_in_url(self):
-        invalid_token = uuid.uuid4()
+        invalid_token = self.reset_token[:-1] + ("a" if self.reset_token[-1] != "a" else "b")
         url = reverse(self.url_name_generic)
         data = {
-            "token": str(invalid_token),
+            "token": invalid_token,
             "new_password": self.new_password,
             "new_password2": self.new_password,
         }
@@ -146,9 +140,9 @@ class PasswordResetConfirmViewTests(APITestCase):
 
     def test_password_reset_confirm_invalid_token_in_body(self):
         url = reverse(self.url_name_generic)
-        invalid_token_body = uuid.uuid4()
+        invalid_token_body = "abc:def:ghi"
         data = {
-            "token": str(invalid_token_body),
+            "token": invalid_token_body,
             "new_password": self.new_password,
             "new_password2": self.new_password,
         }
@@ -157,14 +151,13 @@ class PasswordResetConfirmViewTests(APITestCase):
         self.assertEqual(response.data["detail"], "Invalid or expired password reset token.")
 
     def test_password_reset_confirm_token_expired(self):
-        self.user.password_reset_token_created_at = timezone.now() - timedelta(
-            hours=settings.PASSWORD_RESET_TIMEOUT_HOURS + 1
-        )
-        self.user.save()
+        issued_at = time.time() - timedelta(hours=settings.PASSWORD_RESET_TIMEOUT_HOURS + 1).total_seconds()
+        with patch("django.core.signing.time.time", return_value=issued_at):
+            expired_token = password_reset_token.make_token(self.user)
 
         url = reverse(self.url_name_generic)
         data = {
-            "token": str(self.reset_token),
+            "token": expired_token,
             "new_password": self.new_password,
             "new_password2": self.new_password,
         }
@@ -175,7 +168,7 @@ class PasswordResetConfirmViewTests(APITestCase):
     def test_password_reset_confirm_password_mismatch(self):
         url = reverse(self.url_name_generic)
         data = {
-            "token": str(self.reset_token),
+            "token": self.reset_token,
             "new_password": self.new_password,
             "new_password2": "ADifferentPassword!",
         }
@@ -186,12 +179,12 @@ class PasswordResetConfirmViewTests(APITestCase):
 
     def test_password_reset_confirm_missing_fields(self):
         url = reverse(self.url_name_generic)
-        data_missing_pass = {"token": str(self.reset_token), "new_password2": self.new_password}
+        data_missing_pass = {"token": self.reset_token, "new_password2": self.new_password}
         response = self.client.post(url, data_missing_pass, format="json")
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("new_password", response.data)
 
-        data_missing_confirm = {"token": str(self.reset_token), "new_password": self.new_password}
+        data_missing_confirm = {"token": self.reset_token, "new_password": self.new_password}
         response = self.client.post(url, data_missing_confirm, format="json")
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("new_password2", response.data)
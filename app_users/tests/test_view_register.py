@@ -3,7 +3,6 @@ from rest_framework import status
 from rest_framework.test import APITestCase
 from django.contrib.auth import get_user_model
 from unittest.mock import patch
-import uuid
 
 CustomUserModel = get_user_model()
 
@@ -34,13 +33,6 @@ class RegisterViewTests(APITestCase):
             "last_name": "User",
         }
 
-        def mock_send_email_side_effect(user_obj_passed_to_mock, request_obj_passed_to_mock):
-            if not user_obj_passed_to_mock.email_verification_token:
-                user_obj_passed_to_mock.email_verification_token = uuid.uuid4()
-                user_obj_passed_to_mock.save(update_fields=["email_verification_token"])
-
-        mock_send_email.side_effect = mock_send_email_side_effect
-
         response = self.client.post(self.register_url, data, format="json")
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
@@ -50,7 +42,6 @@ class RegisterViewTests(APITestCase):
         self.assertEqual(registered_user.username, email_for_success)
         self.assertFalse(registered_user.is_active)
         self.assertFalse(registered_user.is_email_verified)
-        self.assertIsNotNone(registered_user.email_verification_token)
 
         mock_send_email.assert_called_once()
         user_arg_in_mock_call = mock_send_email.call_args[0][0]
@@ -61,6 +61,14 @@ class UserDetailViewTests(APITestCase):
         self.assertEqual(response.data["profiles"][0]["profile_name"], "DefaultProfile1")
         self.assertNotIn("password", response.data)
 
+    def test_get_user_details_with_nested_sparse_fields(self):
+        self._authenticate_user(self.user1)
+        response = self.client.get(self.user_detail_url, {"fields": "username,profiles.profile_name"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data, {"username": self.user1_username, "profiles": [{"profile_name": "DefaultProfile1"}]}
+        )
+
     def test_get_user_details_unauthenticated(self):
         response = self.client.get(self.user_detail_url)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -89,6 +97,20 @@ class UserDetailViewTests(APITestCase):
         self.assertEqual(self.user1.first_name, "PartialUpdateFirst")
         self.assertEqual(self.user1.last_name, "User1")
 
+    def test_update_user_details_does_not_save_stale_cached_user(self):
+        self._authenticate_user(self.user1)
+        self.client.get(self.user_detail_url)
+        CustomUserModel.objects.filter(pk=self.user1.pk).update(is_email_verified=False)
+        self.user1.set_password("ChangedElsewhere123!")
+        CustomUserModel.objects.filter(pk=self.user1.pk).update(password=self.user1.password)
+
+        response = self.client.patch(self.user_detail_url, {"first_name": "Fresh"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user1.refresh_from_db()
+        self.assertEqual(self.user1.first_name, "Fresh")
+        self.assertFalse(self.user1.is_email_verified)
+        self.assertTrue(self.user1.check_password("ChangedElsewhere123!"))
+
     def test_update_user_details_unauthenticated(self):
         update_data = {"first_name": "AttemptUpdate"}
         response = self.client.patch(self.user_detail_url, update_data, format="json")
@@ -47,6 +47,30 @@ class UserProfileViewsTests(APITestCase):
         self.assertIn("Profile1.1", profile_names)
         self.assertIn("Profile1.2", profile_names)
 
+    def test_list_user_profiles_sparse_fields_skip_progress_queries(self):
+        self._authenticate_user(self.user1)
+        with self.assertNumQueries(5):
+            self.client.get(self.list_create_url)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.list_create_url, {"fields": "id,profile_name"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([set(p) for p in response.data], [{"id", "profile_name"}] * 2)
+
+    def test_list_user_profiles_selected_statistics(self):
+        self._authenticate_user(self.user1)
+        with self.assertNumQueries(3):
+            response = self.client.get(self.list_create_url, {"fields": "id,watch_statistics"})
+        self.assertEqual([set(p) for p in response.data], [{"id", "watch_statistics"}] * 2)
+
+    def test_update_profile_with_sparse_fields_keeps_input_fields(self):
+        self._authenticate_user(self.user1)
+        url = self._get_detail_url(self.profile1_user1.id)
+        response = self.client.patch(url + "?fields=id", {"profile_name": "Sparse"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data), {"id"})
+        self.profile1_user1.refresh_from_db()
+        self.assertEqual(self.profile1_user1.profile_name, "Sparse")
+
     def test_list_user_profiles_unauthenticated(self):
         response = self.client.get(self.list_create_url)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
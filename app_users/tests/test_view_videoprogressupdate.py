@@ -1,3 +1,6 @@
+from io import StringIO
+from unittest.mock import MagicMock, patch
+from django.core.management import call_command
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
@@ -57,3 +60,20 @@ class VideoProgressUpdateViewTests(APITestCase):
         response = self.client.delete(self.url)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("detail", response.data)
+
+    def test_benchmark_command_in_process(self):
+        out = StringIO()
+        call_command("benchmark_progress_update", "--count", "5", "--in-process", stdout=out)
+        self.assertIn("persistent: mean", out.getvalue())
+        self.assertFalse(CustomUserModel.objects.filter(username__startswith="bench-").exists())
+        self.assertEqual(Video.objects.count(), 1)
+
+    def test_benchmark_command_runs_each_mode_in_own_process(self):
+        out = StringIO()
+        with patch("app_users.management.commands.benchmark_progress_update.subprocess.run") as run_mock:
+            run_mock.return_value = MagicMock(returncode=0, stdout="result\n")
+            call_command("benchmark_progress_update", "--count", "5", "--modes", "none", "pool", stdout=out)
+        modes = [call.kwargs["env"]["DB_CONNECTION_MODE"] for call in run_mock.call_args_list]
+        self.assertEqual(modes, ["none", "pool"])
+        self.assertIn("--in-process", run_mock.call_args.args[0])
+        self.assertEqual(out.getvalue(), "result\nresult\n")
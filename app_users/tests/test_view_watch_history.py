@@ -0,0 +1,75 @@
+from datetime import timedelta
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+from django.contrib.auth import get_user_model
+from app_users.models import UserProfiles
+from app_videos.models import VideoFile, Video, VideoProgress
+
+CustomUserModel = get_user_model()
+
+
+class WatchHistoryViewTests(APITestCase):
+    def setUp(self):
+        self.user = CustomUserModel.objects.create_user(
+            username="historyuser",
+            email="history@example.com",
+            password="pw",
+            is_active=True,
+            is_email_verified=True,
+        )
+        self.profile = UserProfiles.objects.create(user=self.user, profile_name="TestProfile", preferred_language="en")
+        current_times = {"de": 950, "en": 500, "fr": 30, "es": 60, "it": 0}
+        self.progress = {}
+        for language, current_time in current_times.items():
+            video_file = VideoFile.objects.create(
+                video=Video.objects.create(title=f"Video {language}", description="desc"),
+                duration=1000,
+                original_file=f"{language}.mp4",
+                language=language,
+                is_ready=True,
+            )
+            self.progress[language] = VideoProgress.objects.create(
+                profile=self.profile, video_file=video_file, current_time=current_time
+            )
+        same_time = timezone.now() - timedelta(hours=1)
+        VideoProgress.objects.filter(profile=self.profile).update(last_watched=same_time)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("watch_history", args=[self.profile.id])
+
+    def test_status_filters_match_status_property(self):
+        for status_name in ["completed", "continue_watching", "just_started", "not_started"]:
+            response = self.client.get(self.url, {"status": status_name})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertTrue(response.data["results"])
+            for entry in response.data["results"]:
+                self.assertEqual(entry["status"], status_name)
+
+    def test_invalid_status(self):
+        response = self.client.get(self.url, {"status": "unknown"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("status", response.data)
+
+    def test_keyset_pagination_walks_ties_without_duplicates(self):
+        seen = []
+        response = self.client.get(self.url, {"page_size": 2})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend(entry["video_file_id"] for entry in response.data["results"])
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(len(set(seen)), 5)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_other_users_profile_not_found(self):
+        other = CustomUserModel.objects.create_user(username="other", email="other@example.com", password="pw")
+        self.client.force_authenticate(user=other)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
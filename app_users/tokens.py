@@ -0,0 +1,75 @@
+import re
+from abc import ABC, abstractmethod
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.utils.crypto import constant_time_compare, salted_hmac
+
+TOKEN_PATTERN = re.compile(r"^[\w-]+:[\w-]+:[\w-]+$")
+
+
+class SignedUserTokenGenerator(ABC):
+    """
+    Stateless, expiring tokens signed over the user id and account state.
+    A token becomes invalid as soon as the state it was issued for changes.
+    """
+
+    salt = None
+    timeout_setting = None
+
+    @property
+    def max_age(self):
+        """Token lifetime in seconds."""
+        return getattr(settings, self.timeout_setting) * 3600
+
+    def make_token(self, user):
+        """Returns a signed token for the user."""
+        return signing.dumps({"uid": str(user.pk), "state": self._state_hash(user)}, salt=self.salt)
+
+    def get_user(self, token):
+        """
+        Validates the token and returns its user, fetched by primary key.
+        Raises signing.BadSignature (or SignatureExpired) for invalid tokens.
+        """
+        data = signing.loads(token, salt=self.salt, max_age=self.max_age)
+        user = get_user_model().objects.get(pk=data["uid"])
+        if not constant_time_compare(data["state"], self._state_hash(user)):
+            raise signing.BadSignature("Token does not match the current account state.")
+        return user
+
+    @abstractmethod
+    def get_state(self, user):
+        """Returns the account state the token is bound to."""
+
+    def _state_hash(self, user):
+        return salted_hmac(self.salt, self.get_state(user)).hexdigest()[:20]
+
+
+class EmailVerificationTokenGenerator(SignedUserTokenGenerator):
+    """Tokens for email verification, invalidated once the account is activated."""
+
+    salt = "app_users.tokens.email_verification"
+    timeout_setting = "EMAIL_VERIFICATION_TIMEOUT_HOURS"
+
+    def get_state(self, user):
+        return f"{user.email}{user.is_active}{user.is_email_verified}"
+
+
+class PasswordResetTokenGenerator(SignedUserTokenGenerator):
+    """Tokens for password reset, invalidated by a password change or login."""
+
+    salt = "app_users.tokens.password_reset"
+    timeout_setting = "PASSWORD_RESET_TIMEOUT_HOURS"
+
+    def get_state(self, user):
+        last_login = user.last_login.replace(microsecond=0, tzinfo=None) if user.last_login else ""
+        return f"{user.password}{last_login}"
+
+
+def is_well_formed(token):
+    """Checks that a value has the shape of a signed token."""
+    return isinstance(token, str) and bool(TOKEN_PATTERN.match(token))
+
+
+email_verification_token = EmailVerificationTokenGenerator()
+password_reset_token = PasswordResetTokenGenerator()
@@ -1,74 +1,39 @@
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
 from django.conf import settings
-from django.utils import timezone
-import uuid
+from app_users.tasks import buffer_email
+from app_users.tokens import email_verification_token, password_reset_token
 
 BASE_URL = settings.BASE_URL
 
 
-def send_verification_email(user, request):
+def enqueue_email(template, recipient, context):
     """
-    Sends a verification email to the user.
+    Queues an email for background delivery; emails sent in a burst share one job and SMTP connection.
     """
-    if not user.email_verification_token:
-        user.email_verification_token = uuid.uuid4()
-        user.save(update_fields=["email_verification_token"])
+    buffer_email({"template": template, "to": recipient, "context": context})
 
-    token = user.email_verification_token
-    frontend_reset_link = f"{BASE_URL}/verify?token={str(token)}"
+
+def send_verification_email(user, request):
+    """
+    Queues a verification email for the user.
+    """
+    token = email_verification_token.make_token(user)
+    frontend_reset_link = f"{BASE_URL}/verify?token={token}"
 
     context = {
         "username": user.username,
         "verification_link": frontend_reset_link,
     }
-
-    subject = "Confirm your email"
-    from_email = settings.DEFAULT_FROM_EMAIL
-    recipient_email = [user.email]
-
-    text_content = render_to_string("emails/verify_email.txt", context)
-    html_content = render_to_string("emails/verify_email.html", context)
-
-    msg = EmailMultiAlternatives(
-        subject=subject,
-        body=text_content,
-        from_email=from_email,
-        to=recipient_email,
-    )
-    msg.attach_alternative(html_content, "text/html")
-    msg.send()
+    enqueue_email("verify_email", user.email, context)
 
 
 def send_password_reset_email(user, request):
     """
-    Sends a password reset email to the user.
+    Queues a password reset email for the user.
     """
-    if not user.password_reset_token:
-        user.password_reset_token = uuid.uuid4()
-
-    user.password_reset_token_created_at = timezone.now()
-    user.save(update_fields=["password_reset_token", "password_reset_token_created_at"])
-
-    token = user.password_reset_token
-    frontend_reset_link = f"{BASE_URL}/password/reset?reset=true&token={str(token)}"
+    token = password_reset_token.make_token(user)
+    frontend_reset_link = f"{BASE_URL}/password/reset?reset=true&token={token}"
 
     context = {
         "url": frontend_reset_link,
     }
-
-    subject = "Reset your Password"
-    from_email = settings.DEFAULT_FROM_EMAIL
-    recipient_email = [user.email]
-
-    text_content = render_to_string("emails/password_reset.txt", context)
-    html_content = render_to_string("emails/password_reset.html", context)
-
-    msg = EmailMultiAlternatives(
-        subject=subject,
-        body=text_content,
-        from_email=from_email,
-        to=recipient_email,
-    )
-    msg.attach_alternative(html_content, "text/html")
-    msg.send()
+    enqueue_email("password_reset", user.email, context)
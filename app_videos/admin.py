@@ -1,7 +1,9 @@
 from django.contrib import admin
+from django.db.models import Count, Prefetch
 from django.utils.html import format_html
 from .models import Video, VideoFile, Genres, VideoProgress
 from app_videos.utils import get_video_file_status
+from core.utils.paginator import EstimatedCountPaginator
 
 
 class VideoFileInline(admin.TabularInline):
@@ -69,13 +71,25 @@ class VideoAdmin(admin.ModelAdmin):
         ),
     )
 
+    def get_queryset(self, request):
+        """Prefetch genres and ready files so list columns need no per-row queries."""
+        ready_files = VideoFile.objects.filter(is_ready=True).only("id", "video_id", "language")
+        return (
+            super()
+            .get_queryset(request)
+            .prefetch_related("genres", Prefetch("video_files", queryset=ready_files, to_attr="ready_video_files"))
+        )
+
     def get_genres(self, obj):
         """Return comma-separated genre names for a video."""
         return ", ".join([genres.name for genres in obj.genres.all()])
 
     def available_languages_short(self, obj):
         """Return short list of ready languages for list display."""
-        ready_languages = obj.video_files.filter(is_ready=True).values_list("language", flat=True)
+        if hasattr(obj, "ready_video_files"):
+            ready_languages = [vf.language for vf in obj.ready_video_files]
+        else:
+            ready_languages = obj.video_files.filter(is_ready=True).values_list("language", flat=True)
         if ready_languages:
             return ", ".join(ready_languages)
         return "None ready"
@@ -121,6 +135,10 @@ class VideoFileAdmin(admin.ModelAdmin):
         "status_display",
     )
 
+    def get_queryset(self, request):
+        """Join the parent video used by the title and string columns."""
+        return super().get_queryset(request).select_related("video")
+
     def status_display(self, obj):
         return get_video_file_status(obj)
 
@@ -204,10 +222,18 @@ class GenreAdmin(admin.ModelAdmin):
     search_fields = ("name",)
     ordering = ("name",)
 
+    def get_queryset(self, request):
+        """Annotate the video count for the list column."""
+        return super().get_queryset(request).annotate(num_videos=Count("videos"))
+
     def video_count(self, obj):
         """Return the number of videos for a genre."""
+        if hasattr(obj, "num_videos"):
+            return obj.num_videos
         return obj.videos.count()
 
+    video_count.admin_order_field = "num_videos"
+
     video_count.short_description = "Videos"
 
 
@@ -224,7 +250,10 @@ class VideoProgressAdmin(admin.ModelAdmin):
         "is_completed",
         "last_watched",
     )
-    list_filter = ("is_completed", "is_started", "video_file__language", "last_watched")
+    list_filter = ("is_completed", "is_started", "video_file__language")
+    date_hierarchy = "last_watched"
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     search_fields = (
         "profile__profile_name",
         "profile__user__username",
@@ -241,6 +270,10 @@ class VideoProgressAdmin(admin.ModelAdmin):
         ("Timestamps", {"fields": ("last_watched", "created_at"), "classes": ("collapse",)}),
     )
 
+    def get_queryset(self, request):
+        """Join profile and video data shown in the list columns."""
+        return super().get_queryset(request).select_related("profile__user", "video_file__video")
+
     def video_title(self, obj):
         """Returns the title of the video."""
         return obj.video_file.display_title
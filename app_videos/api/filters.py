@@ -1,7 +1,7 @@
 from django_filters import rest_framework as filters
 from django.utils import timezone
 from django.utils.timezone import localtime
-from app_videos.models import VideoFile
+from app_videos.models import CatalogEntry, Genres, Video, VideoFile
 from django.db.models import Max
 from datetime import timedelta
 
@@ -43,3 +43,49 @@ class VideoFileFilter(filters.FilterSet):
         if latest_date:
             return queryset.filter(video__release_date=latest_date)
         return queryset.none()
+
+
+class CatalogEntryFilter(filters.FilterSet):
+    """
+    FilterSet for the catalog read model, accepting the same parameters as VideoFileFilter.
+    Catalog entries are always published and ready, so those filters only exclude everything when False.
+    """
+
+    title = filters.CharFilter(field_name="video_title", lookup_expr="icontains")
+    genres = filters.CharFilter(method="filter_genres")
+    published = filters.BooleanFilter(method="filter_always_true")
+    newly_released = filters.BooleanFilter(field_name="release_date", method="filter_newly_released")
+    language = CharInFilter(field_name="language", lookup_expr="in")
+    is_ready = filters.BooleanFilter(method="filter_always_true")
+
+    class Meta:
+        model = CatalogEntry
+        fields = ["title", "genres", "published", "newly_released", "language", "is_ready"]
+
+    def filter_genres(self, queryset, name, value):
+        """
+        Case-insensitive exact match against one of the video's genres.
+        Resolved through the indexed genre links (genre id -> video ids) instead of scanning the entries.
+        """
+        genre_ids = Genres.objects.filter(name__iexact=value).values("id")
+        video_ids = Video.genres.through.objects.filter(genres_id__in=genre_ids).values("video_id")
+        return queryset.filter(video_id__in=video_ids)
+
+    def filter_always_true(self, queryset, name, value):
+        """Every entry is published and ready."""
+        return queryset if value else queryset.none()
+
+    def filter_newly_released(self, queryset, name, value):
+        """
+        Filter for newly released videos:
+        - If value is True: return entries flagged as released in the last 90 days.
+          The flag is cleared by a job scheduled at the end of the window, so no clock is read here.
+        - If value is False: return only the most recently released video(s).
+        - If no videos exist: return an empty queryset.
+        """
+        if value:
+            return queryset.filter(is_new=True)
+        latest_date = queryset.aggregate(latest=Max("release_date"))["latest"]
+        if latest_date:
+            return queryset.filter(release_date=latest_date)
+        return queryset.none()
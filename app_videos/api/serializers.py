@@ -1,15 +1,19 @@
+from django.db.models import Prefetch
 from rest_framework import serializers
-from app_videos.models import VideoFile
+from core.utils.serializers import DynamicFieldsMixin
+from app_videos.models import CatalogEntry, VideoFile
 
 
-class VideoFileSerializer(serializers.ModelSerializer):
+class VideoFileSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for VideoFile model, providing custom fields for URLs, genres, languages, and localization.
+    Supports ?fields= sparse fieldsets; genres and available_languages are only prefetched when requested.
     """
 
     thumbnail_url = serializers.SerializerMethodField()
     preview_url = serializers.SerializerMethodField()
     hls_url = serializers.SerializerMethodField()
+    dash_url = serializers.SerializerMethodField()
     genres = serializers.SerializerMethodField()
     available_languages = serializers.SerializerMethodField()
     title = serializers.SerializerMethodField()
@@ -28,10 +32,21 @@ class VideoFileSerializer(serializers.ModelSerializer):
             "thumbnail_url",
             "preview_url",
             "hls_url",
+            "dash_url",
             "is_ready",
             "created_at",
             "updated_at",
         ]
+        field_prefetches = {
+            "genres": ["video__genres"],
+            "available_languages": [
+                Prefetch(
+                    "video__video_files",
+                    queryset=VideoFile.objects.filter(is_ready=True),
+                    to_attr="ready_video_files",
+                )
+            ],
+        }
 
     def get_thumbnail_url(self, obj):
         """
@@ -57,19 +72,27 @@ class VideoFileSerializer(serializers.ModelSerializer):
             return self.context["request"].build_absolute_uri(obj.hls_master_path)
         return None
 
+    def get_dash_url(self, obj):
+        """
+        Return absolute URL for the DASH manifest if present, else None.
+        """
+        if obj.dash_manifest_path:
+            return self.context["request"].build_absolute_uri(obj.dash_manifest_path)
+        return None
+
     def get_genres(self, obj):
         """
         Return a list of genre names for the related video.
         """
-        if obj.video.genres.exists():
-            return [g.name for g in obj.video.genres.all()]
-        return []
+        return [g.name for g in obj.video.genres.all()]
 
     def get_available_languages(self, obj):
         """
         Return a dict of ready languages and their VideoFile IDs for the video.
         """
-        video_files = obj.video.video_files.filter(is_ready=True)
+        video_files = getattr(obj.video, "ready_video_files", None)
+        if video_files is None:
+            video_files = obj.video.video_files.filter(is_ready=True)
         return {vf.language: str(vf.id) for vf in video_files}
 
     def get_title(self, obj):
@@ -83,3 +106,53 @@ class VideoFileSerializer(serializers.ModelSerializer):
         Return localized description if available, else original description.
         """
         return obj.display_description
+
+
+class CatalogEntrySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    """
+    Serializer for the catalog read model, producing the same representation as VideoFileSerializer.
+    """
+
+    id = serializers.UUIDField(source="video_file_id", read_only=True)
+    thumbnail_url = serializers.SerializerMethodField()
+    preview_url = serializers.SerializerMethodField()
+    hls_url = serializers.SerializerMethodField()
+    dash_url = serializers.SerializerMethodField()
+    is_ready = serializers.SerializerMethodField()
+
+    class Meta:
+        model = CatalogEntry
+        fields = VideoFileSerializer.Meta.fields
+
+    def _absolute_url(self, path):
+        return self.context["request"].build_absolute_uri(path) if path else None
+
+    def get_thumbnail_url(self, obj):
+        """
+        Return absolute URL for thumbnail if present, else None.
+        """
+        return self._absolute_url(obj.thumbnail_path)
+
+    def get_preview_url(self, obj):
+        """
+        Return absolute URL for preview file if present, else None.
+        """
+        return self._absolute_url(obj.preview_path)
+
+    def get_hls_url(self, obj):
+        """
+        Return absolute URL for HLS master path if present, else None.
+        """
+        return self._absolute_url(obj.hls_master_path)
+
+    def get_dash_url(self, obj):
+        """
+        Return absolute URL for the DASH manifest if present, else None.
+        """
+        return self._absolute_url(obj.dash_manifest_path)
+
+    def get_is_ready(self, obj):
+        """
+        Catalog entries only exist for ready files.
+        """
+        return True
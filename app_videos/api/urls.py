@@ -1,8 +1,9 @@
 from django.urls import path
-from app_videos.api.views import VideoFileDetailView, VideoFileListView, GenreVideoCountView
+from app_videos.api.views import VideoFileDetailView, VideoFileListView, GenreVideoCountView, HomeView
 
 urlpatterns = [
     path("", VideoFileListView.as_view(), name="video_list"),
+    path("home/", HomeView.as_view(), name="video_home"),
     path("<uuid:pk>/", VideoFileDetailView.as_view(), name="video_detail"),
     path("genre-count/", GenreVideoCountView.as_view(), name="genre_video_count"),
 ]
@@ -1,31 +1,147 @@
+import hashlib
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db.models import Count
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import etag
 from rest_framework import generics, status
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.response import Response
-from app_videos.models import VideoFile, Genres
-from .filters import VideoFileFilter
-from .serializers import VideoFileSerializer
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+from app_users.api.serializers import serialize_video_progress
+from app_users.models import UserProfiles
+from app_videos.catalog import get_catalog_version
+from app_videos.continue_watching import get_continue_watching
+from app_videos.models import CatalogEntry, VideoFile, Genres
+from .filters import CatalogEntryFilter
+from .serializers import CatalogEntrySerializer, VideoFileSerializer
 from .pagination import VideoPagination
 
+HOME_ROW_LIMIT = 10
+HOME_MAX_ROW_LIMIT = 30
+HOME_CACHE_KEY = "home:{}:{}:{}:{}:{}"
 
+
+def catalog_etag(request, *args, **kwargs):
+    """
+    Strong ETag for catalog responses: the catalog version plus the exact URL and Accept header.
+    Needs no database query, so If-None-Match hits return 304 right after authentication.
+    Responses for a ?profile= depend on the profile's language and get no ETag.
+    """
+    if request.GET.get("profile"):
+        return None
+    variant = f"{request.build_absolute_uri()}|{request.META.get('HTTP_ACCEPT', '')}"
+    return f"{get_catalog_version()}-{hashlib.md5(variant.encode(), usedforsecurity=False).hexdigest()[:16]}"
+
+
+@method_decorator(etag(catalog_etag), name="get")
 class VideoFileListView(generics.ListAPIView):
-    """List published and ready video files."""
+    """
+    List released video files from the denormalized catalog table.
+    With ?profile=<id>, returns one entry per video in the profile's preferred language (English fallback).
+    """
 
-    queryset = VideoFile.objects.published_and_ready()
-    serializer_class = VideoFileSerializer
-    filterset_class = VideoFileFilter
+    authentication_classes = [JWTStatelessUserAuthentication]
+    queryset = CatalogEntry.objects.visible()
+    serializer_class = CatalogEntrySerializer
+    filterset_class = CatalogEntryFilter
     pagination_class = VideoPagination
 
+    def get_queryset(self):
+        """Visible entries, collapsed per video when a profile is given."""
+        queryset = super().get_queryset()
+        profile = get_request_profile(self.request)
+        if profile:
+            queryset = queryset.one_per_video(profile.preferred_language)
+        return queryset
+
+
+@method_decorator(etag(catalog_etag), name="get")
+class HomeView(generics.GenericAPIView):
+    """
+    Home screen in one response: the newest titles of every non-empty genre, newly released titles
+    and, with ?profile=<id>, the profile's continue-watching row. Titles are collapsed to the profile's
+    language; the catalog rows are cached per language until the catalog version changes.
+    """
+
+    authentication_classes = [JWTStatelessUserAuthentication]
+    serializer_class = CatalogEntrySerializer
+
+    def get(self, request):
+        """Returns genre rows, newly released and continue watching with up to `limit` entries each."""
+        try:
+            limit = int(request.query_params.get("limit", HOME_ROW_LIMIT))
+        except (ValueError, TypeError):
+            raise ValidationError({"limit": "Must be a valid number."})
+        if limit < 1:
+            raise ValidationError({"limit": "Must be at least 1."})
+        limit = min(limit, HOME_MAX_ROW_LIMIT)
 
+        profile = get_request_profile(request)
+        data = self.get_catalog_rows(profile.preferred_language if profile else "en", limit)
+        entries = get_continue_watching(profile.id, limit) if profile else []
+        data["continue_watching"] = [serialize_video_progress(p, request) for p in entries]
+        return Response(data, status=status.HTTP_200_OK)
+
+    def get_catalog_rows(self, language, limit):
+        """Genre rows and newly released titles for a language, cached per catalog version."""
+        fields = self.request.query_params.get("fields", "")
+        key = HOME_CACHE_KEY.format(
+            get_catalog_version(), language, limit, fields, self.request.build_absolute_uri("/")
+        )
+        data = cache.get(key)
+        if data is not None:
+            return data
+
+        titles = CatalogEntry.objects.visible().one_per_video(language)
+        genre_rows = {}
+        for entry in CatalogEntry.objects.filter(pk__in=titles.values("pk")).top_per_genre(limit):
+            genre_rows.setdefault(entry.genre, []).append(entry)
+        newly_released = titles.order_by("-release_date", "-created_at")[:limit]
+        data = {
+            "genres": [
+                {"genre": genre, "results": self.get_serializer(entries, many=True).data}
+                for genre, entries in genre_rows.items()
+            ],
+            "newly_released": self.get_serializer(newly_released, many=True).data,
+        }
+        cache.set(key, data, settings.HOME_CACHE_TIMEOUT)
+        return data
+
+
+def get_request_profile(request):
+    """The requesting user's profile from ?profile=<id>, or None when the parameter is absent."""
+    profile_id = request.query_params.get("profile")
+    if not profile_id:
+        return None
+    try:
+        return UserProfiles.objects.only("id", "preferred_language").get(id=profile_id, user_id=request.user.id)
+    except DjangoValidationError:
+        raise ValidationError({"profile": "Must be a valid profile id."})
+    except UserProfiles.DoesNotExist:
+        raise NotFound("Profile not found.")
+
+
+@method_decorator(etag(catalog_etag), name="get")
 class VideoFileDetailView(generics.RetrieveAPIView):
     """Retrieve a single published and ready video file."""
 
+    authentication_classes = [JWTStatelessUserAuthentication]
     queryset = VideoFile.objects.published_and_ready()
     serializer_class = VideoFileSerializer
 
+    def get_queryset(self):
+        """Prefetches only the relations behind the requested fields."""
+        return self.serializer_class.prefetch_for_request(super().get_queryset(), self.request)
 
+
+@method_decorator(etag(catalog_etag), name="get")
 class GenreVideoCountView(generics.GenericAPIView):
     """Return video count for each genre."""
 
+    authentication_classes = [JWTStatelessUserAuthentication]
+
     def get(self, request):
         queryset = Genres.objects.annotate(video_count=Count("videos"))
         data = {genres.name.lower(): genres.video_count for genres in queryset}
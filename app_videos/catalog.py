@@ -0,0 +1,162 @@
+import logging
+from datetime import datetime, time, timedelta
+from time import time_ns
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from redis.exceptions import RedisError
+from core.utils.queues import get_registered_queue, get_stage_queue_name
+from app_videos.models import CatalogEntry, Video, VideoFile
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION_KEY = "catalog:version"
+NEW_RELEASE_DAYS = 90
+
+
+def get_catalog_version():
+    """
+    Return the current catalog version; it increases with every catalog event.
+    A lost counter restarts at the current time in milliseconds, so versions keep increasing.
+    """
+    return cache.get_or_set(CATALOG_VERSION_KEY, _initial_catalog_version, timeout=None)
+
+
+def bump_catalog_version():
+    """Move the catalog to a new version so cached catalog responses and ETags are not reused."""
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        cache.set(CATALOG_VERSION_KEY, _initial_catalog_version(), timeout=None)
+
+
+def _initial_catalog_version():
+    return time_ns() // 1_000_000
+
+
+def build_catalog_entry(video_file, genres, available_languages):
+    """Return an unsaved catalog entry for a ready file of a published video."""
+    video = video_file.video
+    visible_from = timezone.make_aware(datetime.combine(video.release_date, time.min))
+    new_until = timezone.make_aware(
+        datetime.combine(video.release_date + timedelta(days=NEW_RELEASE_DAYS + 1), time.min)
+    )
+    now = timezone.now()
+    return CatalogEntry(
+        video_file=video_file,
+        video=video,
+        title=video_file.display_title,
+        description=video_file.display_description,
+        video_title=video.title,
+        genres=genres,
+        language=video_file.language,
+        available_languages=available_languages,
+        duration=video_file.duration,
+        thumbnail_path=video_file.thumbnail.url if video_file.thumbnail else "",
+        preview_path=video_file.preview_file.url if video_file.preview_file else "",
+        hls_master_path=video_file.hls_master_path.name if video_file.hls_master_path else "",
+        dash_manifest_path=video_file.dash_manifest_path.name if video_file.dash_manifest_path else "",
+        release_date=video.release_date,
+        visible_from=visible_from,
+        is_visible=visible_from <= now,
+        new_until=new_until,
+        is_new=now < new_until,
+        created_at=video_file.created_at,
+        updated_at=video_file.updated_at,
+    )
+
+
+def refresh_video_catalog(video_id):
+    """
+    Rebuild the catalog entries of one video inside the current transaction.
+    Nothing is written when the entries would not change; otherwise the catalog version moves on
+    after commit, and a future release and the end of its newly released window are scheduled.
+    Refreshes of the same video are serialized by a lock on its row, as jobs on different queues
+    save its files concurrently and a second delete would not see the first one's new entries.
+    """
+    with transaction.atomic():
+        list(Video.objects.select_for_update().filter(pk=video_id).values_list("pk", flat=True))
+        current = CatalogEntry.objects.filter(video_id=video_id)
+        entries = build_video_entries(video_id)
+        if _entry_states(current) == _entry_states(entries):
+            return
+        transaction.on_commit(bump_catalog_version, robust=True)
+        current.delete()
+        if not entries:
+            return
+        entries = CatalogEntry.objects.bulk_create(entries)
+        if not entries[0].is_visible:
+            visible_from = entries[0].visible_from
+            transaction.on_commit(lambda: schedule_release(visible_from), robust=True)
+        if entries[0].is_new:
+            new_until = entries[0].new_until
+            transaction.on_commit(lambda: schedule_new_release_expiry(new_until), robust=True)
+
+
+def build_video_entries(video_id):
+    """Return the unsaved catalog entries of a video: its ready files, if it is published and dated."""
+    video_files = list(VideoFile.objects.filter(video_id=video_id, is_ready=True).select_related("video"))
+    if not video_files:
+        return []
+    video = video_files[0].video
+    if not video.is_published or not video.release_date:
+        return []
+    genres = list(video.genres.order_by("id").values_list("name", flat=True))
+    available_languages = {vf.language: str(vf.id) for vf in video_files}
+    return [build_catalog_entry(vf, genres, available_languages) for vf in video_files]
+
+
+def _entry_states(entries):
+    """
+    Field values of entries by video file, to detect whether a refresh changes anything.
+    updated_at is left out, so re-saving a file without changes does not move the catalog version.
+    """
+    fields = [f.attname for f in CatalogEntry._meta.concrete_fields if f.name != "updated_at"]
+    return {entry.video_file_id: [getattr(entry, name) for name in fields] for entry in entries}
+
+
+def schedule_release(visible_from):
+    """
+    Schedule release activation for a boundary. Videos released at the same
+    moment share one job, as its id is derived from the timestamp.
+    """
+    _schedule_catalog_event(visible_from, activate_due_releases, "catalog-release")
+
+
+def schedule_new_release_expiry(new_until):
+    """Schedule the end of a newly released window; shared per boundary like releases."""
+    _schedule_catalog_event(new_until, expire_new_releases, "catalog-new-until")
+
+
+def _schedule_catalog_event(when, func, job_prefix):
+    queue = get_registered_queue(get_stage_queue_name("release"))
+    try:
+        queue.enqueue_at(when, func, job_id=f"{job_prefix}-{int(when.timestamp())}")
+    except RedisError as e:
+        logger.error("Error scheduling %s at %s: %s", func.__name__, when, e)
+
+
+def activate_due_releases():
+    """Make entries whose release time has passed visible; returns how many were activated."""
+    activated = CatalogEntry.objects.due().update(is_visible=True)
+    if activated:
+        bump_catalog_version()
+    return activated
+
+
+def expire_new_releases():
+    """Clear the newly released flag of entries whose window has ended; returns how many expired."""
+    expired = CatalogEntry.objects.new_release_expired().update(is_new=False)
+    if expired:
+        bump_catalog_version()
+    return expired
+
+
+def rebuild_catalog():
+    """Rebuild the whole catalog read model; returns the number of entries."""
+    with transaction.atomic():
+        CatalogEntry.objects.all().delete()
+        video_ids = VideoFile.objects.filter(is_ready=True).values_list("video_id", flat=True).distinct()
+        for video_id in video_ids:
+            refresh_video_catalog(video_id)
+    return CatalogEntry.objects.count()
@@ -0,0 +1,100 @@
+import logging
+from redis.exceptions import RedisError
+from core.utils.redis_client import get_redis_connection
+from app_videos.models import VideoProgress
+
+logger = logging.getLogger(__name__)
+
+CONTINUE_WATCHING_KEY = "continue_watching:{}"
+CONTINUE_WATCHING_MAX_ENTRIES = 50
+CONTINUE_WATCHING_TTL = 60 * 60 * 24 * 30
+BUILT_MARKER = "__built__"
+
+# Only touch sets that were built from the database, so a partial set is never read as complete.
+UPDATE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+if ARGV[1] == '' then
+    redis.call('ZREM', KEYS[1], ARGV[2])
+else
+    redis.call('ZADD', KEYS[1], ARGV[1], ARGV[2])
+    redis.call('ZREMRANGEBYRANK', KEYS[1], 1, -tonumber(ARGV[3]) - 1)
+end
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return 1
+"""
+
+
+def in_progress_queryset(profile_id):
+    """Started progress entries, most recent first. Completed entries are never started."""
+    return (
+        VideoProgress.objects.filter(profile_id=profile_id, is_started=True)
+        .select_related("video_file__video")
+        .order_by("-last_watched")
+    )
+
+
+def record_progress(progress):
+    """Add, move or remove a progress entry in the profile's sorted set."""
+    score = progress.last_watched.timestamp() if progress.is_started else ""
+    _run_update(progress.profile_id, progress.video_file_id, score)
+
+
+def remove_progress(profile_id, video_file_id):
+    """Remove a progress entry from the profile's sorted set."""
+    _run_update(profile_id, video_file_id, "")
+
+
+def _run_update(profile_id, video_file_id, score):
+    try:
+        connection = get_redis_connection()
+        connection.eval(
+            UPDATE_SCRIPT,
+            1,
+            CONTINUE_WATCHING_KEY.format(profile_id),
+            score,
+            str(video_file_id),
+            CONTINUE_WATCHING_MAX_ENTRIES,
+            CONTINUE_WATCHING_TTL,
+        )
+    except RedisError as e:
+        logger.error("Error updating continue watching for profile %s: %s", profile_id, e)
+
+
+def get_continue_watching(profile_id, limit):
+    """
+    Return up to `limit` in-progress entries, hydrated in one query.
+    Falls back to the database and rebuilds the set on a cache miss.
+    """
+    key = CONTINUE_WATCHING_KEY.format(profile_id)
+    try:
+        pipe = get_redis_connection().pipeline()
+        pipe.exists(key)
+        pipe.zrevrangebyscore(key, "+inf", "(0", start=0, num=limit)
+        exists, video_file_ids = pipe.execute()
+    except RedisError:
+        return list(in_progress_queryset(profile_id)[:limit])
+
+    if not exists:
+        entries = list(in_progress_queryset(profile_id)[:CONTINUE_WATCHING_MAX_ENTRIES])
+        _rebuild(key, entries)
+        return entries[:limit]
+
+    video_file_ids = [video_file_id.decode() for video_file_id in video_file_ids]
+    entries = in_progress_queryset(profile_id).filter(video_file_id__in=video_file_ids)
+    return sorted(entries, key=lambda p: video_file_ids.index(str(p.video_file_id)))
+
+
+def _rebuild(key, entries):
+    """Replace the sorted set with the given entries plus the built marker."""
+    members = {BUILT_MARKER: 0}
+    members.update({str(p.video_file_id): p.last_watched.timestamp() for p in entries})
+    try:
+        pipe = get_redis_connection().pipeline()
+        pipe.delete(key)
+        pipe.zadd(key, members)
+        pipe.expire(key, CONTINUE_WATCHING_TTL)
+        pipe.execute()
+    except RedisError:
+        pass
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from app_videos.catalog import activate_due_releases, expire_new_releases
+
+
+class Command(BaseCommand):
+    help = (
+        "Activate catalog entries whose release time has passed and end expired newly released windows "
+        "(fallback for missed scheduled jobs)"
+    )
+
+    def handle(self, *args, **kwargs):
+        count = activate_due_releases()
+        self.stdout.write(self.style.SUCCESS(f"{count} catalog entries released."))
+        count = expire_new_releases()
+        self.stdout.write(self.style.SUCCESS(f"{count} catalog entries no longer newly released."))
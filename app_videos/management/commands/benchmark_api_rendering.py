@@ -0,0 +1,79 @@
+import statistics
+import time
+import uuid
+from datetime import timedelta
+import brotli
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from django.utils import timezone
+from django.utils.text import compress_string
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from app_videos.api.serializers import CatalogEntrySerializer
+from app_videos.models import CatalogEntry
+from core.utils.renderers import ORJSONRenderer
+
+
+class Command(BaseCommand):
+    help = "Benchmark serialize + render time and response size of catalog list pages per renderer and encoding"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page-sizes", type=int, nargs="+", default=[10, 100], help="List page sizes to render")
+        parser.add_argument("--rounds", type=int, default=50, help="Timed rounds per page size and renderer")
+
+    @override_settings(ALLOWED_HOSTS=["videoflix.example.com"])
+    def handle(self, *args, **options):
+        request = Request(APIRequestFactory().get("/api/videos/", HTTP_HOST="videoflix.example.com"))
+        for page_size in options["page_sizes"]:
+            entries = self._build_entries(page_size)
+            for renderer in (JSONRenderer(), ORJSONRenderer()):
+                timings, content = self._run(renderer, entries, request, options["rounds"])
+                serialize_ms, render_ms = (statistics.median(t) * 1000 for t in zip(*timings))
+                self.stdout.write(
+                    f"{page_size:>4} entries {type(renderer).__name__:>14}: "
+                    f"serialize {serialize_ms:7.2f} ms, render {render_ms:6.2f} ms, "
+                    f"{len(content):>7} B raw, {len(compress_string(content)):>6} B gzip, "
+                    f"{len(brotli.compress(content, quality=5)):>6} B br"
+                )
+
+    def _run(self, renderer, entries, request, rounds):
+        """Per-round (serialize, render) timings and the rendered bytes."""
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            data = CatalogEntrySerializer(entries, many=True, context={"request": request}).data
+            serialized = time.perf_counter()
+            content = renderer.render({"count": len(entries), "next": None, "previous": None, "results": data})
+            timings.append((serialized - start, time.perf_counter() - serialized))
+        return timings, content
+
+    def _build_entries(self, count):
+        """Unsaved catalog entries shaped like production rows; no database access needed."""
+        now = timezone.now()
+        entries = []
+        for i in range(count):
+            video_file_id, slug = uuid.uuid4(), f"title-{i}"
+            entries.append(
+                CatalogEntry(
+                    video_file_id=video_file_id,
+                    video_id=uuid.uuid4(),
+                    title=f"Title {i}",
+                    description="A longer synopsis of the title that is shown on the detail page. " * 3,
+                    video_title=f"Title {i}",
+                    genres=["Action", "Drama"],
+                    language="en",
+                    available_languages={"en": str(video_file_id), "de": str(uuid.uuid4())},
+                    duration=5400.0,
+                    thumbnail_path=f"/media/thumbnails/{slug}.jpg",
+                    preview_path=f"/media/previews/{slug}.mp4",
+                    hls_master_path=f"/media/hls/{slug}/en/master.m3u8",
+                    dash_manifest_path=f"/media/hls/{slug}/en/manifest.mpd",
+                    release_date=now.date(),
+                    visible_from=now,
+                    is_visible=True,
+                    created_at=now - timedelta(days=i),
+                    updated_at=now,
+                )
+            )
+        return entries
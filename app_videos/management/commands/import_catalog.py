@@ -0,0 +1,167 @@
+import csv
+import json
+from datetime import date
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.text import slugify
+from app_videos.models import Genres, Video, VideoFile
+from app_videos.signals import enqueue_file_checks
+
+
+class Command(BaseCommand):
+    help = "Import videos, genres and video files from a CSV or JSON manifest"
+
+    CSV_LIST_SEPARATOR = "|"
+
+    def add_arguments(self, parser):
+        parser.add_argument("manifest", help="Path to a .csv or .json manifest")
+        parser.add_argument("--batch-size", type=int, default=500, help="Rows per INSERT")
+        parser.add_argument("--rate", type=int, default=20, help="Processing jobs started per second")
+        parser.add_argument("--skip-processing", action="store_true", help="Do not enqueue processing jobs")
+
+    def handle(self, *args, **options):
+        if options["rate"] < 1:
+            raise CommandError("--rate must be at least 1 job per second.")
+        entries = self.read_manifest(Path(options["manifest"]))
+        self.validate_entries(entries)
+        batch_size = options["batch_size"]
+
+        with transaction.atomic():
+            genres = self.import_genres(entries, batch_size)
+            videos = self.import_videos(entries, batch_size)
+            self.link_genres(entries, videos, genres, batch_size)
+            video_files = self.import_video_files(entries, videos, batch_size)
+
+        self.stdout.write(self.style.SUCCESS(f"{len(videos)} videos and {len(video_files)} video files imported."))
+
+        if video_files and not options["skip_processing"]:
+            video_file_ids = [vf.id for vf in video_files]
+            enqueue_file_checks(video_file_ids, options["rate"])
+            self.stdout.write(f"{len(video_file_ids)} processing jobs scheduled at {options['rate']}/s.")
+
+    def read_manifest(self, path):
+        """Return manifest entries as dicts with a `files` list each."""
+        if not path.exists():
+            raise CommandError(f"Manifest {path} does not exist.")
+        if path.suffix == ".json":
+            with path.open(encoding="utf-8") as f:
+                return json.load(f)
+        if path.suffix == ".csv":
+            return self.group_csv_rows(path)
+        raise CommandError("Manifest must be a .csv or .json file.")
+
+    def group_csv_rows(self, path):
+        """Group CSV rows (one per video file) into video entries keyed by slug."""
+        entries = {}
+        with path.open(encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                slug = row.get("slug") or slugify(row.get("title", ""))
+                entry = entries.setdefault(
+                    slug,
+                    {
+                        "title": row.get("title", ""),
+                        "slug": slug,
+                        "description": row.get("description", ""),
+                        "release_date": row.get("release_date") or None,
+                        "is_published": row.get("is_published", "").lower() in ("1", "true", "yes"),
+                        "genres": [
+                            g.strip() for g in row.get("genres", "").split(self.CSV_LIST_SEPARATOR) if g.strip()
+                        ],
+                        "files": [],
+                    },
+                )
+                entry["files"].append(
+                    {
+                        "language": row.get("language") or "en",
+                        "original_file": row.get("original_file", ""),
+                        "localized_title": row.get("localized_title", ""),
+                        "localized_description": row.get("localized_description", ""),
+                    }
+                )
+        return list(entries.values())
+
+    def validate_entries(self, entries):
+        """
+        Reject missing titles and files, malformed release dates, duplicate slugs,
+        duplicate languages per video and unknown languages before writing.
+        """
+        languages = {code for code, _ in VideoFile.LANGUAGE_CHOICES}
+        errors, slugs = [], set()
+        for index, entry in enumerate(entries, start=1):
+            entry["slug"] = entry.get("slug") or slugify(entry.get("title") or "")
+            label = entry["slug"] or f"entry {index}"
+            if not entry.get("title"):
+                errors.append(f"{label}: missing title")
+            if entry.get("release_date"):
+                try:
+                    entry["release_date"] = date.fromisoformat(entry["release_date"])
+                except (TypeError, ValueError):
+                    errors.append(f"{label}: invalid release_date {entry['release_date']!r}")
+            if entry["slug"] in slugs:
+                errors.append(f"{label}: duplicate slug")
+            slugs.add(entry["slug"])
+            seen = set()
+            for file_entry in entry.get("files", []):
+                if not file_entry.get("original_file"):
+                    errors.append(f"{label}: file without original_file")
+                language = file_entry.setdefault("language", "en")
+                if language not in languages:
+                    errors.append(f"{label}: unknown language {language!r}")
+                elif language in seen:
+                    errors.append(f"{label}: duplicate language {language!r}")
+                seen.add(language)
+        if errors:
+            raise CommandError("Invalid manifest:\n" + "\n".join(errors))
+
+    def import_genres(self, entries, batch_size):
+        """Create missing genres and return all referenced genres by name."""
+        names = {name for entry in entries for name in entry.get("genres", [])}
+        Genres.objects.bulk_create([Genres(name=name) for name in names], batch_size=batch_size, ignore_conflicts=True)
+        return {genre.name: genre for genre in Genres.objects.filter(name__in=names)}
+
+    def import_videos(self, entries, batch_size):
+        """Create videos whose slug does not exist yet; return them by slug."""
+        existing = set(Video.objects.filter(slug__in=[e["slug"] for e in entries]).values_list("slug", flat=True))
+        videos = [
+            Video(
+                title=entry["title"],
+                slug=entry["slug"],
+                description=entry.get("description", ""),
+                release_date=entry.get("release_date") or None,
+                is_published=bool(entry.get("is_published", False)),
+            )
+            for entry in entries
+            if entry["slug"] not in existing
+        ]
+        Video.objects.bulk_create(videos, batch_size=batch_size)
+        if existing:
+            self.stdout.write(self.style.WARNING(f"{len(existing)} videos already exist and were skipped."))
+        return {video.slug: video for video in videos}
+
+    def link_genres(self, entries, videos, genres, batch_size):
+        """Insert the video-genre through rows for the imported videos."""
+        through = Video.genres.through
+        links = [
+            through(video_id=videos[entry["slug"]].id, genres_id=genres[name].id)
+            for entry in entries
+            if entry["slug"] in videos
+            for name in entry.get("genres", [])
+        ]
+        through.objects.bulk_create(links, batch_size=batch_size, ignore_conflicts=True)
+
+    def import_video_files(self, entries, videos, batch_size):
+        """Create the video files of the imported videos without firing post_save."""
+        video_files = [
+            VideoFile(
+                video=videos[entry["slug"]],
+                language=file_entry["language"],
+                original_file=file_entry["original_file"],
+                localized_title=file_entry.get("localized_title", ""),
+                localized_description=file_entry.get("localized_description", ""),
+            )
+            for entry in entries
+            if entry["slug"] in videos
+            for file_entry in entry.get("files", [])
+        ]
+        return VideoFile.objects.bulk_create(video_files, batch_size=batch_size)
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from app_videos.catalog import rebuild_catalog
+
+
+class Command(BaseCommand):
+    help = "Rebuild the denormalized catalog table served by the public video list"
+
+    def handle(self, *args, **kwargs):
+        count = rebuild_catalog()
+        self.stdout.write(self.style.SUCCESS(f"{count} catalog entries built."))
@@ -27,9 +27,7 @@ class Command(BaseCommand):
     ]
 
     def handle(self, *args, **kwargs):
-        created = 0
-        for genres_name in self.GENRES:
-            obj, was_created = Genres.objects.get_or_create(name=genres_name)
-            if was_created:
-                created += 1
+        existing = Genres.objects.count()
+        Genres.objects.bulk_create([Genres(name=name) for name in self.GENRES], ignore_conflicts=True)
+        created = Genres.objects.count() - existing
         self.stdout.write(self.style.SUCCESS(f"{created} genres created."))
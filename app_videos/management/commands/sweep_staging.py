@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from app_videos.tasks import DirectoryManager
+
+
+class Command(BaseCommand):
+    help = "Remove staging directories left behind by killed processing jobs (run on worker start)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-age",
+            type=int,
+            default=settings.RQ_PROCESSING_TIMEOUT,
+            help="Seconds after which a staging directory is stale (default: the job timeout)",
+        )
+
+    def handle(self, *args, **options):
+        count = DirectoryManager.sweep_staging_directories(options["max_age"])
+        self.stdout.write(self.style.SUCCESS(f"{count} stale staging directories removed."))
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.1 on 2026-10-19 06:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_users", "0006_remove_customusermodel_email_verification_token_and_more"),
+        ("app_videos", "0012_videoprogress_completion_count_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="videoprogress",
+            index=models.Index(
+                condition=models.Q(("is_started", True)),
+                fields=["profile", "-last_watched"],
+                name="progress_continue_watching_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-19 06:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_users", "0006_remove_customusermodel_email_verification_token_and_more"),
+        ("app_videos", "0013_videoprogress_progress_continue_watching_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="videoprogress",
+            index=models.Index(fields=["profile", "-last_watched", "-id"], name="progress_history_idx"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-19 06:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_users", "0007_customusermodel_user_created_at_idx"),
+        ("app_videos", "0014_videoprogress_progress_history_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="videoprogress",
+            index=models.Index(fields=["-last_watched"], name="progress_last_watched_idx"),
+        ),
+    ]
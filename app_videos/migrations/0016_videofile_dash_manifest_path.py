@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-19 06:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_videos", "0015_videoprogress_progress_last_watched_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="videofile",
+            name="dash_manifest_path",
+            field=models.FileField(blank=True, null=True, upload_to=""),
+        ),
+    ]
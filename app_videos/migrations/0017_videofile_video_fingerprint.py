@@ -0,0 +1,22 @@
+# Generated by Django 5.2.1 on 2026-10-19 06:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_videos", "0016_videofile_dash_manifest_path"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="videofile",
+            name="video_fingerprint",
+            field=models.CharField(
+                blank=True,
+                help_text="MD5 of the video stream; language variants with the same value share HLS video",
+                max_length=32,
+            ),
+        ),
+    ]
@@ -0,0 +1,98 @@
+# Generated by Django 5.2.1 on 2026-10-19 06:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_videos", "0017_videofile_video_fingerprint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CatalogEntry",
+            fields=[
+                (
+                    "video_file",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="catalog_entry",
+                        serialize=False,
+                        to="app_videos.videofile",
+                    ),
+                ),
+                (
+                    "title",
+                    models.CharField(
+                        help_text="Localized title, falling back to the video title",
+                        max_length=255,
+                    ),
+                ),
+                ("description", models.TextField(blank=True)),
+                (
+                    "video_title",
+                    models.CharField(
+                        help_text="Original video title, used for search",
+                        max_length=255,
+                    ),
+                ),
+                ("genres", models.JSONField(default=list, help_text="Genre names")),
+                (
+                    "genre_lookup",
+                    models.TextField(
+                        blank=True,
+                        help_text='Lowercased genre names as "|action|drama|" for filtering',
+                    ),
+                ),
+                ("language", models.CharField(max_length=10)),
+                (
+                    "available_languages",
+                    models.JSONField(
+                        default=dict,
+                        help_text="Ready languages mapped to VideoFile ids",
+                    ),
+                ),
+                ("duration", models.FloatField(default=0.0)),
+                ("thumbnail_path", models.CharField(blank=True, max_length=500)),
+                ("preview_path", models.CharField(blank=True, max_length=500)),
+                ("hls_master_path", models.CharField(blank=True, max_length=500)),
+                ("dash_manifest_path", models.CharField(blank=True, max_length=500)),
+                ("release_date", models.DateField()),
+                (
+                    "visible_from",
+                    models.DateTimeField(help_text="Start of the release date; the entry is listed from then on"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(help_text="Creation time of the VideoFile"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(help_text="Last update of the VideoFile"),
+                ),
+                (
+                    "video",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="catalog_entries",
+                        to="app_videos.video",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Catalog Entry",
+                "verbose_name_plural": "Catalog Entries",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["visible_from", "-created_at"],
+                        name="catalog_visible_idx",
+                    ),
+                    models.Index(fields=["language", "-created_at"], name="catalog_language_idx"),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.1 on 2026-10-19 06:46
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def activate_released_entries(apps, schema_editor):
+    CatalogEntry = apps.get_model("app_videos", "CatalogEntry")
+    CatalogEntry.objects.filter(visible_from__lte=timezone.now()).update(is_visible=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_videos", "0018_catalogentry"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="catalogentry",
+            name="catalog_visible_idx",
+        ),
+        migrations.AddField(
+            model_name="catalogentry",
+            name="is_visible",
+            field=models.BooleanField(
+                default=False,
+                help_text="Set when the release is activated at visible_from",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="catalogentry",
+            index=models.Index(
+                condition=models.Q(("is_visible", True)),
+                fields=["-created_at"],
+                name="catalog_visible_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="catalogentry",
+            index=models.Index(
+                condition=models.Q(("is_visible", False)),
+                fields=["visible_from"],
+                name="catalog_pending_idx",
+            ),
+        ),
+        migrations.RunPython(activate_released_entries, migrations.RunPython.noop),
+    ]
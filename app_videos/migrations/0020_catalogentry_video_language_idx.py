@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-19 06:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_videos", "0019_catalogentry_is_visible"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="catalogentry",
+            index=models.Index(
+                condition=models.Q(("is_visible", True)),
+                fields=["video", "language"],
+                name="catalog_video_language_idx",
+            ),
+        ),
+    ]
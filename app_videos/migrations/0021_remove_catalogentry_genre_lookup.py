@@ -0,0 +1,17 @@
+# Generated by Django 5.2.1 on 2026-10-19 07:24
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_videos", "0020_catalogentry_video_language_idx"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="catalogentry",
+            name="genre_lookup",
+        ),
+    ]
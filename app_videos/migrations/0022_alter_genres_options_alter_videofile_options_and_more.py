@@ -0,0 +1,33 @@
+# Generated by Django 5.2.1 on 2026-10-19 07:31
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_videos", "0021_remove_catalogentry_genre_lookup"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="genres",
+            options={"verbose_name": "Genres", "verbose_name_plural": "Genre"},
+        ),
+        migrations.AlterModelOptions(
+            name="videofile",
+            options={
+                "ordering": ["-created_at"],
+                "verbose_name": "Video File",
+                "verbose_name_plural": "Video Files",
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="videoprogress",
+            options={
+                "ordering": ["-last_watched"],
+                "verbose_name": "Video Progress",
+                "verbose_name_plural": "Video Progress Entries",
+            },
+        ),
+    ]
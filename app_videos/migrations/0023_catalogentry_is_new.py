@@ -0,0 +1,56 @@
+# Generated by Django 5.2.1 on 2026-10-19 08:05
+
+from datetime import datetime, time, timedelta
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def flag_new_releases(apps, schema_editor):
+    CatalogEntry = apps.get_model("app_videos", "CatalogEntry")
+    now = timezone.now()
+    for entry in CatalogEntry.objects.all():
+        entry.new_until = timezone.make_aware(datetime.combine(entry.release_date + timedelta(days=91), time.min))
+        entry.is_new = now < entry.new_until
+        entry.save(update_fields=["new_until", "is_new"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_videos", "0022_alter_genres_options_alter_videofile_options_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="catalogentry",
+            name="is_new",
+            field=models.BooleanField(
+                default=False,
+                help_text="Newly released; cleared when new_until is reached",
+            ),
+        ),
+        migrations.AddField(
+            model_name="catalogentry",
+            name="new_until",
+            field=models.DateTimeField(
+                null=True,
+                help_text="End of the newly released window (90 days after the release date)",
+            ),
+        ),
+        migrations.RunPython(flag_new_releases, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="catalogentry",
+            name="new_until",
+            field=models.DateTimeField(
+                help_text="End of the newly released window (90 days after the release date)",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="catalogentry",
+            index=models.Index(
+                condition=models.Q(("is_new", True)),
+                fields=["new_until"],
+                name="catalog_new_until_idx",
+            ),
+        ),
+    ]
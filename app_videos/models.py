@@ -1,8 +1,8 @@
 import uuid
 from django.db import models
+from django.db.models.functions import RowNumber
 from django.utils.text import slugify
 from django.utils import timezone
-from django.utils.timezone import localtime
 from django.core.validators import MinValueValidator, MaxValueValidator
 
 
@@ -51,11 +51,11 @@ class VideoFileManager(models.Manager):
     """Custom queryset for video files."""
 
     def published_and_ready(self):
-        """Return only published and ready video files."""
-        now = localtime(timezone.now())
-        return self.filter(is_ready=True, video__is_published=True, video__release_date__lte=now).select_related(
-            "video"
-        )
+        """
+        Return only published and ready video files whose release has been activated.
+        Visibility is flipped by a scheduled job at release time, so this query does not depend on the clock.
+        """
+        return self.filter(catalog_entry__is_visible=True).select_related("video")
 
 
 class VideoFile(models.Model):
@@ -76,6 +76,12 @@ class VideoFile(models.Model):
     preview_file = models.FileField(upload_to="previews/", blank=True, null=True, help_text="Preview video file")
     original_file = models.FileField(upload_to="uploads/")
     hls_master_path = models.FileField(blank=True, null=True)
+    dash_manifest_path = models.FileField(blank=True, null=True)
+    video_fingerprint = models.CharField(
+        max_length=32,
+        blank=True,
+        help_text="MD5 of the video stream; language variants with the same value share HLS video",
+    )
     language = models.CharField(choices=LANGUAGE_CHOICES, default="en")
     localized_title = models.CharField(max_length=255, blank=True, help_text="Title in the specific language")
     localized_description = models.TextField(blank=True, help_text="Description in the specific language")
@@ -106,6 +112,124 @@ class VideoFile(models.Model):
         return self.localized_description or self.video.description
 
 
+class CatalogEntryQuerySet(models.QuerySet):
+    """Queryset for the public catalog read model."""
+
+    def visible(self):
+        """Return entries whose release has been activated."""
+        return self.filter(is_visible=True)
+
+    def due(self):
+        """Return hidden entries whose release time has passed."""
+        return self.filter(is_visible=False, visible_from__lte=timezone.now())
+
+    def new_release_expired(self):
+        """Return entries still flagged as newly released whose window has ended."""
+        return self.filter(is_new=True, new_until__lte=timezone.now())
+
+    def one_per_video(self, language, fallback="en"):
+        """
+        Collapse to one entry per video in SQL: the given language, else the fallback,
+        else the most recently added file.
+        """
+        language_rank = models.Case(
+            models.When(language=language, then=0),
+            models.When(language=fallback, then=1),
+            default=2,
+        )
+        return self.annotate(
+            video_row=models.Window(
+                RowNumber(),
+                partition_by=models.F("video_id"),
+                order_by=[language_rank.asc(), models.F("created_at").desc()],
+            )
+        ).filter(video_row=1)
+
+    def top_per_genre(self, limit):
+        """
+        The newest `limit` entries of every genre in one windowed query.
+        Each row is annotated with `genre`; an entry appears once per genre of its video.
+        """
+        return (
+            self.filter(video__genres__isnull=False)
+            .annotate(
+                genre=models.F("video__genres__name"),
+                genre_row=models.Window(
+                    RowNumber(),
+                    partition_by=models.F("video__genres__name"),
+                    order_by=models.F("created_at").desc(),
+                ),
+            )
+            .filter(genre_row__lte=limit)
+            .order_by("genre", "genre_row")
+        )
+
+
+class CatalogEntry(models.Model):
+    """
+    Denormalized read model for the public video list: one row per playable VideoFile.
+    Rebuilt per video whenever the video, its files or its genres change.
+    """
+
+    video_file = models.OneToOneField(
+        VideoFile, on_delete=models.CASCADE, primary_key=True, related_name="catalog_entry"
+    )
+    video = models.ForeignKey(Video, on_delete=models.CASCADE, related_name="catalog_entries")
+    title = models.CharField(max_length=255, help_text="Localized title, falling back to the video title")
+    description = models.TextField(blank=True)
+    video_title = models.CharField(max_length=255, help_text="Original video title, used for search")
+    genres = models.JSONField(default=list, help_text="Genre names")
+    language = models.CharField(max_length=10)
+    available_languages = models.JSONField(default=dict, help_text="Ready languages mapped to VideoFile ids")
+    duration = models.FloatField(default=0.0)
+    thumbnail_path = models.CharField(max_length=500, blank=True)
+    preview_path = models.CharField(max_length=500, blank=True)
+    hls_master_path = models.CharField(max_length=500, blank=True)
+    dash_manifest_path = models.CharField(max_length=500, blank=True)
+    release_date = models.DateField()
+    visible_from = models.DateTimeField(help_text="Start of the release date; the entry is listed from then on")
+    is_visible = models.BooleanField(default=False, help_text="Set when the release is activated at visible_from")
+    new_until = models.DateTimeField(help_text="End of the newly released window (90 days after the release date)")
+    is_new = models.BooleanField(default=False, help_text="Newly released; cleared when new_until is reached")
+    created_at = models.DateTimeField(help_text="Creation time of the VideoFile")
+    updated_at = models.DateTimeField(help_text="Last update of the VideoFile")
+
+    objects = CatalogEntryQuerySet.as_manager()
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "Catalog Entry"
+        verbose_name_plural = "Catalog Entries"
+        indexes = [
+            models.Index(fields=["-created_at"], condition=models.Q(is_visible=True), name="catalog_visible_idx"),
+            models.Index(fields=["visible_from"], condition=models.Q(is_visible=False), name="catalog_pending_idx"),
+            models.Index(fields=["new_until"], condition=models.Q(is_new=True), name="catalog_new_until_idx"),
+            models.Index(
+                fields=["video", "language"], condition=models.Q(is_visible=True), name="catalog_video_language_idx"
+            ),
+            models.Index(fields=["language", "-created_at"], name="catalog_language_idx"),
+        ]
+
+    def __str__(self):
+        """String representation: title and language."""
+        return f"{self.title} – [{self.language}]"
+
+
+class VideoProgressQuerySet(models.QuerySet):
+    """Queryset filters mirroring VideoProgress.status in SQL."""
+
+    STATUS_FILTERS = {
+        "completed": models.Q(is_completed=True),
+        "continue_watching": models.Q(is_completed=False, is_started=True, progress_percentage__gte=5),
+        "just_started": models.Q(is_completed=False, is_started=True, progress_percentage__lt=5),
+        "not_started": models.Q(is_completed=False, is_started=False),
+    }
+
+    def with_status(self, status):
+        """Return entries whose status property would equal the given status."""
+        return self.filter(self.STATUS_FILTERS[status])
+
+
 class VideoProgress(models.Model):
     """Tracks user progress for a video file."""
 
@@ -132,9 +256,20 @@ class VideoProgress(models.Model):
     last_completed = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = VideoProgressQuerySet.as_manager()
+
     class Meta:
         unique_together = ("profile", "video_file")
         ordering = ["-last_watched"]
+        indexes = [
+            models.Index(
+                fields=["profile", "-last_watched"],
+                condition=models.Q(is_started=True),
+                name="progress_continue_watching_idx",
+            ),
+            models.Index(fields=["profile", "-last_watched", "-id"], name="progress_history_idx"),
+            models.Index(fields=["-last_watched"], name="progress_last_watched_idx"),
+        ]
         verbose_name = "Video Progress"
         verbose_name_plural = "Video Progress Entries"
 
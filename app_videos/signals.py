@@ -1,24 +1,115 @@
+import logging
 import time
 import os
 from datetime import timedelta
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
-from django_rq import get_queue
-from .models import VideoFile
+from rq import Retry
+from core.utils.queues import enqueue_job_graph, get_stage_queue
+from .catalog import bump_catalog_version, refresh_video_catalog
+from .continue_watching import record_progress, remove_progress
+from .models import Genres, Video, VideoFile, VideoProgress
 from .tasks import (
+    generate_hls_audio,
     generate_hls_for_resolution,
-    generate_master_playlist_waiting,
     generate_video_preview,
     generate_thumbnail_and_duration,
+    update_video_fingerprint,
 )
 
+# The master playlist waits for audio, so a failed audio job is retried before it gives up
+AUDIO_RETRY = Retry(max=3, interval=[60, 300, 900])
+
+logger = logging.getLogger(__name__)
+
 
 @receiver(post_save, sender=VideoFile)
 def video_file_post_save(sender, instance, created, **kwargs):
     """Signal: enqueue file processing when new VideoFile is created."""
     if created and instance.original_file and not instance.is_ready:
-        queue = get_queue("default", default_timeout=21600)
-        queue.enqueue(check_file_and_start_processing, instance.id)
+        get_stage_queue("probe").enqueue(check_file_and_start_processing, instance.id)
+
+
+@receiver(post_save, sender=VideoFile)
+def video_file_catalog_post_save(sender, instance, **kwargs):
+    """Signal: rebuild the video's catalog entries in the same transaction."""
+    refresh_video_catalog(instance.video_id)
+
+
+@receiver(post_delete, sender=VideoFile)
+def video_file_catalog_post_delete(sender, instance, **kwargs):
+    """
+    Signal: the file's own entry is removed by cascade; sibling entries are
+    rebuilt once the deletion (possibly of several files) has committed.
+    """
+    video_id = instance.video_id
+    transaction.on_commit(lambda: refresh_video_catalog(video_id))
+
+
+@receiver(post_save, sender=Video)
+def video_catalog_post_save(sender, instance, **kwargs):
+    """Signal: rebuild the video's catalog entries in the same transaction."""
+    refresh_video_catalog(instance.id)
+
+
+@receiver(post_delete, sender=Video)
+def video_catalog_post_delete(sender, instance, **kwargs):
+    """Signal: genre counts change with the deleted video's genre links."""
+    transaction.on_commit(bump_catalog_version, robust=True)
+
+
+@receiver(m2m_changed, sender=Video.genres.through)
+def video_genres_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Signal: rebuild catalog entries of videos whose genres changed."""
+    if reverse and action == "pre_clear":
+        instance._catalog_video_ids = list(instance.videos.values_list("id", flat=True))
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        video_ids = [instance.id]
+    elif action == "post_clear":
+        video_ids = getattr(instance, "_catalog_video_ids", [])
+    else:
+        video_ids = pk_set
+    for video_id in video_ids:
+        refresh_video_catalog(video_id)
+
+
+@receiver(post_save, sender=Genres)
+def genre_catalog_post_save(sender, instance, created, **kwargs):
+    """Signal: a renamed genre changes the entries of all its videos; any genre change alters the genre counts."""
+    transaction.on_commit(bump_catalog_version, robust=True)
+    if not created:
+        for video_id in instance.videos.values_list("id", flat=True):
+            refresh_video_catalog(video_id)
+
+
+@receiver(pre_delete, sender=Genres)
+def genre_catalog_pre_delete(sender, instance, **kwargs):
+    """Signal: remember the genre's videos before its links are deleted."""
+    instance._catalog_video_ids = list(instance.videos.values_list("id", flat=True))
+
+
+@receiver(post_delete, sender=Genres)
+def genre_catalog_post_delete(sender, instance, **kwargs):
+    """Signal: rebuild entries of videos that lost the genre."""
+    transaction.on_commit(bump_catalog_version, robust=True)
+    for video_id in getattr(instance, "_catalog_video_ids", []):
+        refresh_video_catalog(video_id)
+
+
+@receiver(post_save, sender=VideoProgress)
+def video_progress_post_save(sender, instance, **kwargs):
+    """Signal: move the entry in the profile's continue-watching set once committed."""
+    transaction.on_commit(lambda: record_progress(instance))
+
+
+@receiver(post_delete, sender=VideoProgress)
+def video_progress_post_delete(sender, instance, **kwargs):
+    """Signal: drop the entry from the profile's continue-watching set once committed."""
+    profile_id, video_file_id = instance.profile_id, instance.video_file_id
+    transaction.on_commit(lambda: remove_progress(profile_id, video_file_id))
 
 
 def check_file_and_start_processing(video_file_id, retry_count=0):
@@ -30,7 +121,7 @@ def check_file_and_start_processing(video_file_id, retry_count=0):
             _restart_file_check(video_file_id, retry_count)
             return
         else:
-            print(f"VideoFile with id {video_file_id} still does not exist after 10 retries. Giving up.")
+            logger.error("VideoFile with id %s still does not exist after 10 retries. Giving up.", video_file_id)
             return
 
     if not _is_file_ready(video_file.original_file):
@@ -38,14 +129,30 @@ def check_file_and_start_processing(video_file_id, retry_count=0):
             _restart_file_check(video_file_id, retry_count)
             return
         else:
-            print(f"File {video_file.original_file.name} is still not ready after 10 retries. Giving up.")
+            logger.error("File %s is still not ready after 10 retries. Giving up.", video_file.original_file.name)
             return
+    update_video_fingerprint(video_file)
     _enqueue_video_processing_jobs(video_file)
 
 
+def enqueue_file_checks(video_file_ids, per_second=20):
+    """
+    Schedule file checks for many video files in one pipelined Redis call.
+    Start times are staggered so at most `per_second` checks start per second.
+    """
+    if per_second < 1:
+        raise ValueError("per_second must be at least 1")
+    queue = get_stage_queue("probe")
+    with queue.connection.pipeline() as pipe:
+        for i, video_file_id in enumerate(video_file_ids):
+            delay = timedelta(seconds=i // per_second)
+            queue.enqueue_in(delay, check_file_and_start_processing, video_file_id, pipeline=pipe)
+        pipe.execute()
+
+
 def _restart_file_check(video_file_id, retry_count):
     """Enqueue a delayed retry for file readiness."""
-    queue = get_queue("default", default_timeout=21600)
+    queue = get_stage_queue("probe")
     delay = min(30 + (retry_count * 30), 360)
     queue.enqueue_in(timedelta(seconds=delay), check_file_and_start_processing, video_file_id, retry_count + 1)
 
@@ -82,15 +189,20 @@ def _is_file_ready(file_field):
         return True
 
     except (ValueError, OSError, AttributeError) as e:
-        print(f"Error checking file readiness: {e}")
+        logger.error("Error checking file readiness: %s", e)
         return False
 
 
 def _enqueue_video_processing_jobs(instance):
-    """Enqueue all video processing jobs for a file."""
-    queue = get_queue("default", default_timeout=21600)
-    queue.enqueue(generate_thumbnail_and_duration, instance.id)
-    queue.enqueue(generate_video_preview, instance.id)
-    for res in ["480p", "720p", "1080p"]:
-        queue.enqueue(generate_hls_for_resolution, instance.id, res)
-    queue.enqueue(generate_master_playlist_waiting, instance.id)
+    """
+    Enqueue all video processing jobs for a file in one Redis transaction, each on the queue its stage is routed to.
+    Audio is encoded once and retried with backoff, as the master playlist waits for it;
+    each rendition republishes the master playlist when it completes.
+    """
+    jobs = [
+        (get_stage_queue("thumbnail"), generate_thumbnail_and_duration, instance.id),
+        (get_stage_queue("preview"), generate_video_preview, instance.id),
+        (get_stage_queue("audio"), generate_hls_audio, instance.id),
+    ]
+    jobs += [(get_stage_queue(res), generate_hls_for_resolution, instance.id, res) for res in ["480p", "720p", "1080p"]]
+    enqueue_job_graph(jobs, retries={generate_hls_audio: AUDIO_RETRY})
@@ -1,17 +1,35 @@
+import fcntl
+import logging
 import time
 import os
+import shutil
 import subprocess
+import tempfile
+from datetime import timedelta
 from django.core.files.base import ContentFile
 from django.conf import settings
 from tempfile import NamedTemporaryFile
+from rq import get_current_job
+from core.utils.queues import get_stage_queue
 from .models import VideoFile
 
+logger = logging.getLogger(__name__)
+
 HLS_RESOLUTIONS = {
     "480p": {"res": "854x480", "bitrate": "800k", "bandwidth": 800000},
     "720p": {"res": "1280x720", "bitrate": "2000k", "bandwidth": 2000000},
     "1080p": {"res": "1920x1080", "bitrate": "5000k", "bandwidth": 5000000},
 }
 
+# H.264 Main profile at level 4.0 (covers 1080p30), as pinned in FFmpegCommandBuilder.build_hls_command
+HLS_VIDEO_CODECS = "avc1.4D4028"
+HLS_AUDIO = {"bitrate": "128k", "bandwidth": 128000, "group_id": "audio", "codecs": "mp4a.40.2"}
+AUDIO_PLAYLIST = "audio.m3u8"
+NO_AUDIO_MARKER = ".noaudio"
+AUDIO_FAILED_MARKER = ".audiofailed"
+# How long a rendition job waits before checking again on a sibling encoding the same rendition
+RENDITION_LOCK_RETRY_DELAY = timedelta(minutes=5)
+
 
 class VideoFileHandler:
     """VideoFile DB access helper."""
@@ -22,7 +40,7 @@ class VideoFileHandler:
         try:
             return VideoFile.objects.get(id=video_file_id)
         except VideoFile.DoesNotExist:
-            print(f"VideoFile with id {video_file_id} does not exist.")
+            logger.error("VideoFile with id %s does not exist.", video_file_id)
             return None
 
 
@@ -30,8 +48,22 @@ class FFmpegCommandBuilder:
     """Builds FFmpeg/FFprobe commands."""
 
     @staticmethod
-    def build_hls_command(input_path, output_dir, resolution_label, settings_dict):
-        """FFmpeg command for HLS."""
+    def build_segment_options(output_dir, label, segment_format="mpegts"):
+        """Segment type and naming for MPEG-TS or fMP4 (CMAF) output."""
+        if segment_format == "fmp4":
+            return [
+                "-hls_segment_type",
+                "fmp4",
+                "-hls_fmp4_init_filename",
+                f"{label}_init.mp4",
+                "-hls_segment_filename",
+                os.path.join(output_dir, f"{label}_%03d.m4s"),
+            ]
+        return ["-hls_segment_filename", os.path.join(output_dir, f"{label}_%03d.ts")]
+
+    @staticmethod
+    def build_hls_command(input_path, output_dir, resolution_label, settings_dict, segment_format="mpegts"):
+        """FFmpeg command for a video-only HLS rendition; audio is encoded once separately."""
         output_file = os.path.join(output_dir, f"{resolution_label}.m3u8")
         scale_filter = f"scale={settings_dict['res']}"
         bitrate = settings_dict["bitrate"]
@@ -43,14 +75,13 @@ class FFmpegCommandBuilder:
             input_path,
             "-vf",
             scale_filter,
-            "-c:a",
-            "aac",
-            "-ar",
-            "48000",
+            "-an",
             "-c:v",
             "h264",
             "-profile:v",
             "main",
+            "-level:v",
+            "4.0",
             "-crf",
             "20",
             "-sc_threshold",
@@ -69,13 +100,55 @@ class FFmpegCommandBuilder:
             bitrate,
             "-bufsize",
             bufsize,
-            "-b:a",
-            "128k",
-            "-hls_segment_filename",
-            os.path.join(output_dir, f"{resolution_label}_%03d.ts"),
+            *FFmpegCommandBuilder.build_segment_options(output_dir, resolution_label, segment_format),
             output_file,
         ]
 
+    @staticmethod
+    def build_audio_command(input_path, output_dir, segment_format="mpegts"):
+        """FFmpeg command for the audio-only HLS rendition shared by all video renditions."""
+        return [
+            "ffmpeg",
+            "-i",
+            input_path,
+            "-map",
+            "0:a:0",
+            "-vn",
+            "-c:a",
+            "aac",
+            "-ar",
+            "48000",
+            "-b:a",
+            HLS_AUDIO["bitrate"],
+            "-hls_time",
+            "4",
+            "-hls_playlist_type",
+            "vod",
+            *FFmpegCommandBuilder.build_segment_options(output_dir, "audio", segment_format),
+            os.path.join(output_dir, AUDIO_PLAYLIST),
+        ]
+
+    @staticmethod
+    def build_audio_probe_command(input_path):
+        """FFprobe command listing audio stream indexes."""
+        return [
+            "ffprobe",
+            "-v",
+            "error",
+            "-select_streams",
+            "a",
+            "-show_entries",
+            "stream=index",
+            "-of",
+            "csv=p=0",
+            input_path,
+        ]
+
+    @staticmethod
+    def build_video_fingerprint_command(input_path):
+        """FFmpeg command hashing the packets of the first video stream without decoding."""
+        return ["ffmpeg", "-v", "error", "-i", input_path, "-map", "0:v:0", "-c", "copy", "-f", "md5", "-"]
+
     @staticmethod
     def build_preview_command(input_path, output_path):
         """FFmpeg command for preview."""
@@ -104,6 +177,22 @@ class FFmpegCommandBuilder:
         """FFmpeg command for thumbnail."""
         return ["ffmpeg", "-y", "-ss", "00:00:10.000", "-i", input_path, "-vframes", "1", output_path]
 
+    @staticmethod
+    def build_frame_rate_command(input_path):
+        """FFprobe command for the average frame rate of the first video stream."""
+        return [
+            "ffprobe",
+            "-v",
+            "error",
+            "-select_streams",
+            "v:0",
+            "-show_entries",
+            "stream=avg_frame_rate",
+            "-of",
+            "default=noprint_wrappers=1:nokey=1",
+            input_path,
+        ]
+
     @staticmethod
     def build_duration_command(input_path):
         """FFprobe command for duration."""
@@ -129,6 +218,20 @@ class DirectoryManager:
         os.makedirs(output_dir, exist_ok=True)
         return output_dir
 
+    @staticmethod
+    def create_video_directory(video_slug, fingerprint):
+        """Create the video rendition dir shared by language variants with the same picture."""
+        output_dir = os.path.join(settings.MEDIA_ROOT, "hls", video_slug, "video", fingerprint)
+        os.makedirs(output_dir, exist_ok=True)
+        return output_dir
+
+    @staticmethod
+    def get_video_directory(video_file):
+        """Video renditions live in the shared dir when fingerprinted, else next to the audio."""
+        if video_file.video_fingerprint:
+            return DirectoryManager.create_video_directory(video_file.video.slug, video_file.video_fingerprint)
+        return DirectoryManager.create_hls_directory(video_file.video.slug, video_file.language)
+
     @staticmethod
     def create_preview_directory(video_slug, language):
         """Create preview output dir."""
@@ -136,6 +239,62 @@ class DirectoryManager:
         os.makedirs(output_dir, exist_ok=True)
         return output_dir
 
+    @staticmethod
+    def create_staging_directory(prefix):
+        """Create a private staging dir outside the served media tree."""
+        os.makedirs(settings.VIDEO_STAGING_ROOT, exist_ok=True)
+        return tempfile.mkdtemp(prefix=f"{prefix}-", dir=settings.VIDEO_STAGING_ROOT)
+
+    @staticmethod
+    def sweep_staging_directories(max_age):
+        """Remove staging dirs older than max_age seconds, left behind by killed jobs; return how many."""
+        if not os.path.isdir(settings.VIDEO_STAGING_ROOT):
+            return 0
+        cutoff = time.time() - max_age
+        stale = [
+            entry.path
+            for entry in os.scandir(settings.VIDEO_STAGING_ROOT)
+            if entry.is_dir(follow_symlinks=False) and entry.stat(follow_symlinks=False).st_mtime < cutoff
+        ]
+        for path in stale:
+            shutil.rmtree(path, ignore_errors=True)
+        return len(stale)
+
+
+class OutputPublisher:
+    """Publishes finished outputs with fsync and atomic renames."""
+
+    @staticmethod
+    def fsync_path(path):
+        """Flush a file or directory to disk."""
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def publish_file(source, destination):
+        """Atomically replace destination with a fully written source file."""
+        OutputPublisher.fsync_path(source)
+        os.replace(source, destination)
+        OutputPublisher.fsync_path(os.path.dirname(destination))
+
+    @staticmethod
+    def publish_rendition(staging_dir, output_dir, playlist_name):
+        """Move segments into place first, then the playlist that references them."""
+        for name in sorted(os.listdir(staging_dir)):
+            if name != playlist_name:
+                OutputPublisher.fsync_path(os.path.join(staging_dir, name))
+                os.replace(os.path.join(staging_dir, name), os.path.join(output_dir, name))
+        OutputPublisher.fsync_path(output_dir)
+        OutputPublisher.publish_file(os.path.join(staging_dir, playlist_name), os.path.join(output_dir, playlist_name))
+
+    @staticmethod
+    def discard(staging_dir):
+        """Remove a staging dir and whatever a failed run left in it."""
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
 
 class FFmpegExecutor:
     """Runs FFmpeg/FFprobe commands."""
@@ -147,7 +306,7 @@ class FFmpegExecutor:
             subprocess.run(command, check=True, stderr=subprocess.PIPE)
             return True
         except subprocess.CalledProcessError as e:
-            print(f"{error_message}: {e}")
+            logger.error("%s: %s", error_message, e)
             return False
 
     @staticmethod
@@ -157,7 +316,7 @@ class FFmpegExecutor:
             result = subprocess.run(command, capture_output=True, text=True, check=True)
             return result.stdout.strip()
         except subprocess.CalledProcessError as e:
-            print(f"{error_message}: {e}")
+            logger.error("%s: %s", error_message, e)
             return None
 
 
@@ -165,28 +324,199 @@ class PlaylistGenerator:
     """Creates/checks HLS playlists."""
 
     @staticmethod
-    def create_master_playlist(output_dir):
-        """Create master playlist file."""
-        master_path = os.path.join(output_dir, "master.m3u8")
+    def is_playlist_complete(playlist_path):
+        """Return True once FFmpeg has finished writing a VOD playlist."""
         try:
-            with open(master_path, "w") as f:
-                f.write("#EXTM3U\n")
-                for label, conf in HLS_RESOLUTIONS.items():
-                    playlist = os.path.join(output_dir, f"{label}.m3u8")
-                    if os.path.exists(playlist):
-                        f.write(
-                            f"#EXT-X-STREAM-INF:BANDWIDTH={conf['bandwidth']},RESOLUTION={conf['res']}\n{label}.m3u8\n"
-                        )
-            return True
+            with open(playlist_path) as f:
+                return "#EXT-X-ENDLIST" in f.read()
+        except OSError:
+            return False
+
+    @staticmethod
+    def get_complete_renditions(output_dir):
+        """Return labels of renditions whose playlists are complete."""
+        return [
+            label
+            for label in HLS_RESOLUTIONS
+            if PlaylistGenerator.is_playlist_complete(os.path.join(output_dir, f"{label}.m3u8"))
+        ]
+
+    @staticmethod
+    def read_playlist_segments(playlist_path):
+        """Return the init segment URI and (duration, uri) pairs of a variant playlist."""
+        init_uri, segments, duration = None, [], None
+        with open(playlist_path) as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("#EXT-X-MAP:"):
+                    init_uri = line.split('URI="', 1)[1].split('"', 1)[0]
+                elif line.startswith("#EXTINF:"):
+                    duration = float(line[len("#EXTINF:") :].split(",", 1)[0])
+                elif line and not line.startswith("#") and duration is not None:
+                    segments.append((duration, line))
+                    duration = None
+        return init_uri, segments
+
+    @staticmethod
+    def get_audio_state(output_dir):
+        """
+        Return "ready", "none" (source without audio), "failed" (audio job gave up after its retries)
+        or None while audio is pending. The master playlist is published without audio for "none" and "failed".
+        """
+        if PlaylistGenerator.is_playlist_complete(os.path.join(output_dir, AUDIO_PLAYLIST)):
+            return "ready"
+        if os.path.exists(os.path.join(output_dir, NO_AUDIO_MARKER)):
+            return "none"
+        if os.path.exists(os.path.join(output_dir, AUDIO_FAILED_MARKER)):
+            return "failed"
+        return None
+
+    @staticmethod
+    def dash_enabled():
+        """DASH manifests need fMP4 segments, which HLS and DASH can share."""
+        return settings.DASH_MANIFEST_ENABLED and settings.HLS_SEGMENT_FORMAT == "fmp4"
+
+    @staticmethod
+    def build_dash_segment_list(playlist_path, uri_prefix=""):
+        """Return a DASH SegmentList for an fMP4 playlist and its total duration, or (None, 0)."""
+        init_uri, segments = PlaylistGenerator.read_playlist_segments(playlist_path)
+        if not init_uri:
+            return None, 0.0
+        timeline = "".join(f'<S d="{round(duration * 1000)}"/>' for duration, _ in segments)
+        urls = "".join(f'<SegmentURL media="{uri_prefix}{uri}"/>' for _, uri in segments)
+        segment_list = (
+            f'<SegmentList timescale="1000"><Initialization sourceURL="{uri_prefix}{init_uri}"/>'
+            f"<SegmentTimeline>{timeline}</SegmentTimeline>{urls}</SegmentList>"
+        )
+        return segment_list, sum(duration for duration, _ in segments)
+
+    @staticmethod
+    def probe_frame_rate(video_dir, playlist_name):
+        """Frame rate of a rendition's first segment as a DASH frameRate ("25", "30000/1001"), or None."""
+        _, segments = PlaylistGenerator.read_playlist_segments(os.path.join(video_dir, playlist_name))
+        if not segments:
+            return None
+        command = FFmpegCommandBuilder.build_frame_rate_command(os.path.join(video_dir, segments[0][1]))
+        frame_rate = FFmpegExecutor.execute_with_output(command, f"Error probing frame rate of {playlist_name}")
+        if not frame_rate or frame_rate.startswith("0/"):
+            return None
+        return frame_rate.removesuffix("/1")
+
+    @staticmethod
+    def build_dash_manifest(output_dir, renditions, audio_language=None, video_dir=None):
+        """Build a static DASH MPD referencing the renditions' fMP4 segments and the shared audio."""
+        video_dir = video_dir or output_dir
+        video_prefix = PlaylistGenerator.get_video_prefix(output_dir, video_dir)
+        representations = []
+        total_duration = 0.0
+        for label in renditions:
+            segment_list, duration = PlaylistGenerator.build_dash_segment_list(
+                os.path.join(video_dir, f"{label}.m3u8"), video_prefix
+            )
+            if not segment_list:
+                continue
+            conf = HLS_RESOLUTIONS[label]
+            width, height = conf["res"].split("x")
+            frame_rate = PlaylistGenerator.probe_frame_rate(video_dir, f"{label}.m3u8")
+            frame_rate_attribute = f' frameRate="{frame_rate}"' if frame_rate else ""
+            representations.append(
+                f'<Representation id="{label}" bandwidth="{conf["bandwidth"]}" codecs="{HLS_VIDEO_CODECS}" '
+                f'width="{width}" height="{height}"{frame_rate_attribute}>{segment_list}</Representation>'
+            )
+            total_duration = max(total_duration, duration)
+        if not representations:
+            return None
+        adaptation_sets = (
+            f'<AdaptationSet mimeType="video/mp4" codecs="{HLS_VIDEO_CODECS}" segmentAlignment="true">'
+            f'{"".join(representations)}</AdaptationSet>'
+        )
+        if audio_language is not None:
+            segment_list, duration = PlaylistGenerator.build_dash_segment_list(os.path.join(output_dir, AUDIO_PLAYLIST))
+            if segment_list:
+                adaptation_sets += (
+                    f'<AdaptationSet mimeType="audio/mp4" codecs="{HLS_AUDIO["codecs"]}" lang="{audio_language}" '
+                    f'segmentAlignment="true"><Representation id="audio" bandwidth="{HLS_AUDIO["bandwidth"]}" '
+                    f'codecs="{HLS_AUDIO["codecs"]}" audioSamplingRate="48000">{segment_list}</Representation>'
+                    "</AdaptationSet>"
+                )
+                total_duration = max(total_duration, duration)
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<MPD xmlns="urn:mpeg:dash:schema:mpd:2011" profiles="urn:mpeg:dash:profile:isoff-main:2011" '
+            f'type="static" mediaPresentationDuration="PT{total_duration:.3f}S" minBufferTime="PT4S">'
+            f"<Period>{adaptation_sets}</Period></MPD>\n"
+        )
+
+    @staticmethod
+    def write_atomic(output_dir, name, content):
+        """Write a small public file via temp file, fsync and rename."""
+        with NamedTemporaryFile("w", dir=output_dir, suffix=".tmp", delete=False) as f:
+            f.write(content)
+        os.chmod(f.name, 0o644)
+        OutputPublisher.publish_file(f.name, os.path.join(output_dir, name))
+
+    @staticmethod
+    def get_video_prefix(output_dir, video_dir):
+        """Relative URI prefix from a language dir to the (possibly shared) video rendition dir."""
+        if os.path.abspath(video_dir) == os.path.abspath(output_dir):
+            return ""
+        return os.path.relpath(video_dir, output_dir).replace(os.sep, "/") + "/"
+
+    @staticmethod
+    def build_master_playlist(renditions, language=None, with_audio=True, video_prefix=""):
+        """Master playlist text; all video renditions reference one shared audio group."""
+        lines = ["#EXTM3U"]
+        audio_attribute = ""
+        if with_audio:
+            group_id = HLS_AUDIO["group_id"]
+            name = dict(VideoFile.LANGUAGE_CHOICES).get(language, language or "Default")
+            language_attribute = f',LANGUAGE="{language}"' if language else ""
+            lines.append(
+                f'#EXT-X-MEDIA:TYPE=AUDIO,GROUP-ID="{group_id}",NAME="{name}"{language_attribute},'
+                f'DEFAULT=YES,AUTOSELECT=YES,URI="{AUDIO_PLAYLIST}"'
+            )
+            audio_attribute = f',AUDIO="{group_id}"'
+        for label in renditions:
+            conf = HLS_RESOLUTIONS[label]
+            bandwidth = conf["bandwidth"] + (HLS_AUDIO["bandwidth"] if with_audio else 0)
+            lines.append(f"#EXT-X-STREAM-INF:BANDWIDTH={bandwidth},RESOLUTION={conf['res']}{audio_attribute}")
+            lines.append(f"{video_prefix}{label}.m3u8")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def create_master_playlist(output_dir, language=None, video_dir=None):
+        """
+        Atomically (re)write the master playlist with all complete renditions.
+        Video renditions are read from `video_dir` when shared between languages.
+        Waits for the audio rendition (or the marker for sources without audio).
+        Returns the rendition labels written, or False on error.
+        """
+        video_dir = video_dir or output_dir
+        try:
+            with open(os.path.join(output_dir, ".master.lock"), "w") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                renditions = PlaylistGenerator.get_complete_renditions(video_dir)
+                audio_state = PlaylistGenerator.get_audio_state(output_dir)
+                if not renditions or audio_state is None:
+                    return []
+                with_audio = audio_state == "ready"
+                video_prefix = PlaylistGenerator.get_video_prefix(output_dir, video_dir)
+                master = PlaylistGenerator.build_master_playlist(renditions, language, with_audio, video_prefix)
+                PlaylistGenerator.write_atomic(output_dir, "master.m3u8", master)
+                if PlaylistGenerator.dash_enabled():
+                    audio_language = (language or "und") if with_audio else None
+                    manifest = PlaylistGenerator.build_dash_manifest(output_dir, renditions, audio_language, video_dir)
+                    if manifest:
+                        PlaylistGenerator.write_atomic(output_dir, "manifest.mpd", manifest)
+            return renditions
         except IOError as e:
-            print(f"Error writing master playlist: {e}")
+            logger.error("Error writing master playlist: %s", e)
             return False
 
     @staticmethod
     def check_playlist_files(output_dir):
-        """Check all playlist files exist."""
-        expected_files = ["480p.m3u8", "720p.m3u8", "1080p.m3u8"]
-        return all(os.path.exists(os.path.join(output_dir, f)) for f in expected_files)
+        """Check all rendition playlists are complete."""
+        return len(PlaylistGenerator.get_complete_renditions(output_dir)) == len(HLS_RESOLUTIONS)
 
 
 # Refactored Tasks
@@ -197,52 +527,187 @@ def generate_hls_for_resolution(video_file_id, resolution_label):
         return
 
     if resolution_label not in HLS_RESOLUTIONS:
-        print(f"Resolution {resolution_label} is not supported.")
+        logger.error("Resolution %s is not supported.", resolution_label)
         return
 
     settings_dict = HLS_RESOLUTIONS[resolution_label]
+    input_path = video_file.original_file.path
+    video_dir = DirectoryManager.get_video_directory(video_file)
+    playlist_name = f"{resolution_label}.m3u8"
+
+    with open(os.path.join(video_dir, f".{resolution_label}.lock"), "w") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            # A language variant is encoding the shared rendition; check back later instead of idling the worker.
+            get_stage_queue(resolution_label).enqueue_in(
+                RENDITION_LOCK_RETRY_DELAY, generate_hls_for_resolution, video_file_id, resolution_label
+            )
+            logger.info(
+                "%s is being encoded for a sibling of video file %s, retrying later.", resolution_label, video_file_id
+            )
+            return
+
+        # The lock holder may have finished the rendition; if that job failed, encode it here.
+
+        if PlaylistGenerator.is_playlist_complete(os.path.join(video_dir, playlist_name)):
+            logger.info("%s already exists for video file %s, skipping encode.", resolution_label, video_file_id)
+            generate_master_playlist(video_file_id)
+            return
+
+        success = _encode_rendition(
+            f"{video_file.id}-{resolution_label}",
+            video_dir,
+            playlist_name,
+            lambda staging_dir: FFmpegCommandBuilder.build_hls_command(
+                input_path, staging_dir, resolution_label, settings_dict, settings.HLS_SEGMENT_FORMAT
+            ),
+            f"Error generating {resolution_label}",
+        )
+
+    if success:
+        logger.info("%s generation completed for video file %s.", resolution_label, video_file_id)
+        for sibling_id in _get_video_sibling_ids(video_file):
+            generate_master_playlist(sibling_id)
+
+
+def _get_video_sibling_ids(video_file):
+    """Ids of the language variants sharing this file's video renditions, itself included."""
+    if not video_file.video_fingerprint:
+        return [video_file.id]
+    return list(
+        VideoFile.objects.filter(
+            video_id=video_file.video_id, video_fingerprint=video_file.video_fingerprint
+        ).values_list("id", flat=True)
+    )
+
+
+def update_video_fingerprint(video_file):
+    """
+    Hash the source's video stream so language variants of one title can share the video ladder.
+    Leaves the fingerprint empty when hashing fails, which keeps the file on its own renditions.
+    """
+    if video_file.video_fingerprint:
+        return video_file.video_fingerprint
+    output = FFmpegExecutor.execute_with_output(
+        FFmpegCommandBuilder.build_video_fingerprint_command(video_file.original_file.path),
+        "Error fingerprinting video stream",
+    )
+    if not output or not output.startswith("MD5="):
+        return ""
+    video_file.video_fingerprint = output[len("MD5=") :]
+    video_file.save(update_fields=["video_fingerprint", "updated_at"])
+    return video_file.video_fingerprint
+
+
+class AudioProcessingError(Exception):
+    """Raised by the audio job so RQ retries it."""
+
+
+def generate_hls_audio(video_file_id):
+    """
+    Encode the audio track once into the HLS audio rendition shared by all video renditions.
+    Failures raise for RQ to retry; after the last attempt the failure is recorded and logged,
+    and the master playlist is published without audio.
+    """
+    video_file = VideoFileHandler.get_video_file(video_file_id)
+    if not video_file:
+        return
+
     input_path = video_file.original_file.path
     output_dir = DirectoryManager.create_hls_directory(video_file.video.slug, video_file.language)
 
-    command = FFmpegCommandBuilder.build_hls_command(input_path, output_dir, resolution_label, settings_dict)
+    if PlaylistGenerator.get_audio_state(output_dir) in ("ready", "none"):
+        generate_master_playlist(video_file_id)
+        return
 
-    success = FFmpegExecutor.execute_command(command, f"Error generating {resolution_label}")
+    audio_streams = FFmpegExecutor.execute_with_output(
+        FFmpegCommandBuilder.build_audio_probe_command(input_path), "Error probing audio streams"
+    )
+    if audio_streams is None:
+        success = False
+    elif not audio_streams:
+        PlaylistGenerator.write_atomic(output_dir, NO_AUDIO_MARKER, "")
+        success = True
+    else:
+        success = _encode_rendition(
+            f"{video_file.id}-audio",
+            output_dir,
+            AUDIO_PLAYLIST,
+            lambda staging_dir: FFmpegCommandBuilder.build_audio_command(
+                input_path, staging_dir, settings.HLS_SEGMENT_FORMAT
+            ),
+            "Error generating audio",
+        )
 
     if success:
-        print(f"{resolution_label} generation completed.")
+        logger.info("Audio generation completed for video file %s.", video_file_id)
+    else:
+        job = get_current_job()
+        if job is not None and job.retries_left:
+            raise AudioProcessingError(f"Audio generation failed for video file {video_file_id}, retrying.")
+        logger.error("Audio generation failed for video file %s; publishing without audio.", video_file_id)
+        PlaylistGenerator.write_atomic(output_dir, AUDIO_FAILED_MARKER, "")
+    generate_master_playlist(video_file_id)
+
+
+def _encode_rendition(staging_prefix, output_dir, playlist_name, build_command, error_message):
+    """Run FFmpeg into a staging dir and publish the rendition on success."""
+    staging_dir = DirectoryManager.create_staging_directory(staging_prefix)
+    try:
+        success = FFmpegExecutor.execute_command(build_command(staging_dir), error_message)
+        if success:
+            OutputPublisher.publish_rendition(staging_dir, output_dir, playlist_name)
+        return success
+    finally:
+        OutputPublisher.discard(staging_dir)
 
 
 def generate_master_playlist(video_file_id):
-    """Generate master playlist for video."""
+    """Publish the master playlist; the file becomes playable with its first complete rendition."""
     video_file = VideoFileHandler.get_video_file(video_file_id)
     if not video_file:
         return
 
     output_dir = DirectoryManager.create_hls_directory(video_file.video.slug, video_file.language)
-
-    if PlaylistGenerator.create_master_playlist(output_dir):
-        video_file.hls_master_path = (
-            f"{settings.MEDIA_URL}hls/{video_file.video.slug}/{video_file.language}/master.m3u8"
-        )
+    video_dir = DirectoryManager.get_video_directory(video_file)
+
+    if PlaylistGenerator.create_master_playlist(output_dir, video_file.language, video_dir):
+        base_path = f"{settings.MEDIA_URL}hls/{video_file.video.slug}/{video_file.language}"
+        hls_master_path = f"{base_path}/master.m3u8"
+        dash_manifest_path = None
+        if os.path.exists(os.path.join(output_dir, "manifest.mpd")) and PlaylistGenerator.dash_enabled():
+            dash_manifest_path = f"{base_path}/manifest.mpd"
+        if (
+            video_file.is_ready
+            and video_file.hls_master_path == hls_master_path
+            and video_file.dash_manifest_path == dash_manifest_path
+        ):
+            return
+        video_file.hls_master_path = hls_master_path
+        video_file.dash_manifest_path = dash_manifest_path
         video_file.is_ready = True
-        video_file.save()
+        video_file.save(update_fields=["hls_master_path", "dash_manifest_path", "is_ready", "updated_at"])
 
 
 def generate_master_playlist_waiting(video_file_id, retries=60, interval=30):
-    """Wait for playlists, then master playlist."""
+    """
+    Wait for playlists, then master playlist.
+    No longer enqueued (renditions publish the master themselves); kept for jobs already queued.
+    """
     video_file = VideoFileHandler.get_video_file(video_file_id)
     if not video_file:
         return
 
-    output_dir = DirectoryManager.create_hls_directory(video_file.video.slug, video_file.language)
+    video_dir = DirectoryManager.get_video_directory(video_file)
 
     for _ in range(retries):
-        if PlaylistGenerator.check_playlist_files(output_dir):
+        if PlaylistGenerator.check_playlist_files(video_dir):
             generate_master_playlist(video_file_id)
             return
         time.sleep(interval)
 
-    print("Master playlist could not be created - files are missing.")
+    logger.error("Master playlist could not be created - files are missing.")
 
 
 def generate_video_preview(video_file_id):
@@ -254,14 +719,24 @@ def generate_video_preview(video_file_id):
     input_path = video_file.original_file.path
     output_dir = DirectoryManager.create_preview_directory(video_file.video.slug, video_file.language)
     output_path = os.path.join(output_dir, "preview.mp4")
+    preview_name = f"previews/{video_file.video.slug}/{video_file.language}/preview.mp4"
 
-    command = FFmpegCommandBuilder.build_preview_command(input_path, output_path)
+    if video_file.preview_file == preview_name and os.path.exists(output_path):
+        return
 
-    success = FFmpegExecutor.execute_command(command, "Error generating video preview")
+    staging_dir = DirectoryManager.create_staging_directory(f"{video_file.id}-preview")
+    try:
+        staging_path = os.path.join(staging_dir, "preview.mp4")
+        command = FFmpegCommandBuilder.build_preview_command(input_path, staging_path)
+        success = FFmpegExecutor.execute_command(command, "Error generating video preview")
+        if success:
+            OutputPublisher.publish_file(staging_path, output_path)
+    finally:
+        OutputPublisher.discard(staging_dir)
 
     if success:
-        video_file.preview_file = f"previews/{video_file.video.slug}/{video_file.language}/preview.mp4"
-        video_file.save()
+        video_file.preview_file = preview_name
+        video_file.save(update_fields=["preview_file", "updated_at"])
 
 
 def generate_thumbnail_and_duration(video_file_id):
@@ -270,9 +745,12 @@ def generate_thumbnail_and_duration(video_file_id):
     if not video_file:
         return
 
+    if video_file.thumbnail and video_file.duration:
+        return
+
     _generate_thumbnail(video_file)
     _get_video_duration(video_file)
-    video_file.save()
+    video_file.save(update_fields=["thumbnail", "duration", "updated_at"])
 
 
 def _generate_thumbnail(video_file):
@@ -289,7 +767,7 @@ def _generate_thumbnail(video_file):
                 video_file.thumbnail.save(f"{video_file.pk}_thumb.jpg", ContentFile(data), save=False)
             os.remove(temp_thumb.name)
     except Exception as e:
-        print(f"Error in thumbnail process: {e}")
+        logger.error("Error in thumbnail process: %s", e)
 
 
 def _get_video_duration(video_file):
@@ -303,6 +781,6 @@ def _get_video_duration(video_file):
         try:
             video_file.duration = float(duration_str)
         except ValueError as e:
-            print(f"Error parsing video duration: {e}")
+            logger.error("Error parsing video duration: %s", e)
     else:
         video_file.duration = 0.0
@@ -1,8 +1,12 @@
 from django.test import TestCase
 from django.contrib.admin.sites import AdminSite
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 from app_videos import admin
 from app_videos.admin import GenreAdmin, VideoAdmin, VideoFileAdmin, VideoFileInline
-from app_videos.models import Genres, Video, VideoFile
+from app_videos.models import Genres, Video, VideoFile, VideoProgress
+from app_users.models import CustomUserModel, UserProfiles
 from django.core.files.uploadedfile import SimpleUploadedFile
 from PIL import Image
 import io
@@ -83,14 +87,16 @@ class VideoFileAdminTest(TestCase):
         from unittest.mock import patch, MagicMock
         from app_videos.utils import get_video_file_status
 
-        with patch("django_rq.get_queue") as mock_get_queue:
+        with patch("app_videos.utils.get_registered_queue") as mock_get_queue:
             mock_queue = MagicMock()
             mock_queue.jobs = []
             mock_queue.failed_job_registry.get_job_ids.return_value = []
             mock_queue.started_job_registry.get_job_ids.return_value = ["jobid1"]
             mock_job = MagicMock()
             mock_job.args = [self.vf.id]
-            mock_queue.fetch_job.side_effect = lambda job_id: mock_job if job_id == "jobid1" else None
+            mock_queue.job_class.fetch_many.side_effect = lambda ids, **kwargs: [
+                mock_job if i == "jobid1" else None for i in ids
+            ]
             mock_get_queue.return_value = mock_queue
             result = get_video_file_status(self.vf)
             self.assertIn("uploading", str(result))
@@ -99,12 +105,12 @@ class VideoFileAdminTest(TestCase):
         self.vf.is_ready = False
         self.vf.save()
 
-        with patch("django_rq.get_queue") as mock_get_queue:
+        with patch("app_videos.utils.get_registered_queue") as mock_get_queue:
             mock_queue = MagicMock()
             mock_queue.jobs = []
             mock_queue.failed_job_registry.get_job_ids.return_value = []
             mock_queue.started_job_registry.get_job_ids.return_value = []
-            mock_queue.fetch_job.return_value = None
+            mock_queue.job_class.fetch_many.return_value = [None]
             mock_get_queue.return_value = mock_queue
             result = get_video_file_status(self.vf)
             self.assertIn("not started", str(result))
@@ -119,10 +125,10 @@ class VideoFileAdminTest(TestCase):
         self.vf.is_ready = False
         self.vf.save()
 
-        with patch("django_rq.get_queue") as mock_get_queue:
+        with patch("app_videos.utils.get_registered_queue") as mock_get_queue:
             mock_queue = MagicMock()
             mock_queue.failed_job_registry.get_job_ids.return_value = ["jobid1"]
-            mock_queue.fetch_job.return_value = MagicMock(args=[self.vf.id])
+            mock_queue.job_class.fetch_many.return_value = [MagicMock(args=[self.vf.id])]
             mock_queue.jobs = []
             mock_get_queue.return_value = mock_queue
             result = self.admin.status_display(self.vf)
@@ -132,12 +138,12 @@ class VideoFileAdminTest(TestCase):
         self.vf.is_ready = False
         self.vf.save()
 
-        with patch("django_rq.get_queue") as mock_get_queue:
+        with patch("app_videos.utils.get_registered_queue") as mock_get_queue:
             mock_queue = MagicMock()
             job = MagicMock(args=[self.vf.id], is_started=True)
             mock_queue.jobs = [job]
             mock_queue.failed_job_registry.get_job_ids.return_value = []
-            mock_queue.fetch_job.return_value = None
+            mock_queue.job_class.fetch_many.return_value = [None]
             mock_get_queue.return_value = mock_queue
             result = self.admin.status_display(self.vf)
             self.assertIn("⏳", str(result))
@@ -146,12 +152,12 @@ class VideoFileAdminTest(TestCase):
         self.vf.is_ready = False
         self.vf.save()
 
-        with patch("django_rq.get_queue") as mock_get_queue:
+        with patch("app_videos.utils.get_registered_queue") as mock_get_queue:
             mock_queue = MagicMock()
             job = MagicMock(args=[self.vf.id], is_started=False)
             mock_queue.jobs = [job]
             mock_queue.failed_job_registry.get_job_ids.return_value = []
-            mock_queue.fetch_job.return_value = None
+            mock_queue.job_class.fetch_many.return_value = [None]
             mock_get_queue.return_value = mock_queue
             result = self.admin.status_display(self.vf)
             self.assertIn("🕒", str(result))
@@ -252,12 +258,12 @@ class VideoFileInlineTest(TestCase):
         self.vf.is_ready = False
         self.vf.save()
 
-        with patch("django_rq.get_queue") as mock_get_queue:
+        with patch("app_videos.utils.get_registered_queue") as mock_get_queue:
             mock_queue = MagicMock()
             mock_queue.jobs = []
             mock_queue.failed_job_registry.get_job_ids.return_value = []
             mock_queue.started_job_registry.get_job_ids.return_value = []
-            mock_queue.fetch_job.return_value = None
+            mock_queue.job_class.fetch_many.return_value = [None]
             mock_get_queue.return_value = mock_queue
             result = get_video_file_status(self.vf)
             self.assertIn("not started", str(result))
@@ -272,10 +278,10 @@ class VideoFileInlineTest(TestCase):
         self.vf.is_ready = False
         self.vf.save()
 
-        with patch("django_rq.get_queue") as mock_get_queue:
+        with patch("app_videos.utils.get_registered_queue") as mock_get_queue:
             mock_queue = MagicMock()
             mock_queue.failed_job_registry.get_job_ids.return_value = ["jobid1"]
-            mock_queue.fetch_job.return_value = MagicMock(args=[self.vf.id])
+            mock_queue.job_class.fetch_many.return_value = [MagicMock(args=[self.vf.id])]
             mock_queue.jobs = []
             mock_get_queue.return_value = mock_queue
             result = self.inline.status_display(self.vf)
@@ -285,12 +291,12 @@ class VideoFileInlineTest(TestCase):
         self.vf.is_ready = False
         self.vf.save()
 
-        with patch("django_rq.get_queue") as mock_get_queue:
+        with patch("app_videos.utils.get_registered_queue") as mock_get_queue:
             mock_queue = MagicMock()
             job = MagicMock(args=[self.vf.id], is_started=True)
             mock_queue.jobs = [job]
             mock_queue.failed_job_registry.get_job_ids.return_value = []
-            mock_queue.fetch_job.return_value = None
+            mock_queue.job_class.fetch_many.return_value = [None]
             mock_get_queue.return_value = mock_queue
             result = self.inline.status_display(self.vf)
             self.assertIn("⏳", str(result))
@@ -299,12 +305,12 @@ class VideoFileInlineTest(TestCase):
         self.vf.is_ready = False
         self.vf.save()
 
-        with patch("django_rq.get_queue") as mock_get_queue:
+        with patch("app_videos.utils.get_registered_queue") as mock_get_queue:
             mock_queue = MagicMock()
             job = MagicMock(args=[self.vf.id], is_started=False)
             mock_queue.jobs = [job]
             mock_queue.failed_job_registry.get_job_ids.return_value = []
-            mock_queue.fetch_job.return_value = None
+            mock_queue.job_class.fetch_many.return_value = [None]
             mock_get_queue.return_value = mock_queue
             result = self.inline.status_display(self.vf)
             self.assertIn("🕒", str(result))
@@ -355,3 +361,43 @@ class VideoFileInlineLine23Test(TestCase):
         result = self.inline.thumbnail_preview(self.vf)
         self.assertIn("<img", str(result))
         self.assertIn('style="height: 80px;"', str(result))
+
+
+class ChangelistQueryCountTest(TestCase):
+    def setUp(self):
+        self.superuser = CustomUserModel.objects.create_superuser(
+            username="admin", email="admin@example.com", password="pw"
+        )
+        self.client.force_login(self.superuser)
+        self.profile = UserProfiles.objects.create(user=self.superuser, profile_name="Admin")
+        self.batches = 0
+
+    def _add_rows(self, count):
+        for _ in range(count):
+            self.batches += 1
+            genre = Genres.objects.create(name=f"Genre {self.batches}")
+            video = Video.objects.create(title=f"Video {self.batches}", description="desc")
+            video.genres.add(genre)
+            video_file = VideoFile.objects.create(
+                video=video, duration=10, original_file="test.mp4", language="en", is_ready=True
+            )
+            VideoProgress.objects.create(profile=self.profile, video_file=video_file, current_time=6)
+
+    def _count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context)
+
+    def test_changelists_use_constant_queries(self):
+        urls = [
+            reverse("admin:app_videos_video_changelist"),
+            reverse("admin:app_videos_videofile_changelist"),
+            reverse("admin:app_videos_genres_changelist"),
+            reverse("admin:app_videos_videoprogress_changelist"),
+        ]
+        self._add_rows(3)
+        baseline = {url: self._count_queries(url) for url in urls}
+        self._add_rows(6)
+        for url in urls:
+            self.assertEqual(self._count_queries(url), baseline[url], url)
@@ -0,0 +1,223 @@
+from datetime import date, timedelta
+from io import StringIO
+from unittest.mock import patch
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, APITestCase
+from app_videos.api.serializers import VideoFileSerializer
+from app_videos.catalog import (
+    activate_due_releases,
+    expire_new_releases,
+    get_catalog_version,
+    rebuild_catalog,
+    refresh_video_catalog,
+)
+from app_users.models import UserProfiles
+from app_videos.models import CatalogEntry, Genres, Video, VideoFile
+
+CustomUserModel = get_user_model()
+
+
+class CatalogEntryTest(APITestCase):
+    def setUp(self):
+        self.user = CustomUserModel.objects.create_user(username="viewer", email="viewer@example.com", password="pw")
+        self.client.force_authenticate(user=self.user)
+        self.action = Genres.objects.create(name="Action")
+        self.video = Video.objects.create(
+            title="Heist", slug="heist", description="desc", is_published=True, release_date=date(2024, 1, 1)
+        )
+        self.video.genres.add(self.action)
+        self.vf_en = VideoFile.objects.create(
+            video=self.video,
+            language="en",
+            is_ready=True,
+            duration=90,
+            hls_master_path="/media/hls/heist/en/master.m3u8",
+        )
+        self.vf_de = VideoFile.objects.create(
+            video=self.video, language="de", is_ready=True, localized_title="Der Coup", duration=90
+        )
+
+    def test_entries_follow_video_files(self):
+        entry = CatalogEntry.objects.get(video_file=self.vf_de)
+        self.assertEqual(entry.title, "Der Coup")
+        self.assertEqual(entry.genres, ["Action"])
+        self.assertEqual(entry.available_languages, {"en": str(self.vf_en.id), "de": str(self.vf_de.id)})
+
+        VideoFile.objects.create(video=self.video, language="fr", is_ready=False)
+        self.assertEqual(CatalogEntry.objects.count(), 2)
+
+    def test_entries_follow_genres(self):
+        drama = Genres.objects.create(name="Drama")
+        drama.videos.add(self.video)
+        self.assertEqual(CatalogEntry.objects.get(video_file=self.vf_en).genres, ["Action", "Drama"])
+
+        self.action.name = "Thriller"
+        self.action.save()
+        self.assertEqual(CatalogEntry.objects.get(video_file=self.vf_en).genres, ["Thriller", "Drama"])
+
+        drama.delete()
+        self.assertEqual(CatalogEntry.objects.get(video_file=self.vf_en).genres, ["Thriller"])
+
+        self.video.genres.clear()
+        self.assertEqual(CatalogEntry.objects.get(video_file=self.vf_en).genres, [])
+
+    def test_unpublished_video_has_no_entries(self):
+        self.video.is_published = False
+        self.video.save()
+        self.assertFalse(CatalogEntry.objects.exists())
+
+    def test_list_matches_video_file_serializer(self):
+        response = self.client.get(reverse("video_list"))
+        self.assertEqual(response.status_code, 200)
+        request = APIRequestFactory().get(reverse("video_list"))
+        expected = VideoFileSerializer(
+            VideoFile.objects.published_and_ready().order_by("-created_at"), many=True, context={"request": request}
+        ).data
+        self.assertEqual(response.json()["results"], [dict(item) for item in expected])
+
+    def test_list_queries_need_no_joins(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("video_list"), {"genres": "action", "language": "en,de"})
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(len(queries), 2)
+        for query in queries:
+            self.assertNotIn("JOIN", query["sql"])
+
+    def test_genre_filter_matches_whole_names_through_genre_links(self):
+        other = Video.objects.create(title="Other", slug="other", is_published=True, release_date=date(2024, 1, 1))
+        other.genres.add(Genres.objects.create(name="Action Comedy"))
+        VideoFile.objects.create(video=other, language="en", is_ready=True, duration=90)
+
+        response = self.client.get(reverse("video_list"), {"genres": "ACTION"})
+        self.assertEqual({item["id"] for item in response.data["results"]}, {str(self.vf_en.id), str(self.vf_de.id)})
+        self.assertEqual(self.client.get(reverse("video_list"), {"genres": "act"}).data["count"], 0)
+
+    def test_future_release_is_hidden_and_scheduled(self):
+        self.video.release_date = date.today() + timedelta(days=2)
+        with (
+            patch("app_videos.catalog.get_registered_queue") as mock_get_queue,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            self.video.save()
+        self.assertEqual(CatalogEntry.objects.filter(is_visible=False).count(), 2)
+        self.assertFalse(VideoFile.objects.published_and_ready().exists())
+        self.assertEqual(self.client.get(reverse("video_list")).data["count"], 0)
+
+        entry = CatalogEntry.objects.first()
+        mock_get_queue.assert_called_with("high")
+        enqueue_at = mock_get_queue.return_value.enqueue_at
+        enqueue_at.assert_any_call(
+            entry.visible_from, activate_due_releases, job_id=f"catalog-release-{int(entry.visible_from.timestamp())}"
+        )
+        enqueue_at.assert_any_call(
+            entry.new_until, expire_new_releases, job_id=f"catalog-new-until-{int(entry.new_until.timestamp())}"
+        )
+
+    def test_newly_released_window_ends_with_scheduled_job(self):
+        self.video.release_date = date.today() - timedelta(days=10)
+        self.video.save()
+        entry = CatalogEntry.objects.get(video_file=self.vf_en)
+        self.assertTrue(entry.is_new)
+        self.assertEqual(timezone.localtime(entry.new_until).date(), self.video.release_date + timedelta(days=91))
+        self.assertEqual(self.client.get(reverse("video_list"), {"newly_released": "true"}).data["count"], 2)
+
+        self.assertEqual(expire_new_releases(), 0)
+        version = get_catalog_version()
+        CatalogEntry.objects.update(new_until=entry.new_until - timedelta(days=91))
+        with patch("app_videos.api.filters.timezone.now", side_effect=AssertionError("clock read")):
+            self.assertEqual(self.client.get(reverse("video_list"), {"newly_released": "true"}).data["count"], 2)
+        self.assertEqual(expire_new_releases(), 2)
+        self.assertEqual(get_catalog_version(), version + 1)
+        self.assertEqual(self.client.get(reverse("video_list"), {"newly_released": "true"}).data["count"], 0)
+
+    def test_activate_due_releases(self):
+        self.video.release_date = date.today() + timedelta(days=2)
+        self.video.save()
+        self.assertEqual(activate_due_releases(), 0)
+
+        version = get_catalog_version()
+        CatalogEntry.objects.update(visible_from=CatalogEntry.objects.first().visible_from - timedelta(days=3))
+        out = StringIO()
+        call_command("activate_due_releases", stdout=out)
+        self.assertIn("2 catalog entries released.", out.getvalue())
+        self.assertIn("0 catalog entries no longer newly released.", out.getvalue())
+        self.assertEqual(get_catalog_version(), version + 1)
+        self.assertEqual(self.client.get(reverse("video_list")).data["count"], 2)
+
+    def test_catalog_version_moves_on_commit(self):
+        version = get_catalog_version()
+        self.vf_en.duration = 95
+        with self.captureOnCommitCallbacks(execute=True):
+            self.vf_en.save()
+        self.assertEqual(get_catalog_version(), version + 1)
+        self.assertEqual(CatalogEntry.objects.get(video_file=self.vf_en).duration, 95)
+
+    def test_catalog_version_stays_when_entries_do_not_change(self):
+        pending = VideoFile.objects.create(video=self.video, language="fr", is_ready=False)
+        version = get_catalog_version()
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.vf_en.save()
+            pending.duration = 60
+            pending.save()
+        self.assertEqual(callbacks, [])
+        self.assertEqual(get_catalog_version(), version)
+
+    def test_refresh_locks_the_video_row(self):
+        with patch("app_videos.catalog.Video") as mock_video:
+            refresh_video_catalog(self.video.id)
+        mock_video.objects.select_for_update.return_value.filter.assert_called_once_with(pk=self.video.id)
+        self.assertEqual(CatalogEntry.objects.count(), 2)
+
+    def test_rebuild_catalog(self):
+        CatalogEntry.objects.all().delete()
+        self.assertEqual(rebuild_catalog(), 2)
+        out = StringIO()
+        call_command("rebuild_catalog", stdout=out)
+        self.assertIn("2 catalog entries built.", out.getvalue())
+
+
+class LanguageCollapsedCatalogTest(APITestCase):
+    def setUp(self):
+        self.user = CustomUserModel.objects.create_user(username="viewer", email="viewer@example.com", password="pw")
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("video_list")
+        released = {"is_published": True, "release_date": date(2024, 1, 1)}
+        self.multi = Video.objects.create(title="Multi", slug="multi", **released)
+        self.files = {
+            language: VideoFile.objects.create(video=self.multi, language=language, is_ready=True)
+            for language in ("fr", "en", "de")
+        }
+        self.french_only = Video.objects.create(title="French", slug="french", **released)
+        self.french_file = VideoFile.objects.create(video=self.french_only, language="fr", is_ready=True)
+
+    def get_ids(self, preferred_language, **params):
+        profile = UserProfiles.objects.create(user=self.user, preferred_language=preferred_language)
+        response = self.client.get(self.url, {"profile": profile.id, **params})
+        self.assertEqual(response.status_code, 200)
+        return sorted(item["id"] for item in response.data["results"])
+
+    def test_one_entry_per_video_in_preferred_language(self):
+        self.assertEqual(self.get_ids("de"), sorted([str(self.files["de"].id), str(self.french_file.id)]))
+        self.assertEqual(self.client.get(self.url).data["count"], 4)
+
+    def test_english_fallback(self):
+        self.assertEqual(self.get_ids("it"), sorted([str(self.files["en"].id), str(self.french_file.id)]))
+
+    def test_collapses_in_sql(self):
+        profile = UserProfiles.objects.create(user=self.user, preferred_language="de")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {"profile": profile.id})
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(len(queries), 3)
+        self.assertIn("ROW_NUMBER", queries[-1]["sql"])
+
+    def test_foreign_or_invalid_profile(self):
+        other = CustomUserModel.objects.create_user(username="other", email="other@example.com", password="pw")
+        profile = UserProfiles.objects.create(user=other)
+        self.assertEqual(self.client.get(self.url, {"profile": profile.id}).status_code, 404)
+        self.assertEqual(self.client.get(self.url, {"profile": "nope"}).status_code, 400)
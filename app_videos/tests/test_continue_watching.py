@@ -0,0 +1,64 @@
+from unittest.mock import patch, MagicMock
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from app_users.models import UserProfiles
+from app_videos import continue_watching
+from app_videos.models import Video, VideoFile, VideoProgress
+
+CustomUserModel = get_user_model()
+
+
+class ContinueWatchingTests(TestCase):
+    def setUp(self):
+        user = CustomUserModel.objects.create_user(username="cwuser", email="cw@example.com", password="pw")
+        self.profile = UserProfiles.objects.create(user=user, profile_name="Profile")
+        video = Video.objects.create(title="Video", description="desc")
+        self.video_file = VideoFile.objects.create(
+            video=video, duration=100, original_file="cw.mp4", language="en", is_ready=True
+        )
+        self.key = f"continue_watching:{self.profile.id}"
+
+    @patch("app_videos.continue_watching.get_redis_connection")
+    def test_record_progress_adds_started_entry(self, mock_conn):
+        progress = VideoProgress.objects.create(profile=self.profile, video_file=self.video_file, current_time=20)
+        continue_watching.record_progress(progress)
+        args = mock_conn.return_value.eval.call_args[0]
+        self.assertEqual(args[2], self.key)
+        self.assertEqual(args[3], progress.last_watched.timestamp())
+        self.assertEqual(args[4], str(self.video_file.id))
+
+    @patch("app_videos.continue_watching.get_redis_connection")
+    def test_record_progress_removes_completed_entry(self, mock_conn):
+        progress = VideoProgress.objects.create(profile=self.profile, video_file=self.video_file, current_time=95)
+        continue_watching.record_progress(progress)
+        self.assertEqual(mock_conn.return_value.eval.call_args[0][3], "")
+
+    @patch("app_videos.continue_watching.get_redis_connection")
+    def test_cache_miss_rebuilds_set_with_marker(self, mock_conn):
+        progress = VideoProgress.objects.create(profile=self.profile, video_file=self.video_file, current_time=20)
+        pipe = MagicMock()
+        pipe.execute.return_value = [0, []]
+        mock_conn.return_value.pipeline.return_value = pipe
+
+        entries = continue_watching.get_continue_watching(self.profile.id, 10)
+
+        self.assertEqual(entries, [progress])
+        pipe.zadd.assert_called_once_with(
+            self.key,
+            {continue_watching.BUILT_MARKER: 0, str(self.video_file.id): progress.last_watched.timestamp()},
+        )
+
+    def test_progress_save_updates_set_on_commit(self):
+        with patch("app_videos.signals.record_progress") as mock_record:
+            with self.captureOnCommitCallbacks(execute=True):
+                progress = VideoProgress.objects.create(
+                    profile=self.profile, video_file=self.video_file, current_time=20
+                )
+        mock_record.assert_called_once_with(progress)
+
+    def test_progress_delete_updates_set_on_commit(self):
+        progress = VideoProgress.objects.create(profile=self.profile, video_file=self.video_file, current_time=20)
+        with patch("app_videos.signals.remove_progress") as mock_remove:
+            with self.captureOnCommitCallbacks(execute=True):
+                progress.delete()
+        mock_remove.assert_called_once_with(self.profile.id, self.video_file.id)
@@ -0,0 +1,146 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from app_videos.models import Genres, Video, VideoFile
+
+
+class ImportCatalogCommandTest(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        Genres.objects.create(name="Drama")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _write(self, name, content):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    @patch("app_videos.management.commands.import_catalog.enqueue_file_checks")
+    def test_import_json(self, mock_enqueue):
+        manifest = [
+            {
+                "title": "First Movie",
+                "description": "desc",
+                "release_date": "2024-01-01",
+                "is_published": True,
+                "genres": ["Drama", "Action"],
+                "files": [
+                    {"language": "en", "original_file": "uploads/first_en.mp4"},
+                    {"language": "de", "original_file": "uploads/first_de.mp4", "localized_title": "Erster Film"},
+                ],
+            },
+            {"title": "Second Movie", "files": [{"language": "en", "original_file": "uploads/second.mp4"}]},
+        ]
+        path = self._write("catalog.json", json.dumps(manifest))
+        out = StringIO()
+        call_command("import_catalog", path, "--rate", "5", stdout=out)
+
+        video = Video.objects.get(slug="first-movie")
+        self.assertEqual(sorted(video.genres.values_list("name", flat=True)), ["Action", "Drama"])
+        self.assertEqual(video.video_files.count(), 2)
+        self.assertEqual(Video.objects.count(), 2)
+        self.assertEqual(Genres.objects.count(), 2)
+        ids, rate = mock_enqueue.call_args.args
+        self.assertEqual(set(ids), set(VideoFile.objects.values_list("id", flat=True)))
+        self.assertEqual(rate, 5)
+        self.assertIn("2 videos and 3 video files imported.", out.getvalue())
+
+    @patch("app_videos.management.commands.import_catalog.enqueue_file_checks")
+    def test_import_csv_groups_rows_and_skips_existing(self, mock_enqueue):
+        Video.objects.create(title="Existing", slug="existing")
+        path = self._write(
+            "catalog.csv",
+            "title,slug,genres,language,original_file\n"
+            "Movie,movie,Drama|Comedy,en,uploads/movie_en.mp4\n"
+            "Movie,movie,Drama|Comedy,fr,uploads/movie_fr.mp4\n"
+            "Existing,existing,Drama,en,uploads/existing.mp4\n",
+        )
+        out = StringIO()
+        call_command("import_catalog", path, "--skip-processing", stdout=out)
+
+        video = Video.objects.get(slug="movie")
+        self.assertEqual(sorted(video.video_files.values_list("language", flat=True)), ["en", "fr"])
+        self.assertEqual(Video.objects.get(slug="existing").video_files.count(), 0)
+        mock_enqueue.assert_not_called()
+        self.assertIn("1 videos already exist", out.getvalue())
+
+    def test_unsupported_manifest(self):
+        path = self._write("catalog.txt", "")
+        with self.assertRaises(CommandError):
+            call_command("import_catalog", path, stdout=StringIO())
+
+    def test_rate_below_one_is_rejected(self):
+        path = self._write("catalog.json", json.dumps([{"title": "Movie", "files": []}]))
+        with self.assertRaisesMessage(CommandError, "--rate"):
+            call_command("import_catalog", path, "--rate", "0", stdout=StringIO())
+        self.assertFalse(Video.objects.exists())
+
+    def test_invalid_rows_are_reported_before_writing(self):
+        manifest = [
+            {"title": "Movie", "files": [{"language": "en", "original_file": "uploads/a.mp4"}]},
+            {"title": "Movie", "files": [{"language": "de", "original_file": "uploads/b.mp4"}]},
+            {
+                "title": "Other",
+                "genres": ["Action"],
+                "files": [
+                    {"language": "en", "original_file": "uploads/c.mp4"},
+                    {"language": "en", "original_file": "uploads/d.mp4"},
+                    {"language": "xx", "original_file": "uploads/e.mp4"},
+                ],
+            },
+        ]
+        path = self._write("catalog.json", json.dumps(manifest))
+        with self.assertRaises(CommandError) as ctx:
+            call_command("import_catalog", path, "--skip-processing", stdout=StringIO())
+
+        message = str(ctx.exception)
+        self.assertIn("movie: duplicate slug", message)
+        self.assertIn("other: duplicate language 'en'", message)
+        self.assertIn("other: unknown language 'xx'", message)
+        self.assertFalse(Video.objects.exists())
+        self.assertFalse(Genres.objects.filter(name="Action").exists())
+
+    def test_incomplete_entries_are_reported_before_writing(self):
+        manifest = [
+            {"files": [{"language": "en", "original_file": "uploads/a.mp4"}]},
+            {"title": "No File", "files": [{"language": "en"}]},
+            {
+                "title": "Bad Date",
+                "release_date": "2024-13-01",
+                "files": [{"language": "en", "original_file": "uploads/b.mp4"}],
+            },
+        ]
+        path = self._write("catalog.json", json.dumps(manifest))
+        with self.assertRaises(CommandError) as ctx:
+            call_command("import_catalog", path, "--skip-processing", stdout=StringIO())
+
+        message = str(ctx.exception)
+        self.assertIn("entry 1: missing title", message)
+        self.assertIn("no-file: file without original_file", message)
+        self.assertIn("bad-date: invalid release_date '2024-13-01'", message)
+        self.assertFalse(Video.objects.exists())
+
+    def test_csv_without_file_column_is_reported(self):
+        path = self._write("catalog.csv", "title,language\nMovie,en\n")
+        with self.assertRaisesMessage(CommandError, "movie: file without original_file"):
+            call_command("import_catalog", path, "--skip-processing", stdout=StringIO())
+        self.assertFalse(Video.objects.exists())
+
+    def test_duplicate_csv_language_rows_are_rejected(self):
+        path = self._write(
+            "catalog.csv",
+            "title,slug,language,original_file\n"
+            "Movie,movie,en,uploads/movie_en.mp4\n"
+            "Movie,movie,en,uploads/movie_en_2.mp4\n",
+        )
+        with self.assertRaisesMessage(CommandError, "movie: duplicate language 'en'"):
+            call_command("import_catalog", path, "--skip-processing", stdout=StringIO())
+        self.assertFalse(Video.objects.exists())
@@ -49,6 +49,12 @@ class VideoFileSerializerTest(TestCase):
         url = serializer.get_hls_url(self.vf)
         self.assertTrue(url.endswith(str(self.vf.hls_master_path)))
 
+    def test_get_dash_url(self):
+        serializer = VideoFileSerializer(self.vf, context={"request": self.request})
+        self.assertIsNone(serializer.get_dash_url(self.vf))
+        self.vf.dash_manifest_path = "/media/hls/manifest.mpd"
+        self.assertTrue(serializer.get_dash_url(self.vf).endswith("/media/hls/manifest.mpd"))
+
     def test_get_genres(self):
         serializer = VideoFileSerializer(self.vf, context={"request": self.request})
         genres = serializer.get_genres(self.vf)
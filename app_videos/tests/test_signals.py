@@ -1,25 +1,34 @@
+import logging
 from django.test import TestCase
 from unittest.mock import patch, MagicMock
 from app_videos.models import Video, VideoFile
+from core.utils.queues import get_registered_queue
 from app_videos.signals import (
+    AUDIO_RETRY,
     video_file_post_save,
     check_file_and_start_processing,
     _restart_file_check,
     _is_file_ready,
     _enqueue_video_processing_jobs,
+    enqueue_file_checks,
 )
 
 
 class SignalsTestCase(TestCase):
     def setUp(self):
-        self.print_patcher = patch("builtins.print")
-        self.mock_print = self.print_patcher.start()
+        self.logger_patcher = patch("app_videos.signals.logger.propagate", False)
+        self.logger_patcher.start()
+        self.handler_patcher = patch("app_videos.signals.logger.handlers", [logging.NullHandler()])
+        self.handler_patcher.start()
+        get_registered_queue.cache_clear()
 
     def tearDown(self):
-        self.print_patcher.stop()
+        self.logger_patcher.stop()
+        self.handler_patcher.stop()
+        get_registered_queue.cache_clear()
 
     def test_video_file_post_save_enqueues(self):
-        with patch("app_videos.signals.get_queue") as mock_get_queue:
+        with patch("core.utils.queues.get_queue") as mock_get_queue:
             mock_queue = MagicMock()
             mock_get_queue.return_value = mock_queue
             video = Video.objects.create(title="Test", slug="test-signal")
@@ -28,7 +37,7 @@ class SignalsTestCase(TestCase):
             self.assertTrue(mock_queue.enqueue.called)
 
     def test_check_file_and_start_processing_retries(self):
-        with patch("app_videos.signals.get_queue") as mock_get_queue:
+        with patch("core.utils.queues.get_queue") as mock_get_queue:
             mock_queue = MagicMock()
             mock_get_queue.return_value = mock_queue
             with patch("app_videos.signals.VideoFile.objects.get", side_effect=VideoFile.DoesNotExist):
@@ -37,19 +46,23 @@ class SignalsTestCase(TestCase):
                     self.assertTrue(retry_mock.called)
 
     def test_check_file_and_start_processing_ready(self):
-        with patch("app_videos.signals.get_queue") as mock_get_queue:
+        with patch("core.utils.queues.get_queue") as mock_get_queue:
             mock_queue = MagicMock()
             mock_get_queue.return_value = mock_queue
             video = Video.objects.create(title="Test", slug="test-signal-ready")
             vf = VideoFile.objects.create(video=video, duration=10, original_file="uploads/test.mp4", language="en")
             with patch("app_videos.signals.VideoFile.objects.get", return_value=vf):
                 with patch("app_videos.signals._is_file_ready", return_value=True):
-                    with patch("app_videos.signals._enqueue_video_processing_jobs") as jobs_mock:
+                    with (
+                        patch("app_videos.signals.update_video_fingerprint") as fingerprint_mock,
+                        patch("app_videos.signals._enqueue_video_processing_jobs") as jobs_mock,
+                    ):
                         check_file_and_start_processing(vf.id, 0)
+                        fingerprint_mock.assert_called_once_with(vf)
                         self.assertTrue(jobs_mock.called)
 
     def test_restart_file_check_enqueues(self):
-        with patch("app_videos.signals.get_queue") as mock_get_queue:
+        with patch("core.utils.queues.get_queue") as mock_get_queue:
             mock_queue = MagicMock()
             mock_get_queue.return_value = mock_queue
             _restart_file_check("vid", 1)
@@ -120,12 +133,11 @@ class SignalsTestCase(TestCase):
         file_field.name = "file.mp4"
         file_field.path = "file.mp4"
         with patch("os.path.exists", side_effect=ValueError):
-            with patch("builtins.print") as print_mock:
+            with self.assertLogs("app_videos.signals", "ERROR"):
                 self.assertFalse(_is_file_ready(file_field))
-                print_mock.assert_called()
 
     def test_enqueue_video_processing_jobs(self):
-        with patch("app_videos.signals.get_queue") as mock_get_queue:
+        with patch("core.utils.queues.get_queue") as mock_get_queue:
             mock_queue = MagicMock()
             mock_get_queue.return_value = mock_queue
             instance = MagicMock()
@@ -133,30 +145,77 @@ class SignalsTestCase(TestCase):
             _enqueue_video_processing_jobs(instance)
             self.assertGreaterEqual(mock_queue.enqueue.call_count, 4)
 
+    def test_enqueue_video_processing_jobs_routes_stages(self):
+        with patch("core.utils.queues.get_queue") as mock_get_queue:
+            connection = MagicMock()
+            queues = {name: MagicMock(connection=connection) for name in ("high", "default", "low")}
+            mock_get_queue.side_effect = lambda name, **kwargs: queues[name]
+            instance = MagicMock()
+            instance.id = "vid"
+            with self.settings(RQ_JOB_ROUTES={"thumbnail": "high", "audio": "high", "480p": "default", "720p": "low"}):
+                _enqueue_video_processing_jobs(instance)
+
+            high_tasks = [call.args[0].__name__ for call in queues["high"].enqueue.call_args_list]
+            self.assertEqual(high_tasks, ["generate_thumbnail_and_duration", "generate_hls_audio"])
+            self.assertEqual(queues["low"].enqueue.call_args.args[1:], ("vid", "720p"))
+            default_args = [call.args[1:] for call in queues["default"].enqueue.call_args_list]
+            self.assertEqual(default_args, [("vid",), ("vid", "480p"), ("vid", "1080p")])
+            pipe = connection.pipeline.return_value.__enter__.return_value
+            connection.pipeline.assert_called_once_with(transaction=True)
+            pipe.execute.assert_called_once()
+            for queue in queues.values():
+                for call in queue.enqueue.call_args_list:
+                    self.assertIs(call.kwargs["pipeline"], pipe)
+            retries = {
+                call.args[0].__name__: call.kwargs.get("retry") for call in queues["high"].enqueue.call_args_list
+            }
+            self.assertIs(retries["generate_hls_audio"], AUDIO_RETRY)
+            self.assertIsNone(retries["generate_thumbnail_and_duration"])
+
+    def test_enqueue_video_processing_jobs_submits_nothing_on_error(self):
+        with patch("core.utils.queues.get_queue") as mock_get_queue:
+            mock_queue = MagicMock()
+            mock_queue.enqueue.side_effect = [MagicMock(), MagicMock(), RuntimeError("boom")]
+            mock_get_queue.return_value = mock_queue
+            instance = MagicMock()
+            instance.id = "vid"
+            with self.assertRaises(RuntimeError):
+                _enqueue_video_processing_jobs(instance)
+            pipe = mock_queue.connection.pipeline.return_value.__enter__.return_value
+            pipe.execute.assert_not_called()
+
+    def test_stage_queues_are_shared_handles(self):
+        with patch("core.utils.queues.get_queue") as mock_get_queue:
+            instance = MagicMock()
+            instance.id = "vid"
+            _enqueue_video_processing_jobs(instance)
+            _enqueue_video_processing_jobs(instance)
+            self.assertEqual(mock_get_queue.call_count, len({"high", "default", "low"}))
+
     def test_check_file_and_start_processing_does_not_exist_gives_up(self):
-        with patch("app_videos.signals.get_queue") as mock_get_queue:
+        with patch("core.utils.queues.get_queue") as mock_get_queue:
             mock_queue = MagicMock()
             mock_get_queue.return_value = mock_queue
             with patch("app_videos.signals.VideoFile.objects.get", side_effect=VideoFile.DoesNotExist):
-                with patch("builtins.print") as print_mock:
+                with self.assertLogs("app_videos.signals", "ERROR") as logs:
                     check_file_and_start_processing("fake_id", 10)
-                    print_mock.assert_called_with(
-                        "VideoFile with id fake_id still does not exist after 10 retries. Giving up."
-                    )
+                self.assertIn(
+                    "VideoFile with id fake_id still does not exist after 10 retries. Giving up.", logs.output[0]
+                )
 
     def test_check_file_and_start_processing_file_not_ready_gives_up(self):
-        with patch("app_videos.signals.get_queue") as mock_get_queue:
+        with patch("core.utils.queues.get_queue") as mock_get_queue:
             mock_queue = MagicMock()
             mock_get_queue.return_value = mock_queue
             video = Video.objects.create(title="Test", slug="test-signal-not-ready")
             vf = VideoFile.objects.create(video=video, duration=10, original_file="uploads/test.mp4", language="en")
             with patch("app_videos.signals.VideoFile.objects.get", return_value=vf):
                 with patch("app_videos.signals._is_file_ready", return_value=False):
-                    with patch("builtins.print") as print_mock:
+                    with self.assertLogs("app_videos.signals", "ERROR") as logs:
                         check_file_and_start_processing(vf.id, 10)
-                        print_mock.assert_called_with(
-                            f"File {vf.original_file.name} is still not ready after 10 retries. Giving up."
-                        )
+                    self.assertIn(
+                        f"File {vf.original_file.name} is still not ready after 10 retries. Giving up.", logs.output[0]
+                    )
 
     def test_is_file_ready_true(self):
         import tempfile
@@ -179,7 +238,7 @@ class SignalsTestCase(TestCase):
             os.unlink(tmp.name)
 
     def test_check_file_and_start_processing_file_not_ready_retries(self):
-        with patch("app_videos.signals.get_queue") as mock_get_queue:
+        with patch("core.utils.queues.get_queue") as mock_get_queue:
             mock_queue = MagicMock()
             mock_get_queue.return_value = mock_queue
             video = Video.objects.create(title="Test", slug="test-signal-file-not-ready")
@@ -189,3 +248,21 @@ class SignalsTestCase(TestCase):
                     with patch("app_videos.signals._restart_file_check") as retry_mock:
                         check_file_and_start_processing(vf.id, 2)
                         retry_mock.assert_called_once_with(vf.id, 2)
+
+    def test_enqueue_file_checks_pipelines_and_staggers(self):
+        with patch("core.utils.queues.get_queue") as mock_get_queue:
+            mock_queue = MagicMock()
+            mock_get_queue.return_value = mock_queue
+            pipe = mock_queue.connection.pipeline.return_value.__enter__.return_value
+            enqueue_file_checks(["a", "b", "c"], per_second=2)
+            delays = [call.args[0].total_seconds() for call in mock_queue.enqueue_in.call_args_list]
+            self.assertEqual(delays, [0, 0, 1])
+            for call in mock_queue.enqueue_in.call_args_list:
+                self.assertIs(call.kwargs["pipeline"], pipe)
+            pipe.execute.assert_called_once()
+
+    def test_enqueue_file_checks_rejects_rate_below_one(self):
+        with patch("core.utils.queues.get_queue") as mock_get_queue:
+            with self.assertRaises(ValueError):
+                enqueue_file_checks(["a"], per_second=0)
+            mock_get_queue.assert_not_called()
@@ -1,4 +1,11 @@
+import fcntl
+import logging
 import os
+import tempfile
+import time
+from io import StringIO
+from django.conf import settings
+from django.core.management import call_command
 from django.test import TestCase
 from django.db.models.signals import post_save
 from unittest.mock import patch, MagicMock
@@ -7,7 +14,11 @@ from app_videos.tasks import (
     FFmpegCommandBuilder,
     DirectoryManager,
     FFmpegExecutor,
+    OutputPublisher,
     PlaylistGenerator,
+    AudioProcessingError,
+    RENDITION_LOCK_RETRY_DELAY,
+    generate_hls_audio,
     generate_hls_for_resolution,
     generate_master_playlist,
     generate_master_playlist_waiting,
@@ -15,6 +26,7 @@ from app_videos.tasks import (
     generate_thumbnail_and_duration,
     _generate_thumbnail,
     _get_video_duration,
+    update_video_fingerprint,
 )
 from app_videos.models import Video, VideoFile
 from app_videos.signals import video_file_post_save
@@ -22,12 +34,15 @@ from app_videos.signals import video_file_post_save
 
 class TasksTestCase(TestCase):
     def setUp(self):
-        self.print_patcher = patch("builtins.print")
-        self.mock_print = self.print_patcher.start()
+        self.logger_patcher = patch("app_videos.tasks.logger.propagate", False)
+        self.logger_patcher.start()
+        self.handler_patcher = patch("app_videos.tasks.logger.handlers", [logging.NullHandler()])
+        self.handler_patcher.start()
         post_save.disconnect(video_file_post_save, sender=VideoFile)
 
     def tearDown(self):
-        self.print_patcher.stop()
+        self.logger_patcher.stop()
+        self.handler_patcher.stop()
         post_save.connect(video_file_post_save, sender=VideoFile)
 
     def test_get_video_file_exists(self):
@@ -43,6 +58,26 @@ class TasksTestCase(TestCase):
         cmd = FFmpegCommandBuilder.build_hls_command("in.mp4", "out", "720p", {"res": "1280x720", "bitrate": "2000k"})
         self.assertIn("ffmpeg", cmd[0])
         self.assertIn("-vf", cmd)
+        self.assertIn(os.path.join("out", "720p_%03d.ts"), cmd)
+        # HLS_VIDEO_CODECS (avc1.4D4028) advertises Main profile at level 4.0
+        self.assertEqual(cmd[cmd.index("-profile:v") + 1], "main")
+        self.assertEqual(cmd[cmd.index("-level:v") + 1], "4.0")
+
+    def test_probe_frame_rate_unknown(self):
+        with tempfile.TemporaryDirectory() as video_dir:
+            with open(os.path.join(video_dir, "480p.m3u8"), "w") as f:
+                f.write('#EXTM3U\n#EXT-X-MAP:URI="480p_init.mp4"\n#EXTINF:4.0,\n480p_000.m4s\n#EXT-X-ENDLIST\n')
+            with patch("app_videos.tasks.FFmpegExecutor.execute_with_output", return_value="0/0"):
+                self.assertIsNone(PlaylistGenerator.probe_frame_rate(video_dir, "480p.m3u8"))
+
+    def test_build_hls_command_fmp4(self):
+        cmd = FFmpegCommandBuilder.build_hls_command(
+            "in.mp4", "out", "720p", {"res": "1280x720", "bitrate": "2000k"}, "fmp4"
+        )
+        self.assertEqual(cmd[cmd.index("-hls_segment_type") + 1], "fmp4")
+        self.assertEqual(cmd[cmd.index("-hls_fmp4_init_filename") + 1], "720p_init.mp4")
+        self.assertIn(os.path.join("out", "720p_%03d.m4s"), cmd)
+        self.assertEqual(cmd[-1], os.path.join("out", "720p.m3u8"))
 
     def test_build_preview_command(self):
         cmd = FFmpegCommandBuilder.build_preview_command("in.mp4", "out.mp4")
@@ -93,35 +128,419 @@ class TasksTestCase(TestCase):
             self.assertIsNone(FFmpegExecutor.execute_with_output(["ffprobe"], "err"))
 
     def test_create_master_playlist(self):
-        with patch("builtins.open", MagicMock()), patch("os.path.exists", return_value=True):
-            self.assertTrue(PlaylistGenerator.create_master_playlist("/tmp"))
+        with tempfile.TemporaryDirectory() as output_dir:
+            with open(os.path.join(output_dir, "480p.m3u8"), "w") as f:
+                f.write("#EXTM3U\n#EXTINF:4.0,\n480p_000.ts\n#EXT-X-ENDLIST\n")
+            with open(os.path.join(output_dir, "720p.m3u8"), "w") as f:
+                f.write("#EXTM3U\n#EXTINF:4.0,\n720p_000.ts\n")
+
+            self.assertEqual(PlaylistGenerator.create_master_playlist(output_dir, "de"), [])
+            with open(os.path.join(output_dir, "audio.m3u8"), "w") as f:
+                f.write("#EXTM3U\n#EXTINF:4.0,\naudio_000.ts\n#EXT-X-ENDLIST\n")
+
+            self.assertEqual(PlaylistGenerator.create_master_playlist(output_dir, "de"), ["480p"])
+            with open(os.path.join(output_dir, "master.m3u8")) as f:
+                master = f.read()
+            self.assertIn(
+                '#EXT-X-MEDIA:TYPE=AUDIO,GROUP-ID="audio",NAME="Deutsch",LANGUAGE="de",'
+                'DEFAULT=YES,AUTOSELECT=YES,URI="audio.m3u8"',
+                master,
+            )
+            self.assertIn('#EXT-X-STREAM-INF:BANDWIDTH=928000,RESOLUTION=854x480,AUDIO="audio"\n480p.m3u8', master)
+            self.assertNotIn("720p.m3u8", master)
+
+            with open(os.path.join(output_dir, "720p.m3u8"), "a") as f:
+                f.write("#EXT-X-ENDLIST\n")
+            self.assertEqual(PlaylistGenerator.create_master_playlist(output_dir), ["480p", "720p"])
+            self.assertEqual(
+                sorted(name for name in os.listdir(output_dir) if name.endswith(".tmp")),
+                [],
+            )
+
+    def test_create_master_playlist_writes_dash_manifest_for_fmp4(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            for label in ("480p", "audio"):
+                with open(os.path.join(output_dir, f"{label}.m3u8"), "w") as f:
+                    f.write(
+                        f'#EXTM3U\n#EXT-X-VERSION:7\n#EXT-X-MAP:URI="{label}_init.mp4"\n'
+                        f"#EXTINF:4.000000,\n{label}_000.m4s\n#EXTINF:2.500000,\n{label}_001.m4s\n#EXT-X-ENDLIST\n"
+                    )
+            with (
+                self.settings(HLS_SEGMENT_FORMAT="fmp4", DASH_MANIFEST_ENABLED=True),
+                patch("app_videos.tasks.FFmpegExecutor.execute_with_output", return_value="30000/1001") as probe_mock,
+            ):
+                self.assertEqual(PlaylistGenerator.create_master_playlist(output_dir, "en"), ["480p"])
+            self.assertEqual(probe_mock.call_args.args[0][-1], os.path.join(output_dir, "480p_000.m4s"))
+            with open(os.path.join(output_dir, "manifest.mpd")) as f:
+                manifest = f.read()
+            self.assertIn('<AdaptationSet mimeType="video/mp4" codecs="avc1.4D4028"', manifest)
+            self.assertIn('codecs="avc1.4D4028" width="854" height="480" frameRate="30000/1001"', manifest)
+            self.assertIn('<AdaptationSet mimeType="audio/mp4" codecs="mp4a.40.2"', manifest)
+            self.assertIn('<Representation id="audio" bandwidth="128000" codecs="mp4a.40.2"', manifest)
+            self.assertIn('mediaPresentationDuration="PT6.500S"', manifest)
+            self.assertIn('<Initialization sourceURL="480p_init.mp4"/>', manifest)
+            self.assertIn('<S d="4000"/><S d="2500"/>', manifest)
+            self.assertIn('<SegmentURL media="480p_001.m4s"/>', manifest)
+            self.assertIn('lang="en"', manifest)
+            self.assertIn('<Initialization sourceURL="audio_init.mp4"/>', manifest)
+
+    def test_create_master_playlist_skips_dash_for_mpegts(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            with open(os.path.join(output_dir, "480p.m3u8"), "w") as f:
+                f.write("#EXTM3U\n#EXTINF:4.0,\n480p_000.ts\n#EXT-X-ENDLIST\n")
+            open(os.path.join(output_dir, ".noaudio"), "w").close()
+            with self.settings(HLS_SEGMENT_FORMAT="mpegts", DASH_MANIFEST_ENABLED=True):
+                PlaylistGenerator.create_master_playlist(output_dir)
+            self.assertFalse(os.path.exists(os.path.join(output_dir, "manifest.mpd")))
+
+    def test_create_master_playlist_without_audio_stream(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            with open(os.path.join(output_dir, "480p.m3u8"), "w") as f:
+                f.write("#EXTM3U\n#EXTINF:4.0,\n480p_000.ts\n#EXT-X-ENDLIST\n")
+            open(os.path.join(output_dir, ".noaudio"), "w").close()
+            self.assertEqual(PlaylistGenerator.create_master_playlist(output_dir), ["480p"])
+            with open(os.path.join(output_dir, "master.m3u8")) as f:
+                master = f.read()
+            self.assertNotIn("EXT-X-MEDIA", master)
+            self.assertIn("#EXT-X-STREAM-INF:BANDWIDTH=800000,RESOLUTION=854x480\n", master)
+
+    def test_build_hls_command_has_no_audio(self):
+        cmd = FFmpegCommandBuilder.build_hls_command("in.mp4", "out", "720p", {"res": "1280x720", "bitrate": "2000k"})
+        self.assertIn("-an", cmd)
+        self.assertNotIn("-c:a", cmd)
+
+    def test_build_audio_command(self):
+        cmd = FFmpegCommandBuilder.build_audio_command("in.mp4", "out", "fmp4")
+        self.assertEqual(cmd[cmd.index("-map") + 1], "0:a:0")
+        self.assertIn("-vn", cmd)
+        self.assertEqual(cmd[cmd.index("-hls_fmp4_init_filename") + 1], "audio_init.mp4")
+        self.assertEqual(cmd[-1], os.path.join("out", "audio.m3u8"))
+
+    def _fake_audio_ffmpeg(self, command, error_message):
+        with open(command[-1], "w") as f:
+            f.write("#EXTM3U\n#EXTINF:4.0,\naudio_000.ts\n#EXT-X-ENDLIST\n")
+        return True
+
+    def test_generate_hls_audio(self):
+        mock_vf = MagicMock(
+            id="id",
+            original_file=MagicMock(path="in.mp4"),
+            video=MagicMock(slug="slug"),
+            language="en",
+            video_fingerprint="",
+        )
+        with (
+            tempfile.TemporaryDirectory() as media_root,
+            self.settings(MEDIA_ROOT=media_root),
+            patch("app_videos.tasks.VideoFileHandler.get_video_file", return_value=mock_vf),
+            patch("app_videos.tasks.FFmpegExecutor.execute_with_output", return_value="1"),
+            patch(
+                "app_videos.tasks.FFmpegExecutor.execute_command", side_effect=self._fake_audio_ffmpeg
+            ) as ffmpeg_mock,
+            patch("app_videos.tasks.generate_master_playlist") as master_mock,
+        ):
+            generate_hls_audio("id")
+            generate_hls_audio("id")
+            output_dir = os.path.join(media_root, "hls", "slug", "en")
+            self.assertEqual(PlaylistGenerator.get_audio_state(output_dir), "ready")
+            self.assertEqual(ffmpeg_mock.call_count, 1)
+            self.assertEqual(master_mock.call_count, 2)
+
+    def test_generate_hls_audio_without_audio_stream(self):
+        mock_vf = MagicMock(
+            id="id",
+            original_file=MagicMock(path="in.mp4"),
+            video=MagicMock(slug="slug"),
+            language="en",
+            video_fingerprint="",
+        )
+        with (
+            tempfile.TemporaryDirectory() as media_root,
+            self.settings(MEDIA_ROOT=media_root),
+            patch("app_videos.tasks.VideoFileHandler.get_video_file", return_value=mock_vf),
+            patch("app_videos.tasks.FFmpegExecutor.execute_with_output", return_value=""),
+            patch("app_videos.tasks.FFmpegExecutor.execute_command") as ffmpeg_mock,
+            patch("app_videos.tasks.generate_master_playlist") as master_mock,
+        ):
+            generate_hls_audio("id")
+            output_dir = os.path.join(media_root, "hls", "slug", "en")
+            self.assertEqual(PlaylistGenerator.get_audio_state(output_dir), "none")
+            ffmpeg_mock.assert_not_called()
+            master_mock.assert_called_once_with("id")
+
+    def _run_failing_audio_job(self, job):
+        mock_vf = MagicMock(
+            id="id",
+            original_file=MagicMock(path="in.mp4"),
+            video=MagicMock(slug="slug"),
+            language="en",
+            video_fingerprint="",
+        )
+        with (
+            tempfile.TemporaryDirectory() as media_root,
+            self.settings(MEDIA_ROOT=media_root),
+            patch("app_videos.tasks.VideoFileHandler.get_video_file", return_value=mock_vf),
+            patch("app_videos.tasks.FFmpegExecutor.execute_with_output", return_value=None),
+            patch("app_videos.tasks.get_current_job", return_value=job),
+            patch("app_videos.tasks.generate_master_playlist") as master_mock,
+        ):
+            try:
+                generate_hls_audio("id")
+            finally:
+                state = PlaylistGenerator.get_audio_state(os.path.join(media_root, "hls", "slug", "en"))
+        return state, master_mock
+
+    def test_generate_hls_audio_failure_raises_while_retries_left(self):
+        with self.assertRaises(AudioProcessingError):
+            self._run_failing_audio_job(MagicMock(retries_left=2))
+
+    def test_generate_hls_audio_records_failure_after_last_retry(self):
+        with self.assertLogs("app_videos.tasks", "ERROR"):
+            state, master_mock = self._run_failing_audio_job(MagicMock(retries_left=0))
+        self.assertEqual(state, "failed")
+        master_mock.assert_called_once_with("id")
+
+    def test_create_master_playlist_without_audio_after_failure(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            with open(os.path.join(output_dir, "480p.m3u8"), "w") as f:
+                f.write("#EXTM3U\n#EXTINF:4.0,\n480p_000.ts\n#EXT-X-ENDLIST\n")
+            self.assertEqual(PlaylistGenerator.create_master_playlist(output_dir, "en"), [])
+            open(os.path.join(output_dir, ".audiofailed"), "w").close()
+            self.assertEqual(PlaylistGenerator.create_master_playlist(output_dir, "en"), ["480p"])
+            with open(os.path.join(output_dir, "master.m3u8")) as f:
+                self.assertNotIn("audio.m3u8", f.read())
+
+    def test_create_master_playlist_without_complete_rendition(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            self.assertEqual(PlaylistGenerator.create_master_playlist(output_dir), [])
+            self.assertFalse(os.path.exists(os.path.join(output_dir, "master.m3u8")))
 
     def test_check_playlist_files(self):
-        with patch("os.path.exists", return_value=True):
+        with patch("app_videos.tasks.PlaylistGenerator.is_playlist_complete", return_value=True):
             self.assertTrue(PlaylistGenerator.check_playlist_files("/tmp"))
+        with tempfile.TemporaryDirectory() as output_dir:
+            for label in ("480p", "720p", "1080p"):
+                with open(os.path.join(output_dir, f"{label}.m3u8"), "w") as f:
+                    f.write("#EXTM3U\n")
+            self.assertFalse(PlaylistGenerator.check_playlist_files(output_dir))
+
+    def _fake_ffmpeg(self, command, error_message):
+        staging_dir = os.path.dirname(command[-1])
+        with open(os.path.join(staging_dir, "720p_000.ts"), "wb") as f:
+            f.write(b"segment")
+        with open(command[-1], "w") as f:
+            f.write("#EXTM3U\n#EXTINF:4.0,\n720p_000.ts\n#EXT-X-ENDLIST\n")
+        return True
 
     def test_generate_hls_for_resolution(self):
+        mock_vf = MagicMock(
+            id="id",
+            original_file=MagicMock(path="in.mp4"),
+            video=MagicMock(slug="slug"),
+            language="en",
+            video_fingerprint="",
+        )
         with (
-            patch(
-                "app_videos.tasks.VideoFileHandler.get_video_file",
-                return_value=MagicMock(
-                    original_file=MagicMock(path="in.mp4"), video=MagicMock(slug="slug"), language="en"
-                ),
-            ),
-            patch("app_videos.tasks.DirectoryManager.create_hls_directory", return_value="/tmp"),
-            patch("app_videos.tasks.FFmpegCommandBuilder.build_hls_command", return_value=["ffmpeg"]),
-            patch("app_videos.tasks.FFmpegExecutor.execute_command", return_value=True),
+            tempfile.TemporaryDirectory() as media_root,
+            self.settings(MEDIA_ROOT=media_root),
+            patch("app_videos.tasks.VideoFileHandler.get_video_file", return_value=mock_vf),
+            patch("app_videos.tasks.FFmpegExecutor.execute_command", side_effect=self._fake_ffmpeg) as ffmpeg_mock,
+            patch("app_videos.tasks.generate_master_playlist") as master_mock,
         ):
             generate_hls_for_resolution("id", "720p")
+            master_mock.assert_called_once_with("id")
+            output_dir = os.path.join(media_root, "hls", "slug", "en")
+            self.assertEqual(sorted(os.listdir(output_dir)), [".720p.lock", "720p.m3u8", "720p_000.ts"])
+            self.assertNotIn(output_dir, ffmpeg_mock.call_args.args[0][-1])
+            self.assertEqual(os.listdir(settings.VIDEO_STAGING_ROOT), [])
+
+            generate_hls_for_resolution("id", "720p")
+            self.assertEqual(ffmpeg_mock.call_count, 1)
+            self.assertEqual(master_mock.call_count, 2)
+
+    def test_generate_hls_for_resolution_failure_publishes_nothing(self):
+        mock_vf = MagicMock(
+            id="id",
+            original_file=MagicMock(path="in.mp4"),
+            video=MagicMock(slug="slug"),
+            language="en",
+            video_fingerprint="",
+        )
+        with (
+            tempfile.TemporaryDirectory() as media_root,
+            self.settings(MEDIA_ROOT=media_root),
+            patch("app_videos.tasks.VideoFileHandler.get_video_file", return_value=mock_vf),
+            patch("app_videos.tasks.FFmpegExecutor.execute_command", return_value=False),
+            patch("app_videos.tasks.generate_master_playlist") as master_mock,
+        ):
+            generate_hls_for_resolution("id", "720p")
+            master_mock.assert_not_called()
+            self.assertEqual(os.listdir(os.path.join(media_root, "hls", "slug", "en")), [".720p.lock"])
+            self.assertEqual(os.listdir(settings.VIDEO_STAGING_ROOT), [])
+
+    def test_generate_hls_for_resolution_shares_video_between_languages(self):
+        video = Video.objects.create(title="Shared", slug="shared")
+        vf_en = VideoFile.objects.create(
+            video=video, original_file="uploads/en.mp4", language="en", video_fingerprint="f1"
+        )
+        vf_de = VideoFile.objects.create(
+            video=video, original_file="uploads/de.mp4", language="de", video_fingerprint="f1"
+        )
+        VideoFile.objects.create(video=video, original_file="uploads/fr.mp4", language="fr", video_fingerprint="f2")
+        with (
+            tempfile.TemporaryDirectory() as media_root,
+            self.settings(MEDIA_ROOT=media_root),
+            patch("app_videos.tasks.FFmpegExecutor.execute_command", side_effect=self._fake_ffmpeg) as ffmpeg_mock,
+            patch("app_videos.tasks.generate_master_playlist") as master_mock,
+        ):
+            generate_hls_for_resolution(vf_en.id, "720p")
+            self.assertEqual(sorted(call.args[0] for call in master_mock.call_args_list), sorted([vf_en.id, vf_de.id]))
+            video_dir = os.path.join(media_root, "hls", "shared", "video", "f1")
+            self.assertEqual(sorted(os.listdir(video_dir)), [".720p.lock", "720p.m3u8", "720p_000.ts"])
+
+            generate_hls_for_resolution(vf_de.id, "720p")
+            self.assertEqual(ffmpeg_mock.call_count, 1)
+            self.assertEqual(master_mock.call_args.args, (vf_de.id,))
+
+    def test_sweep_staging_directories_removes_only_stale_dirs(self):
+        stale = DirectoryManager.create_staging_directory("stale")
+        fresh = DirectoryManager.create_staging_directory("fresh")
+        old = time.time() - 7200
+        os.utime(stale, (old, old))
+        try:
+            self.assertEqual(DirectoryManager.sweep_staging_directories(3600), 1)
+            self.assertFalse(os.path.exists(stale))
+            self.assertTrue(os.path.isdir(fresh))
+        finally:
+            OutputPublisher.discard(fresh)
+
+    def test_sweep_staging_command_uses_processing_timeout(self):
+        with patch("app_videos.tasks.DirectoryManager.sweep_staging_directories", return_value=2) as sweep_mock:
+            out = StringIO()
+            call_command("sweep_staging", stdout=out)
+        sweep_mock.assert_called_once_with(settings.RQ_PROCESSING_TIMEOUT)
+        self.assertIn("2 stale staging directories removed.", out.getvalue())
+
+    def _encode_while_locked_elsewhere(self, other_job_succeeds):
+        """Run the 720p job while another language variant holds the rendition lock, then once it is released."""
+        mock_vf = MagicMock(
+            id="id",
+            original_file=MagicMock(path="in.mp4"),
+            video=MagicMock(slug="slug"),
+            language="de",
+            video_fingerprint="f1",
+        )
+        with (
+            tempfile.TemporaryDirectory() as media_root,
+            self.settings(MEDIA_ROOT=media_root),
+            patch("app_videos.tasks.VideoFileHandler.get_video_file", return_value=mock_vf),
+            patch("app_videos.tasks.FFmpegExecutor.execute_command", side_effect=self._fake_ffmpeg) as ffmpeg_mock,
+            patch("app_videos.tasks.generate_master_playlist") as master_mock,
+            patch("app_videos.tasks._get_video_sibling_ids", return_value=["id"]),
+            patch("app_videos.tasks.get_stage_queue") as queue_mock,
+        ):
+            video_dir = DirectoryManager.create_video_directory("slug", "f1")
+            with open(os.path.join(video_dir, ".720p.lock"), "w") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                generate_hls_for_resolution("id", "720p")
+                queue_mock.assert_called_once_with("720p")
+                queue_mock.return_value.enqueue_in.assert_called_once_with(
+                    RENDITION_LOCK_RETRY_DELAY, generate_hls_for_resolution, "id", "720p"
+                )
+                ffmpeg_mock.assert_not_called()
+                master_mock.assert_not_called()
+                if other_job_succeeds:
+                    with open(os.path.join(video_dir, "720p.m3u8"), "w") as f:
+                        f.write("#EXTM3U\n#EXT-X-ENDLIST\n")
+            generate_hls_for_resolution("id", "720p")
+            self.assertEqual(queue_mock.return_value.enqueue_in.call_count, 1)
+            return ffmpeg_mock, master_mock
+
+    def test_generate_hls_for_resolution_skips_encode_done_elsewhere(self):
+        ffmpeg_mock, master_mock = self._encode_while_locked_elsewhere(other_job_succeeds=True)
+        ffmpeg_mock.assert_not_called()
+        master_mock.assert_called_once_with("id")
+
+    def test_generate_hls_for_resolution_encodes_when_other_job_failed(self):
+        ffmpeg_mock, master_mock = self._encode_while_locked_elsewhere(other_job_succeeds=False)
+        ffmpeg_mock.assert_called_once()
+        master_mock.assert_called_once_with("id")
+
+    def test_create_master_playlist_with_shared_video_dir(self):
+        with tempfile.TemporaryDirectory() as media_root:
+            output_dir = os.path.join(media_root, "hls", "slug", "de")
+            video_dir = os.path.join(media_root, "hls", "slug", "video", "f1")
+            os.makedirs(output_dir)
+            os.makedirs(video_dir)
+            with open(os.path.join(video_dir, "480p.m3u8"), "w") as f:
+                f.write('#EXTM3U\n#EXT-X-MAP:URI="480p_init.mp4"\n#EXTINF:4.0,\n480p_000.m4s\n#EXT-X-ENDLIST\n')
+            with open(os.path.join(output_dir, "audio.m3u8"), "w") as f:
+                f.write('#EXTM3U\n#EXT-X-MAP:URI="audio_init.mp4"\n#EXTINF:4.0,\naudio_000.m4s\n#EXT-X-ENDLIST\n')
+
+            with (
+                self.settings(HLS_SEGMENT_FORMAT="fmp4", DASH_MANIFEST_ENABLED=True),
+                patch("app_videos.tasks.FFmpegExecutor.execute_with_output", return_value="25/1"),
+            ):
+                self.assertEqual(PlaylistGenerator.create_master_playlist(output_dir, "de", video_dir), ["480p"])
+            with open(os.path.join(output_dir, "master.m3u8")) as f:
+                master = f.read()
+            self.assertIn('URI="audio.m3u8"', master)
+            self.assertIn("\n../video/f1/480p.m3u8\n", master)
+            with open(os.path.join(output_dir, "manifest.mpd")) as f:
+                manifest = f.read()
+            self.assertIn('<Initialization sourceURL="../video/f1/480p_init.mp4"/>', manifest)
+            self.assertIn('<SegmentURL media="../video/f1/480p_000.m4s"/>', manifest)
+            self.assertIn('frameRate="25"', manifest)
+            self.assertIn('<Initialization sourceURL="audio_init.mp4"/>', manifest)
+
+    def test_update_video_fingerprint(self):
+        video = Video.objects.create(title="Fingerprint", slug="fingerprint")
+        vf = VideoFile.objects.create(video=video, original_file="uploads/in.mp4", language="en")
+        with patch("app_videos.tasks.FFmpegExecutor.execute_with_output", return_value="MD5=abc123") as ffmpeg_mock:
+            self.assertEqual(update_video_fingerprint(vf), "abc123")
+            self.assertEqual(update_video_fingerprint(vf), "abc123")
+        self.assertEqual(ffmpeg_mock.call_count, 1)
+        self.assertIn("md5", ffmpeg_mock.call_args.args[0])
+        vf.refresh_from_db()
+        self.assertEqual(vf.video_fingerprint, "abc123")
+
+    def test_update_video_fingerprint_failure(self):
+        video = Video.objects.create(title="Fingerprint", slug="fingerprint")
+        vf = VideoFile.objects.create(video=video, original_file="uploads/in.mp4", language="en")
+        with patch("app_videos.tasks.FFmpegExecutor.execute_with_output", return_value=None):
+            self.assertEqual(update_video_fingerprint(vf), "")
+        vf.refresh_from_db()
+        self.assertEqual(vf.video_fingerprint, "")
 
     def test_generate_master_playlist(self):
         mock_vf = MagicMock(video=MagicMock(slug="slug"), language="en")
         with (
             patch("app_videos.tasks.VideoFileHandler.get_video_file", return_value=mock_vf),
             patch("app_videos.tasks.DirectoryManager.create_hls_directory", return_value="/tmp"),
-            patch("app_videos.tasks.PlaylistGenerator.create_master_playlist", return_value=True),
+            patch("app_videos.tasks.PlaylistGenerator.create_master_playlist", return_value=["480p"]),
+        ):
+            generate_master_playlist("id")
+            self.assertTrue(mock_vf.is_ready)
+            mock_vf.save.assert_called_once_with(
+                update_fields=["hls_master_path", "dash_manifest_path", "is_ready", "updated_at"]
+            )
+
+    def test_generate_master_playlist_already_published(self):
+        mock_vf = MagicMock(
+            video=MagicMock(slug="slug"),
+            language="en",
+            is_ready=True,
+            hls_master_path="/media/hls/slug/en/master.m3u8",
+            dash_manifest_path=None,
+        )
+        with (
+            patch("app_videos.tasks.VideoFileHandler.get_video_file", return_value=mock_vf),
+            patch("app_videos.tasks.DirectoryManager.create_hls_directory", return_value="/tmp"),
+            patch("app_videos.tasks.PlaylistGenerator.create_master_playlist", return_value=["480p", "720p"]),
+            self.settings(MEDIA_URL="/media/"),
         ):
             generate_master_playlist("id")
+            mock_vf.save.assert_not_called()
 
     def test_generate_master_playlist_waiting(self):
         mock_vf = MagicMock(video=MagicMock(slug="slug"), language="en")
@@ -136,23 +555,46 @@ class TasksTestCase(TestCase):
             master_mock.assert_called()
 
     def test_generate_video_preview(self):
-        mock_vf = MagicMock(original_file=MagicMock(path="in.mp4"), video=MagicMock(slug="slug"), language="en")
+        mock_vf = MagicMock(
+            id="id",
+            original_file=MagicMock(path="in.mp4"),
+            video=MagicMock(slug="slug"),
+            language="en",
+            video_fingerprint="",
+        )
+
+        def fake_ffmpeg(command, error_message):
+            with open(command[-1], "wb") as f:
+                f.write(b"preview")
+            return True
+
         with (
+            tempfile.TemporaryDirectory() as media_root,
+            self.settings(MEDIA_ROOT=media_root),
             patch("app_videos.tasks.VideoFileHandler.get_video_file", return_value=mock_vf),
-            patch("app_videos.tasks.DirectoryManager.create_preview_directory", return_value="/tmp"),
-            patch("app_videos.tasks.FFmpegCommandBuilder.build_preview_command", return_value=["ffmpeg"]),
-            patch("app_videos.tasks.FFmpegExecutor.execute_command", return_value=True),
+            patch("app_videos.tasks.FFmpegExecutor.execute_command", side_effect=fake_ffmpeg) as ffmpeg_mock,
         ):
             generate_video_preview("id")
+            with open(os.path.join(media_root, "previews", "slug", "en", "preview.mp4"), "rb") as f:
+                self.assertEqual(f.read(), b"preview")
+            self.assertEqual(mock_vf.preview_file, "previews/slug/en/preview.mp4")
+            mock_vf.save.assert_called_once_with(update_fields=["preview_file", "updated_at"])
+
+            generate_video_preview("id")
+            self.assertEqual(ffmpeg_mock.call_count, 1)
 
     def test_generate_thumbnail_and_duration(self):
         mock_vf = MagicMock()
         with (
             patch("app_videos.tasks.VideoFileHandler.get_video_file", return_value=mock_vf),
-            patch("app_videos.tasks._generate_thumbnail"),
+            patch("app_videos.tasks._generate_thumbnail") as thumbnail_mock,
             patch("app_videos.tasks._get_video_duration"),
         ):
             generate_thumbnail_and_duration("id")
+            thumbnail_mock.assert_not_called()
+            mock_vf.thumbnail = None
+            generate_thumbnail_and_duration("id")
+            thumbnail_mock.assert_called_once_with(mock_vf)
 
     def test__generate_thumbnail(self):
         mock_vf = MagicMock(original_file=MagicMock(path="in.mp4"), pk="pk", thumbnail=MagicMock())
@@ -183,9 +625,8 @@ class TasksTestCase(TestCase):
 
     def test_generate_hls_for_resolution_unsupported(self):
         with patch("app_videos.tasks.VideoFileHandler.get_video_file", return_value=MagicMock()):
-            with patch("builtins.print") as print_mock:
+            with self.assertLogs("app_videos.tasks", "ERROR"):
                 generate_hls_for_resolution("id", "fake")
-                print_mock.assert_called()
 
     def test_generate_master_playlist_none(self):
         with patch("app_videos.tasks.VideoFileHandler.get_video_file", return_value=None):
@@ -202,10 +643,10 @@ class TasksTestCase(TestCase):
             patch("app_videos.tasks.DirectoryManager.create_hls_directory", return_value="/tmp"),
             patch("app_videos.tasks.PlaylistGenerator.check_playlist_files", return_value=False),
             patch("time.sleep"),
-            patch("builtins.print") as print_mock,
+            self.assertLogs("app_videos.tasks", "ERROR") as logs,
         ):
             generate_master_playlist_waiting("id", retries=1, interval=0)
-            print_mock.assert_called_with("Master playlist could not be created - files are missing.")
+        self.assertIn("Master playlist could not be created - files are missing.", logs.output[-1])
 
     def test_generate_video_preview_none(self):
         with patch("app_videos.tasks.VideoFileHandler.get_video_file", return_value=None):
@@ -220,10 +661,9 @@ class TasksTestCase(TestCase):
         with (
             patch("app_videos.tasks.FFmpegCommandBuilder.build_duration_command", return_value=["ffprobe"]),
             patch("app_videos.tasks.FFmpegExecutor.execute_with_output", return_value="not_a_float"),
-            patch("builtins.print") as print_mock,
+            self.assertLogs("app_videos.tasks", "ERROR"),
         ):
             _get_video_duration(mock_vf)
-            print_mock.assert_called()
 
     def test_os_remove_direct_coverage(self):
         with patch("os.remove") as remove_mock:
@@ -0,0 +1,118 @@
+from datetime import date
+from unittest.mock import patch
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from app_users.models import UserProfiles
+from app_videos.catalog import expire_new_releases
+from app_videos.models import CatalogEntry, Genres, Video, VideoFile
+
+CustomUserModel = get_user_model()
+
+
+class CatalogETagTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUserModel.objects.create_user(username="viewer", email="viewer@example.com", password="pw")
+        self.client.force_authenticate(user=self.user)
+        self.video = Video.objects.create(title="Movie", slug="movie", is_published=True, release_date=date(2024, 1, 1))
+        self.video_file = VideoFile.objects.create(video=self.video, language="en", is_ready=True)
+
+    def assertRevalidated(self, url, params=None):
+        response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+        self.assertFalse(etag.startswith("W/"))
+        with self.assertNumQueries(0):
+            response = self.client.get(url, params or {}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        return etag
+
+    def test_list_detail_home_and_genre_count_return_304(self):
+        for url in (
+            reverse("video_list"),
+            reverse("video_detail", args=[self.video_file.id]),
+            reverse("video_home"),
+            reverse("genre_video_count"),
+        ):
+            with self.subTest(url=url):
+                self.assertRevalidated(url)
+
+    def test_weak_etag_from_compressed_response_matches(self):
+        etag = self.assertRevalidated(reverse("video_list"))
+        response = self.client.get(reverse("video_list"), HTTP_IF_NONE_MATCH=f"W/{etag}")
+        self.assertEqual(response.status_code, 304)
+
+    def test_query_parameters_change_etag(self):
+        url = reverse("video_list")
+        self.assertNotEqual(self.assertRevalidated(url), self.assertRevalidated(url, {"page_size": 5}))
+
+    def test_catalog_change_invalidates_etag(self):
+        url = reverse("video_list")
+        etag = self.assertRevalidated(url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.video.title = "Renamed"
+            self.video.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_unchanged_save_keeps_etag(self):
+        url = reverse("video_list")
+        etag = self.assertRevalidated(url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.video_file.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_end_of_newly_released_window_invalidates_etag(self):
+        self.video.release_date = date.today()
+        with patch("app_videos.catalog.get_registered_queue"), self.captureOnCommitCallbacks(execute=True):
+            self.video.save()
+        params = {"newly_released": "true"}
+        etag = self.assertRevalidated(reverse("video_list"), params)
+        CatalogEntry.objects.update(new_until=timezone.now())
+        expire_new_releases()
+        response = self.client.get(reverse("video_list"), params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 0)
+
+    def test_new_genre_invalidates_genre_count(self):
+        url = reverse("genre_video_count")
+        etag = self.assertRevalidated(url)
+        with self.captureOnCommitCallbacks(execute=True):
+            Genres.objects.create(name="Western")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["western"], 0)
+
+    def test_deleted_video_invalidates_genre_count(self):
+        url = reverse("genre_video_count")
+        self.video.genres.add(Genres.objects.create(name="Action"))
+        etag = self.assertRevalidated(url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.video.delete()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["action"], 0)
+
+    def test_profile_requests_have_no_etag(self):
+        profile = UserProfiles.objects.create(user=self.user, preferred_language="de")
+        response = self.client.get(reverse("video_list"), {"profile": profile.id})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("ETag"))
+
+    def test_unauthenticated_request_is_rejected_before_etag_check(self):
+        etag = self.assertRevalidated(reverse("video_list"))
+        self.client.force_authenticate(user=None)
+        response = self.client.get(reverse("video_list"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 401)
+
+    def test_lost_version_counter_does_not_reuse_etags(self):
+        etag = self.assertRevalidated(reverse("video_list"))
+        cache.clear()
+        response = self.client.get(reverse("video_list"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(int(response["ETag"].strip('"').split("-")[0]), int(etag.strip('"').split("-")[0]))
@@ -0,0 +1,86 @@
+from datetime import date
+from unittest.mock import patch
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from app_users.models import UserProfiles
+from app_videos.models import Genres, Video, VideoFile, VideoProgress
+
+CustomUserModel = get_user_model()
+
+
+class HomeViewTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUserModel.objects.create_user(username="viewer", email="viewer@example.com", password="pw")
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("video_home")
+        self.action = Genres.objects.create(name="Action")
+        self.drama = Genres.objects.create(name="Drama")
+        Genres.objects.create(name="Western")
+        self.files = {}
+        for i, (slug, genres, release_date) in enumerate(
+            [("old", [self.action], date(2023, 1, 1)), ("new", [self.action, self.drama], date(2024, 6, 1))]
+        ):
+            video = Video.objects.create(title=slug, slug=slug, is_published=True, release_date=release_date)
+            video.genres.set(genres)
+            for language in ("en", "de"):
+                self.files[(slug, language)] = VideoFile.objects.create(video=video, language=language, is_ready=True)
+
+    def ids(self, entries):
+        return [entry["id"] for entry in entries]
+
+    def test_rows_per_genre_in_profile_language(self):
+        profile = UserProfiles.objects.create(user=self.user, preferred_language="de")
+        with patch("app_videos.api.views.get_continue_watching", return_value=[]) as continue_mock:
+            response = self.client.get(self.url, {"profile": profile.id, "limit": 1})
+        self.assertEqual(response.status_code, 200)
+        continue_mock.assert_called_once_with(profile.id, 1)
+        new_de = str(self.files[("new", "de")].id)
+        self.assertEqual(
+            [(row["genre"], self.ids(row["results"])) for row in response.data["genres"]],
+            [("Action", [new_de]), ("Drama", [new_de])],
+        )
+        self.assertEqual(self.ids(response.data["newly_released"]), [new_de])
+        self.assertEqual(response.data["continue_watching"], [])
+
+    def test_without_profile_uses_english_and_no_continue_watching(self):
+        response = self.client.get(self.url)
+        action = next(row for row in response.data["genres"] if row["genre"] == "Action")
+        self.assertEqual(
+            self.ids(action["results"]), [str(self.files[("new", "en")].id), str(self.files[("old", "en")].id)]
+        )
+        self.assertEqual(response.data["continue_watching"], [])
+
+    def test_genre_rows_use_one_windowed_query_and_are_cached(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url)
+        windowed = [q["sql"] for q in queries if "PARTITION BY" in q["sql"]]
+        self.assertEqual(len(windowed), 2)
+        self.assertEqual(len(queries), 2)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url)
+        self.assertEqual(len(queries), 0)
+
+    def test_catalog_change_invalidates_cache(self):
+        self.client.get(self.url)
+        video = Video.objects.create(title="latest", slug="latest", is_published=True, release_date=date(2024, 7, 1))
+        with self.captureOnCommitCallbacks(execute=True):
+            latest = VideoFile.objects.create(video=video, language="en", is_ready=True)
+        response = self.client.get(self.url)
+        self.assertEqual(self.ids(response.data["newly_released"])[0], str(latest.id))
+
+    def test_continue_watching_row(self):
+        profile = UserProfiles.objects.create(user=self.user, preferred_language="en")
+        progress = VideoProgress(profile=profile, video_file=self.files[("old", "en")], current_time=10)
+        with patch("app_videos.api.views.get_continue_watching", return_value=[progress]):
+            response = self.client.get(self.url, {"profile": profile.id})
+        self.assertEqual(response.data["continue_watching"][0]["video_file_id"], str(self.files[("old", "en")].id))
+
+    def test_invalid_limit(self):
+        self.assertEqual(self.client.get(self.url, {"limit": "x"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"limit": 0}).status_code, 400)
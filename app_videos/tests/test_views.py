@@ -1,9 +1,13 @@
+from datetime import date
 from rest_framework.test import APITestCase, force_authenticate
+from django.contrib.auth import get_user_model
+from django.db import connection
 from django.urls import reverse
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIRequestFactory
 from rest_framework import status
-from app_videos.models import Genres, Video
+from app_videos.models import Genres, Video, VideoFile
 from app_videos.api.views import GenreVideoCountView
 
 
@@ -14,6 +18,40 @@ class VideoFileListViewTest(APITestCase):
         self.assertIn(response.status_code, [200, 403, 401])
 
 
+class VideoFileDetailViewTest(APITestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="viewer", email="viewer@example.com", password="pw")
+        self.client.force_authenticate(user=user)
+        video = Video.objects.create(title="Movie", slug="movie", is_published=True, release_date=date(2024, 1, 1))
+        video.genres.add(Genres.objects.create(name="Action"), Genres.objects.create(name="Drama"))
+        self.video_file = VideoFile.objects.create(video=video, language="en", is_ready=True)
+        VideoFile.objects.create(video=video, language="de", is_ready=True)
+        VideoFile.objects.create(video=video, language="fr", is_ready=False)
+        self.url = reverse("video_detail", args=[self.video_file.id])
+
+    def get(self, params=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(queries)
+
+    def test_full_representation_prefetches_relations(self):
+        response, query_count = self.get()
+        self.assertEqual(sorted(response.data["genres"]), ["Action", "Drama"])
+        self.assertEqual(set(response.data["available_languages"]), {"en", "de"})
+        self.assertEqual(query_count, 3)
+
+    def test_sparse_fields_skip_relations(self):
+        response, query_count = self.get({"fields": "id,title,hls_url"})
+        self.assertEqual(set(response.data), {"id", "title", "hls_url"})
+        self.assertEqual(query_count, 1)
+
+    def test_selected_relation_is_prefetched_alone(self):
+        response, query_count = self.get({"fields": "id,genres"})
+        self.assertEqual(set(response.data), {"id", "genres"})
+        self.assertEqual(query_count, 2)
+
+
 class GenreVideoCountViewTest(TestCase):
     def setUp(self):
         self.factory = APIRequestFactory()
@@ -0,0 +1,65 @@
+import brotli
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.text import compress_string
+
+COMPRESSIBLE_CONTENT_TYPES = ("application/json", "text/", "application/javascript", "application/xml")
+ENCODING_PREFERENCE = ("br", "gzip")
+
+
+def negotiate_encoding(accept_encoding):
+    """Pick the preferred encoding the client accepts (q > 0) from an Accept-Encoding header, or None."""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name.strip().lower()] = quality
+    for encoding in ENCODING_PREFERENCE:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compress GET responses with brotli or gzip, negotiated via Accept-Encoding.
+    Responses below COMPRESSION_MIN_SIZE bytes or with non-text content types are sent as is.
+    Unsafe methods are never compressed, which keeps token responses out of reach of BREACH-style attacks.
+    """
+
+    def process_response(self, request, response):
+        if request.method not in ("GET", "HEAD") or response.streaming or response.has_header("Content-Encoding"):
+            return response
+        if not response.get("Content-Type", "").startswith(COMPRESSIBLE_CONTENT_TYPES):
+            return response
+        if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = negotiate_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding is None:
+            return response
+
+        if encoding == "br":
+            compressed = brotli.compress(response.content, quality=settings.COMPRESSION_BROTLI_QUALITY)
+        else:
+            compressed = compress_string(response.content, max_random_bytes=100)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response["Content-Length"] = str(len(compressed))
+        response["Content-Encoding"] = encoding
+        # The compressed body is a different byte sequence, so a strong ETag becomes weak (as GZipMiddleware does).
+        etag = response.get("ETag")
+        if etag and not etag.startswith("W/"):
+            response["ETag"] = f"W/{etag}"
+        return response
@@ -53,6 +53,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "core.middleware.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -78,6 +79,9 @@ TEMPLATES = [
                 "django.contrib.messages.context_processors.messages",
                 "django.template.context_processors.static",
             ],
+            "libraries": {
+                "script_name": "core.templatetags.script_name",
+            },
         },
     },
 ]
@@ -88,14 +92,49 @@ WSGI_APPLICATION = "core.wsgi.application"
 # Database
 DATABASES = {"default": env.db(default=f"sqlite:///{BASE_DIR / 'db.sqlite3'}")}
 
+# Connection handling, set per process type: "persistent" keeps one connection per process
+# (CONN_MAX_AGE with health checks), "pool" uses psycopg's native pool (Postgres only), "none" reconnects per request
+DB_CONNECTION_MODE = env("DB_CONNECTION_MODE", default="persistent")
+if DB_CONNECTION_MODE == "pool" and DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+        "min_size": env.int("DB_POOL_MIN_SIZE", default=1),
+        "max_size": env.int("DB_POOL_MAX_SIZE", default=4),
+        "timeout": env.int("DB_POOL_TIMEOUT", default=10),
+    }
+elif DB_CONNECTION_MODE != "none":
+    DATABASES["default"]["CONN_MAX_AGE"] = env.int("DB_CONN_MAX_AGE", default=600)
+    DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+
+# Cache (shared cache via CACHE_URL, e.g. redis://redis:6379/1; "local" is per process)
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+    "local": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "local"},
+}
+
 # User model
 AUTH_USER_MODEL = "app_users.CustomUserModel"
 
+# Cached JWT user resolution (seconds)
+AUTH_USER_CACHE_TIMEOUT = env.int("AUTH_USER_CACHE_TIMEOUT", default=300)
+AUTH_USER_LOCAL_CACHE_TIMEOUT = env.int("AUTH_USER_LOCAL_CACHE_TIMEOUT", default=5)
+
+# Home screen catalog rows per language (seconds); catalog changes invalidate them earlier
+HOME_CACHE_TIMEOUT = env.int("HOME_CACHE_TIMEOUT", default=3600)
+
+# Response compression (brotli preferred over gzip); smaller bodies are not worth the CPU
+COMPRESSION_MIN_SIZE = env.int("COMPRESSION_MIN_SIZE", default=1024)
+COMPRESSION_BROTLI_QUALITY = env.int("COMPRESSION_BROTLI_QUALITY", default=5)
+
 # REST Framework settings for JWT
 REST_FRAMEWORK = {
-    "DEFAULT_AUTHENTICATION_CLASSES": ("rest_framework_simplejwt.authentication.JWTAuthentication",),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("app_users.authentication.CachedJWTAuthentication",),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "EXCEPTION_HANDLER": "core.utils.exception_handler.custom_exception_handler",
+    "DEFAULT_RENDERER_CLASSES": (
+        "core.utils.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
     "DEFAULT_FILTER_BACKENDS": (
         "django_filters.rest_framework.DjangoFilterBackend",
         "rest_framework.filters.SearchFilter",
@@ -151,6 +190,9 @@ USE_TZ = True
 # Password reset token timeout in hours
 PASSWORD_RESET_TIMEOUT_HOURS = 24
 
+# Email verification token timeout in hours
+EMAIL_VERIFICATION_TIMEOUT_HOURS = 72
+
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/4.2/howto/static-files/
 FORCE_SCRIPT_NAME = env("FORCE_SCRIPT_NAME", default=None)
@@ -166,6 +208,12 @@ STATIC_ROOT = env("STATIC_ROOT", default=BASE_DIR / "staticfiles")
 
 MEDIA_URL = env("MEDIA_URL", default="/media/")
 MEDIA_ROOT = env("MEDIA_ROOT", default=BASE_DIR / "media")
+# FFmpeg output is staged here and renamed into MEDIA_ROOT when complete. Keep it outside the served
+# media tree, but on the same filesystem (and mount) as MEDIA_ROOT so the renames stay atomic.
+VIDEO_STAGING_ROOT = env("VIDEO_STAGING_ROOT", default=BASE_DIR / "staging")
+
+# Tests write uploads, previews, thumbnails and staged encodes into a temporary directory
+TEST_RUNNER = "core.utils.test_runner.TempMediaRootTestRunner"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -199,6 +247,38 @@ RQ_QUEUES = {
     },
 }
 
+# Jobs run in the worker process (no fork per job), so workers keep their database connections between jobs
+RQ = {"WORKER_CLASS": "core.utils.workers.ConnectionReusingWorker"}
+
+# Queue per job stage; override with e.g. RQ_JOB_ROUTES='{"1080p": "default"}'.
+# Verification and password-reset mail must not share a queue with the encodes, which run for hours.
+RQ_JOB_ROUTES = {
+    "email": "high",
+    "probe": "high",
+    "thumbnail": "high",
+    "audio": "high",
+    "release": "high",
+    "480p": "default",
+    "720p": "low",
+    "1080p": "low",
+    "preview": "low",
+    **env.json("RQ_JOB_ROUTES", default={}),
+}
+RQ_PROCESSING_TIMEOUT = env.int("RQ_PROCESSING_TIMEOUT", default=21600)  # 6 hours
+
+# Video output: "mpegts" (.ts segments) or "fmp4" (CMAF segments with an init file)
+HLS_SEGMENT_FORMAT = env("HLS_SEGMENT_FORMAT", default="mpegts")
+# Also write a DASH manifest over the same fMP4 segments (requires HLS_SEGMENT_FORMAT=fmp4)
+DASH_MANIFEST_ENABLED = env.bool("DASH_MANIFEST_ENABLED", default=False)
+
+# Video processing jobs log to the worker's console (errors also reach Sentry)
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"class": "logging.StreamHandler"}},
+    "loggers": {"app_videos": {"handlers": ["console"], "level": env("VIDEO_LOG_LEVEL", default="INFO")}},
+}
+
 # Https settings
 if not DEBUG:
     SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
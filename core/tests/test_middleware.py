@@ -0,0 +1,64 @@
+import gzip
+import brotli
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from core.middleware import CompressionMiddleware, negotiate_encoding
+
+PAYLOAD = b'{"results": [' + b'{"title": "Title", "genres": ["Action"]},' * 100 + b"{}]}"
+
+
+@override_settings(COMPRESSION_MIN_SIZE=1024, COMPRESSION_BROTLI_QUALITY=5)
+class CompressionMiddlewareTest(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def process(self, method="get", content=PAYLOAD, content_type="application/json", **headers):
+        request = getattr(self.factory, method)("/api/videos/", headers=headers)
+        response = HttpResponse(content, content_type=content_type)
+        response["ETag"] = '"v1"'
+        return CompressionMiddleware(lambda r: response)(request)
+
+    def test_negotiate_prefers_brotli(self):
+        self.assertEqual(negotiate_encoding("gzip, deflate, br"), "br")
+        self.assertEqual(negotiate_encoding("gzip, br;q=0"), "gzip")
+        self.assertEqual(negotiate_encoding("*"), "br")
+        self.assertEqual(negotiate_encoding("identity"), None)
+        self.assertEqual(negotiate_encoding(""), None)
+
+    def test_brotli_response(self):
+        response = self.process(accept_encoding="gzip, br")
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(brotli.decompress(response.content), PAYLOAD)
+        self.assertEqual(response["Content-Length"], str(len(response.content)))
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertEqual(response["ETag"], 'W/"v1"')
+
+    def test_gzip_response(self):
+        response = self.process(accept_encoding="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), PAYLOAD)
+
+    def test_small_response_is_not_compressed(self):
+        response = self.process(content=b'{"count": 0}', accept_encoding="br")
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertFalse(response.has_header("Vary"))
+
+    def test_unsafe_method_is_not_compressed(self):
+        response = self.process(method="post", accept_encoding="br")
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response.content, PAYLOAD)
+
+    def test_binary_content_type_is_not_compressed(self):
+        response = self.process(content_type="image/jpeg", accept_encoding="br")
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_without_accept_encoding_varies_but_stays_identity(self):
+        response = self.process()
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertEqual(response["ETag"], '"v1"')
+
+    def test_streaming_response_is_untouched(self):
+        request = self.factory.get("/", headers={"accept_encoding": "br"})
+        response = CompressionMiddleware(lambda r: StreamingHttpResponse(iter([PAYLOAD])))(request)
+        self.assertFalse(response.has_header("Content-Encoding"))
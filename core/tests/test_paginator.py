@@ -0,0 +1,37 @@
+from unittest.mock import patch
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from core.utils.paginator import EstimatedCountPaginator
+
+CustomUserModel = get_user_model()
+
+
+class EstimatedCountPaginatorTest(TestCase):
+    def setUp(self):
+        for i in range(5):
+            CustomUserModel.objects.create(username=f"user{i}", email=f"user{i}@example.com")
+
+    def test_exact_count_below_limit(self):
+        paginator = EstimatedCountPaginator(CustomUserModel.objects.all(), 2)
+        self.assertEqual(paginator.count, 5)
+        self.assertEqual(paginator.num_pages, 3)
+
+    def test_count_stops_at_limit(self):
+        with patch.object(EstimatedCountPaginator, "count_limit", 3):
+            paginator = EstimatedCountPaginator(CustomUserModel.objects.all(), 2)
+            self.assertEqual(paginator.count, 4)
+
+    def test_unfiltered_uses_table_estimate(self):
+        with patch.object(EstimatedCountPaginator, "_estimate_table_rows", return_value=2000000):
+            paginator = EstimatedCountPaginator(CustomUserModel.objects.all(), 100)
+            self.assertEqual(paginator.count, 2000000)
+
+    def test_filtered_ignores_table_estimate(self):
+        with patch.object(EstimatedCountPaginator, "_estimate_table_rows", return_value=2000000) as mock_estimate:
+            paginator = EstimatedCountPaginator(CustomUserModel.objects.filter(username="user1"), 100)
+            self.assertEqual(paginator.count, 1)
+        mock_estimate.assert_not_called()
+
+    def test_no_estimate_outside_postgres(self):
+        paginator = EstimatedCountPaginator(CustomUserModel.objects.all(), 2)
+        self.assertIsNone(paginator._estimate_table_rows(CustomUserModel.objects.all()))
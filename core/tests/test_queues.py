@@ -0,0 +1,65 @@
+from unittest.mock import MagicMock, patch
+import yaml
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase
+from core.utils.queues import enqueue_job_graph, get_registered_queue, get_stage_queue_name
+from core.utils.redis_client import get_redis_connection
+
+
+class QueueRegistryTest(TestCase):
+    def setUp(self):
+        get_registered_queue.cache_clear()
+
+    def tearDown(self):
+        get_registered_queue.cache_clear()
+
+    def test_aliases_on_same_url_share_one_client(self):
+        self.assertIs(get_redis_connection("default"), get_redis_connection("low"))
+        self.assertIs(get_redis_connection("default"), get_redis_connection("high"))
+
+    def test_registered_queue_is_created_once(self):
+        with patch("core.utils.queues.get_queue") as mock_get_queue:
+            first = get_registered_queue("low", 60)
+            second = get_registered_queue("low", 60)
+        self.assertIs(first, second)
+        mock_get_queue.assert_called_once_with("low", default_timeout=60, connection=get_redis_connection("low"))
+
+    def test_enqueue_job_graph_uses_one_transaction(self):
+        connection = MagicMock()
+        high, low = MagicMock(connection=connection), MagicMock(connection=connection)
+        func = MagicMock()
+        enqueue_job_graph([(high, func, "a"), (low, func, "a", "720p")])
+        pipe = connection.pipeline.return_value.__enter__.return_value
+        connection.pipeline.assert_called_once_with(transaction=True)
+        high.enqueue.assert_called_once_with(func, "a", pipeline=pipe)
+        low.enqueue.assert_called_once_with(func, "a", "720p", pipeline=pipe)
+        pipe.execute.assert_called_once()
+
+    def test_enqueue_job_graph_rejects_mixed_connections(self):
+        func = MagicMock()
+        with self.assertRaises(ValueError):
+            enqueue_job_graph([(MagicMock(), func), (MagicMock(), func)])
+
+
+class WorkerSchedulerTest(SimpleTestCase):
+    """Jobs scheduled with enqueue_in/enqueue_at only run if a worker on their queue runs the scheduler."""
+
+    def worker_commands(self, compose_file):
+        with open(settings.BASE_DIR / compose_file) as f:
+            services = yaml.safe_load(f)["services"]
+        commands = [service.get("command", "").split() for service in services.values()]
+        return [command for command in commands if "rqworker" in command]
+
+    def test_every_queue_has_a_scheduler(self):
+        for compose_file in ("docker-compose.yml", "docker-compose.prod.yml"):
+            with self.subTest(compose_file=compose_file):
+                scheduled_queues = set()
+                for command in self.worker_commands(compose_file):
+                    self.assertIn("--with-scheduler", command, " ".join(command))
+                    queues = command[command.index("rqworker") + 1 :]
+                    scheduled_queues.update(name for name in queues if not name.startswith("-"))
+                self.assertEqual(scheduled_queues, set(settings.RQ_QUEUES))
+
+    def test_mail_is_not_queued_behind_encodes(self):
+        encode_queues = {get_stage_queue_name(stage) for stage in ("480p", "720p", "1080p", "preview")}
+        self.assertNotIn(get_stage_queue_name("email"), encode_queues)
@@ -0,0 +1,37 @@
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from core.utils.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTest(SimpleTestCase):
+    def setUp(self):
+        self.data = {
+            "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "last_watched": datetime(2024, 6, 1, 12, 30, 15, 250000, tzinfo=timezone.utc),
+            "title": "Amélie\u2028",
+            "price": Decimal("1.50"),
+            "detail": gettext_lazy("Not found."),
+            "results": [{"duration": 5400.0, "is_ready": True, "dash_url": None}],
+        }
+
+    def test_output_matches_json_renderer(self):
+        self.assertEqual(ORJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    def test_none_renders_empty(self):
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+    def test_indent_from_media_type(self):
+        content = ORJSONRenderer().render({"a": 1}, "application/json; indent=4")
+        self.assertEqual(content, b'{\n  "a": 1\n}')
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command("benchmark_api_rendering", "--page-sizes", "2", "--rounds", "1", stdout=out)
+        self.assertIn("ORJSONRenderer", out.getvalue())
+        self.assertIn("B br", out.getvalue())
@@ -0,0 +1,57 @@
+from django.test import SimpleTestCase
+from rest_framework import serializers
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from core.utils.serializers import DynamicFieldsMixin, get_requested_fields
+
+
+class ChildSerializer(DynamicFieldsMixin, serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    stats = serializers.SerializerMethodField()
+
+    def get_stats(self, obj):
+        obj["stats_calls"].append(obj["id"])
+        return {"views": 1}
+
+
+class ParentSerializer(DynamicFieldsMixin, serializers.Serializer):
+    id = serializers.IntegerField()
+    email = serializers.CharField()
+    children = ChildSerializer(many=True)
+
+
+class DynamicFieldsMixinTest(SimpleTestCase):
+    def setUp(self):
+        self.calls = []
+        self.instance = {
+            "id": 1,
+            "email": "parent@example.com",
+            "children": [{"id": 2, "name": "child", "stats_calls": self.calls}],
+        }
+
+    def serialize(self, params):
+        request = Request(APIRequestFactory().get("/", params))
+        return ParentSerializer(self.instance, context={"request": request}).data
+
+    def test_all_fields_without_parameters(self):
+        data = self.serialize({})
+        self.assertEqual(set(data), {"id", "email", "children"})
+        self.assertEqual(set(data["children"][0]), {"id", "name", "stats"})
+
+    def test_fields_selects_top_level_fields(self):
+        data = self.serialize({"fields": "id, email"})
+        self.assertEqual(dict(data), {"id": 1, "email": "parent@example.com"})
+
+    def test_dotted_fields_select_nested_fields_and_skip_method_fields(self):
+        data = self.serialize({"fields": "id,children.name"})
+        self.assertEqual(data["children"], [{"name": "child"}])
+        self.assertEqual(self.calls, [])
+
+    def test_selected_method_field_runs(self):
+        data = self.serialize({"fields": "children.id,children.stats"})
+        self.assertEqual(data["children"], [{"id": 2, "stats": {"views": 1}}])
+        self.assertEqual(self.calls, [2])
+
+    def test_without_request_returns_all(self):
+        self.assertIsNone(get_requested_fields(None))
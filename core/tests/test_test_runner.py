@@ -0,0 +1,14 @@
+from pathlib import Path
+from django.conf import settings
+from django.test import SimpleTestCase
+
+
+class TempMediaRootTest(SimpleTestCase):
+    def test_media_root_is_outside_the_project(self):
+        self.assertNotEqual(Path(settings.MEDIA_ROOT).resolve(), (settings.BASE_DIR / "media").resolve())
+        self.assertIn("videoflix-test-media-", str(settings.MEDIA_ROOT))
+
+    def test_staging_root_is_temporary_and_outside_media(self):
+        staging_root = Path(settings.VIDEO_STAGING_ROOT)
+        self.assertEqual(staging_root.parent, Path(settings.MEDIA_ROOT).parent)
+        self.assertFalse(staging_root.is_relative_to(settings.MEDIA_ROOT))
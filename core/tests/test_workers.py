@@ -0,0 +1,20 @@
+from unittest.mock import MagicMock, patch
+from django.test import SimpleTestCase
+from rq import SimpleWorker
+from core.utils.workers import ConnectionReusingWorker
+from django_rq.workers import get_worker_class
+
+
+class ConnectionReusingWorkerTest(SimpleTestCase):
+    def test_configured_worker_class(self):
+        self.assertIs(get_worker_class(), ConnectionReusingWorker)
+
+    def test_connections_are_checked_around_each_job(self):
+        worker = ConnectionReusingWorker.__new__(ConnectionReusingWorker)
+        with (
+            patch("core.utils.workers.close_old_connections") as close_mock,
+            patch.object(SimpleWorker, "perform_job", side_effect=lambda job, queue: close_mock.call_count) as perform,
+        ):
+            self.assertEqual(worker.perform_job(MagicMock(), MagicMock()), 1)
+        perform.assert_called_once()
+        self.assertEqual(close_mock.call_count, 2)
@@ -0,0 +1,37 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for large admin changelists that avoids exact COUNT(*) scans.
+    Unfiltered Postgres tables use the planner's reltuples estimate; otherwise
+    counting stops at count_limit rows.
+    """
+
+    count_limit = 10000
+
+    @cached_property
+    def count(self):
+        """Estimated or bounded number of objects."""
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = self._estimate_table_rows(queryset)
+            if estimate is not None and estimate > self.count_limit:
+                return estimate
+        return queryset.order_by()[: self.count_limit + 1].count()
+
+    def _estimate_table_rows(self, queryset):
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [queryset.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 for tables that were never vacuumed or analyzed.
+        if not row or row[0] < 0:
+            return None
+        return row[0]
@@ -0,0 +1,48 @@
+from functools import lru_cache
+from django.conf import settings
+from django_rq import get_queue
+from core.utils.redis_client import get_redis_connection
+
+
+def get_stage_queue_name(stage):
+    """Return the RQ queue name a processing stage is routed to."""
+    return settings.RQ_JOB_ROUTES.get(stage, "default")
+
+
+def get_routed_queue_names():
+    """Return every queue name processing stages can be routed to."""
+    return sorted(set(settings.RQ_JOB_ROUTES.values()) | {"default"})
+
+
+@lru_cache(maxsize=None)
+def get_registered_queue(name, default_timeout=None):
+    """
+    Returns the process-wide handle for an RQ queue.
+    Handles are created once and share the Redis connection pool of their URL.
+    """
+    return get_queue(name, default_timeout=default_timeout, connection=get_redis_connection(name))
+
+
+def get_stage_queue(stage):
+    """Return the queue handle for a processing stage with the long processing timeout."""
+    return get_registered_queue(get_stage_queue_name(stage), settings.RQ_PROCESSING_TIMEOUT)
+
+
+def enqueue_job_graph(jobs, retries=None):
+    """
+    Enqueue (queue, func, *args) jobs in one MULTI/EXEC round trip: either all jobs are submitted or none.
+    The queues must share one Redis connection, which registered queues on the same URL do.
+    `retries` maps job functions to the rq Retry policy of their jobs.
+    """
+    jobs = list(jobs)
+    retries = retries or {}
+    connection = jobs[0][0].connection
+    if any(queue.connection is not connection for queue, *_ in jobs):
+        raise ValueError("All queues of a job graph must share one Redis connection.")
+    with connection.pipeline(transaction=True) as pipe:
+        enqueued = [
+            queue.enqueue(func, *args, pipeline=pipe, **({"retry": retries[func]} if func in retries else {}))
+            for queue, func, *args in jobs
+        ]
+        pipe.execute()
+    return enqueued
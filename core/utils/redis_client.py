@@ -0,0 +1,16 @@
+from functools import lru_cache
+import redis
+from django.conf import settings
+
+
+def get_redis_connection(alias="default"):
+    """
+    Returns a process-wide Redis client for an RQ queue alias.
+    Aliases on the same URL share one client and its connection pool.
+    """
+    return _get_client(settings.RQ_QUEUES[alias]["URL"])
+
+
+@lru_cache(maxsize=None)
+def _get_client(url):
+    return redis.Redis.from_url(url, socket_connect_timeout=2)
@@ -0,0 +1,60 @@
+from django.utils.functional import cached_property
+
+
+def parse_field_list(value):
+    """Split a comma separated query parameter into a set of names."""
+    return {name.strip() for name in (value or "").split(",") if name.strip()}
+
+
+def get_requested_fields(request, prefix=""):
+    """
+    Field names requested for a serializer at `prefix` (dotted path from the root), or None for all fields.
+    `?fields=` selects fields, `profiles.id` selects inside a nested serializer. Input fields are never affected.
+    """
+    if request is None:
+        return None
+    params = getattr(request, "query_params", request.GET)
+    return _scoped_names(params.get("fields"), prefix) or None
+
+
+def _scoped_names(value, prefix):
+    names = parse_field_list(value)
+    if prefix:
+        names = {name[len(prefix) + 1 :] for name in names if name.startswith(f"{prefix}.")}
+    return {name.split(".")[0] for name in names if name}
+
+
+class DynamicFieldsMixin:
+    """
+    Serializer mixin for sparse fieldsets. Fields that are not requested are skipped when
+    serializing, so their method fields and the queries behind them never run.
+    """
+
+    @cached_property
+    def requested_fields(self):
+        """Names of the fields to serialize, or None for all of them."""
+        return get_requested_fields(self.context.get("request"), ".".join(self._field_path()))
+
+    @property
+    def _readable_fields(self):
+        requested = self.requested_fields
+        for field in super()._readable_fields:
+            if requested is None or field.field_name in requested:
+                yield field
+
+    def _field_path(self):
+        path, field = [], self
+        while field.parent is not None:
+            if field.field_name:
+                path.insert(0, field.field_name)
+            field = field.parent
+        return path
+
+    @classmethod
+    def prefetch_for_request(cls, queryset, request):
+        """Apply Meta.field_prefetches only for the fields the request will serialize."""
+        requested = get_requested_fields(request)
+        for name, lookups in getattr(cls.Meta, "field_prefetches", {}).items():
+            if requested is None or name in requested:
+                queryset = queryset.prefetch_related(*lookups)
+        return queryset
@@ -0,0 +1,23 @@
+import os
+import shutil
+import tempfile
+from django.test import override_settings
+from django.test.runner import DiscoverRunner
+
+
+class TempMediaRootTestRunner(DiscoverRunner):
+    """Test runner that points MEDIA_ROOT and VIDEO_STAGING_ROOT into a temporary directory, removed after the run."""
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self.data_root = tempfile.mkdtemp(prefix="videoflix-test-media-")
+        self.media_override = override_settings(
+            MEDIA_ROOT=os.path.join(self.data_root, "media"),
+            VIDEO_STAGING_ROOT=os.path.join(self.data_root, "staging"),
+        )
+        self.media_override.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self.media_override.disable()
+        shutil.rmtree(self.data_root, ignore_errors=True)
+        super().teardown_test_environment(**kwargs)
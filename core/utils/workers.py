@@ -0,0 +1,17 @@
+from django.db import close_old_connections
+from rq import SimpleWorker
+
+
+class ConnectionReusingWorker(SimpleWorker):
+    """
+    RQ worker that runs jobs in the worker process instead of a fork per job, so database
+    connections outlive a job. As Django does around requests, connections past CONN_MAX_AGE
+    or in a broken state are closed before and after each job, and health checks re-armed.
+    """
+
+    def perform_job(self, job, queue):
+        close_old_connections()
+        try:
+            return super().perform_job(job, queue)
+        finally:
+            close_old_connections()